@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark the exam markdown tokenizer on growing exam papers.
+
+Generates papers of increasing size from a mix of headings, questions with
+answer options and blanks, lists, tables, code blocks and quotes, then times
+tokenizing them (exam_markdown.parse), rendering the HTML body and, when
+reportlab is installed, building the PDF flowables. Time per line should stay
+flat as papers grow; the benchmark exits with status 1 if the largest paper
+costs more than `max_ratio` times as much per line as the smallest.
+
+Usage:
+    python3 benchmarks/bench_exam_markdown.py [max_questions] [max_ratio]
+"""
+
+import gc
+import sys
+import time
+import importlib.util
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "src" / "learn_faster" / "templates" / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import exam_markdown  # noqa: E402
+
+QUESTION = """### Question {n}
+
+**Q{n}.** Which statement about *concept_{n}* and `value < {n}` is correct? **[2 marks]**
+A) The first option, with **bold** and _emphasis_
+B) The second option with a [reference](https://example.com/{n})
+C) The third option
+D) None of the above
+
+Answer: ____________________
+
+| Term | Meaning |
+|:-----|--------:|
+| a{n} | **b** |
+| c \\| d | e |
+
+```python
+def f_{n}(x):
+    return x * {n}
+```
+
+1. Show your working
+2. State the result
+   - with units
+   - [ ] checked
+
+> Hint: re-read section {n}
+
+---
+"""
+
+
+def exam_paper(questions: int) -> str:
+    """Markdown for an exam with the given number of questions."""
+    parts = ["# Practice Exam\n\n## Section A\n\n"]
+    parts.extend(QUESTION.format(n=n) for n in range(1, questions + 1))
+    return "".join(parts)
+
+
+def best_of(runs: int, func) -> float:
+    """
+    Fastest of several runs, in seconds.
+
+    The cyclic garbage collector is paused while timing: its passes over the
+    growing heap of parsed nodes would otherwise hide the tokenizer's own cost.
+    """
+    best = float("inf")
+    for _ in range(runs):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best
+
+
+def main() -> None:
+    max_questions = int(sys.argv[1]) if len(sys.argv) > 1 else 4000
+    max_ratio = float(sys.argv[2]) if len(sys.argv) > 2 else 2.0
+
+    flowables = None
+    if importlib.util.find_spec("reportlab") is not None:
+        import generate_exam_pdf
+        flowables = generate_exam_pdf.pdf_flowables
+
+    sizes = []
+    questions = max(1, max_questions // 16)
+    while questions <= max_questions:
+        sizes.append(questions)
+        questions *= 2
+
+    print(f"{'questions':>10} {'lines':>8} {'parse ms':>10} {'us/line':>8} {'html ms':>10} {'pdf ms':>10}")
+    per_line = []
+    for questions in sizes:
+        text = exam_paper(questions)
+        lines = text.count("\n")
+        blocks = exam_markdown.parse(text)
+        runs = 3 if questions < max_questions else 1
+
+        parse_s = best_of(runs, lambda: exam_markdown.parse(text))
+        html_s = best_of(runs, lambda: "".join(exam_markdown.html_chunks(blocks)))
+        pdf = f"{best_of(runs, lambda: flowables(blocks)) * 1000:10.1f}" if flowables else f"{'n/a':>10}"
+        per_line.append(parse_s / lines)
+        print(f"{questions:>10} {lines:>8} {parse_s * 1000:10.1f} {parse_s / lines * 1e6:8.2f} "
+              f"{html_s * 1000:10.1f} {pdf}")
+
+    ratio = per_line[-1] / per_line[0]
+    verdict = "ok" if ratio <= max_ratio else "SUPERLINEAR"
+    print(f"\nper-line cost, largest vs smallest paper: {ratio:.2f}x (max {max_ratio}x): {verdict}")
+    sys.exit(0 if ratio <= max_ratio else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark learn-faster CLI startup latency.
+
+Runs `learn-faster version` and `learn-faster --help` in fresh interpreters
+and compares the median wall-clock time with a bare `python -c pass`, so the
+overhead the CLI adds on top of interpreter startup is visible. Also reports
+which heavy modules (e.g. inquirer) were loaded by the version command; none
+should be.
+
+Exits with status 1 when the CLI overhead exceeds the budget, so it can guard
+against regressions in scripts.
+
+Usage:
+    python3 benchmarks/bench_startup.py [runs] [budget_ms]
+"""
+
+import os
+import sys
+import time
+import statistics
+import subprocess
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+# Modules only `learn-faster init` needs; loading them elsewhere is a regression
+DEFERRED_MODULES = ("inquirer", "shutil", "platform")
+
+
+def median_ms(args: list, runs: int) -> float:
+    """Median wall-clock milliseconds of running `python args` in a fresh interpreter."""
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + args, env=env, stdout=subprocess.DEVNULL, check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def loaded_deferred_modules() -> list:
+    """Deferred modules that are imported by `learn-faster version`."""
+    code = ("import sys; sys.argv = ['learn-faster', 'version']; from learn_faster.cli.main import main; main(); "
+            f"print(' '.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules), file=sys.stderr)")
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+    result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    return result.stderr.split()
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    budget_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 50.0
+
+    baseline = median_ms(["-c", "pass"], runs)
+    commands = {
+        "version": ["-m", "learn_faster.cli.main", "version"],
+        "--help": ["-m", "learn_faster.cli.main", "--help"],
+    }
+
+    print(f"{'command':<12} {'median':>10} {'overhead':>10}   (ms, {runs} runs)")
+    print(f"{'python':<12} {baseline:>10.1f} {'':>10}")
+    worst = 0.0
+    for name, args in commands.items():
+        ms = median_ms(args, runs)
+        worst = max(worst, ms - baseline)
+        print(f"{name:<12} {ms:>10.1f} {ms - baseline:>10.1f}")
+
+    loaded = loaded_deferred_modules()
+    print(f"\ndeferred modules loaded by 'version': {', '.join(loaded) if loaded else 'none'}")
+    ok = worst <= budget_ms and not loaded
+    print(f"startup overhead {worst:.1f} ms (budget {budget_ms:.0f} ms): {'ok' if ok else 'REGRESSION'}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
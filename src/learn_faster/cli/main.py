@@ -4,15 +4,18 @@ Learn FASTER CLI - One-time installer for Claude Code learning system.
 
 Usage:
     uvx learn-faster init
+    uvx learn-faster provision <paths...>
+
+Only the standard library modules needed by every command are imported at
+module load. inquirer and the other modules used by `init` are imported
+inside init_project, so `version`, `--help` and launching the coach start
+quickly; `learn-faster --profile-startup` reports the import times.
 """
 
+import os
 import sys
-import shutil
-import platform
-import inquirer
 import json
 from pathlib import Path
-from typing import Dict, Any
 
 
 # ANSI color codes
@@ -32,6 +35,27 @@ class Colors:
     GRAY = "\033[90m"
 
 
+MODE_NAMES = {
+    "balanced": "Balanced",
+    "exam": "Exam-Oriented",
+    "theory": "Theory-Focused",
+    "practical": "Practical",
+    "programming": "Programming"
+}
+
+# Compiled system prompt and the key it was built from, under .learning/
+PROMPT_CACHE_FILE = "system_prompt.md"
+PROMPT_CACHE_META = "system_prompt.json"
+
+# How to pass the system prompt: "inline" (--system-prompt), "file"
+# (--system-prompt-file, which older Claude Code versions only accept in print
+# mode) or unset to pass it inline only when it fits on the command line
+PROMPT_VIA_ENV = "LEARN_FASTER_PROMPT_VIA"
+
+# Longest single argument Linux accepts (MAX_ARG_STRLEN); also used where ARG_MAX is unknown
+MAX_ARG_BYTES = 128 * 1024
+
+
 BANNER = f"""{Colors.CYAN}
 ██╗     ███████╗ █████╗ ██████╗ ███╗   ██╗    ███████╗ █████╗ ███████╗████████╗███████╗██████╗
 ██║     ██╔════╝██╔══██╗██╔══██╗████╗  ██║    ██╔════╝██╔══██╗██╔════╝╚══██╔══╝██╔════╝██╔══██╗
@@ -77,8 +101,13 @@ def get_templates_dir() -> Path:
     return Path(__file__).parent.parent / "templates"
 
 
-def create_or_update_settings(claude_dir: Path) -> None:
-    """Create or update .claude/settings.local.json."""
+def create_or_update_settings(claude_dir: Path) -> str:
+    """
+    Create or update .claude/settings.local.json.
+
+    Returns:
+        "created" or "updated"
+    """
     settings_file = claude_dir / "settings.local.json"
 
     # Default settings for Learn FASTER
@@ -135,15 +164,111 @@ def create_or_update_settings(claude_dir: Path) -> None:
         if "companyAnnouncements" not in settings:
             settings["companyAnnouncements"] = default_settings["companyAnnouncements"]
 
-        print_success(f"Updated {settings_file}")
+        status = "updated"
     else:
         # Create new settings file
         settings = default_settings
-        print_success(f"Created {settings_file}")
+        status = "created"
 
     # Write settings
     with open(settings_file, "w") as f:
         json.dump(settings, f, indent=2)
+    return status
+
+
+def write_atomic(path: Path, text: str) -> None:
+    """
+    Replace a file's contents without ever exposing a partial write.
+
+    Same as storage.write_atomic in the scripts: writes to a temporary file in
+    the same directory, fsyncs it and renames it over the target.
+    """
+    import tempfile
+
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        if path.exists():
+            # Keep the permissions of the file being replaced
+            os.chmod(tmp_path, path.stat().st_mode & 0o777)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def load_config(project_dir: Path):
+    """
+    Load a project's .learning/config.json.
+
+    Returns:
+        The config, {} if there is none, or None if it is not valid JSON
+    """
+    try:
+        with open(project_dir / ".learning" / "config.json", "r") as f:
+            config = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except ValueError:
+        return None
+    return config if isinstance(config, dict) else None
+
+
+def setup_project(project_dir: Path, learning_mode: str, macos_reminders: bool, link: str = None,
+                  force: bool = False, templates: list = None, version: str = None) -> dict:
+    """
+    Install or update Learn FASTER in a project, without prompting or printing.
+
+    Args:
+        project_dir: Project root
+        learning_mode: One of MODE_NAMES
+        macos_reminders: Whether review reminders go to macOS Reminders
+        link: Install templates as "hardlink"s or "symlink"s instead of copies
+        force: Overwrite template files that were edited in the project
+        templates: The mode's templates from template_sync.load_templates, if already loaded
+        version: Package version to record in the install manifest
+
+    Returns:
+        {"settings": "created" | "updated", "config": "created" | "updated" | "recreated",
+        "templates": template sync report}
+    """
+    from learn_faster.cli import template_sync
+
+    if learning_mode not in MODE_NAMES:
+        raise ValueError(f"Unknown learning mode '{learning_mode}'. Use one of: {', '.join(MODE_NAMES)}")
+
+    # Create .claude directory structure and settings.local.json
+    claude_dir = project_dir / ".claude"
+    claude_dir.mkdir(exist_ok=True)
+    settings_status = create_or_update_settings(claude_dir)
+
+    # Create .learning directory structure
+    learning_dir = project_dir / ".learning"
+    learning_dir.mkdir(exist_ok=True)
+
+    # Create or update config.json, keeping settings added since (storage, review_algorithm, ...)
+    config = load_config(project_dir)
+    config_status = "recreated" if config is None else "updated" if config else "created"
+    config = config or {}
+    config.update({
+        "initialized": True,
+        "learning_mode": learning_mode,
+        "macos_reminders_enabled": macos_reminders
+    })
+    write_atomic(learning_dir / "config.json", json.dumps(config, indent=2))
+
+    # Install agents, commands, scripts, references and CLAUDE.md, writing only what changed
+    report = template_sync.sync_templates(get_templates_dir(), project_dir, learning_mode, method=link or "copy",
+                                          force=force, version=version, templates=templates)
+    return {"settings": settings_status, "config": config_status, "templates": report}
 
 
 def check_initialization() -> bool:
@@ -160,135 +285,182 @@ def check_initialization() -> bool:
         return False
 
 
-def init_project() -> None:
-    """Initialize Learn FASTER in the current project."""
-    
+def print_sync_report(report: dict) -> None:
+    """Print what a template sync changed, one line per file that was not already up to date."""
+    markers = {
+        "added": (Colors.GREEN, "+"),
+        "updated": (Colors.CYAN, "~"),
+        "replaced": (Colors.YELLOW, "~"),
+        "removed": (Colors.RED, "-"),
+        "kept": (Colors.YELLOW, "!"),
+    }
+    notes = {"replaced": " (previous version saved as .bak)", "kept": " (edited locally, not overwritten)"}
+    for outcome, (color, marker) in markers.items():
+        for path in report[outcome]:
+            print(f"  {color}{marker}{Colors.RESET} {path}{Colors.DIM}{notes.get(outcome, '')}{Colors.RESET}")
+
+    summary = ", ".join(f"{len(report[outcome])} {outcome}" for outcome in
+                        ("added", "updated", "replaced", "removed", "kept", "unchanged") if report[outcome])
+    print_success(f"Templates synced: {summary or 'nothing to install'}")
+    if report["kept"]:
+        print_dim("Re-run with --force to overwrite locally edited files")
+
+
+def init_project(mode: str = None, yes: bool = False, link: str = None, force: bool = False) -> None:
+    """
+    Initialize Learn FASTER in the current project.
+
+    Args:
+        mode: Learning mode; asked for when not given (unless `yes`)
+        yes: Don't prompt: keep the configured mode and reminder setting, or use the defaults
+        link: Install templates as "hardlink"s or "symlink"s into the package instead of copies
+        force: Overwrite template files that were edited in the project
+    """
+    import platform
 
     cwd = Path.cwd()
-    templates_dir = get_templates_dir()
+    existing = load_config(cwd) or {}
 
     print(BANNER)
     print_header("\nInitializing Learn FASTER in current project...\n")
 
-    # Ask for learning mode selection
-    
-
-    learning_mode_question = [
-        inquirer.List(
-            'mode',
-            message="Choose your learning mode",
-            choices=[
-                ('Balanced         - Mix of theory, practice, and application', 'balanced'),
-                ('Exam-Oriented   - Printable exam papers, practice tests, and certification prep', 'exam'),
-                ('Theory-Focused   - Deep conceptual understanding and mental models', 'theory'),
-                ('Practical        - Build projects immediately, learn by doing', 'practical'),
-                ('Programming      - Learn programming through building projects', 'programming'),
-            ],
-            default='balanced',
-        ),
-    ]
-
-    mode_answer = inquirer.prompt(learning_mode_question)
-    learning_mode = mode_answer['mode'] if mode_answer else 'balanced'
-
-    mode_names = {
-        "exam": "Exam-Oriented",
-        "theory": "Theory-Focused",
-        "practical": "Practical",
-        "balanced": "Balanced",
-        "programming": "Programming"
-    }
-    print_success(f"Selected: {mode_names[learning_mode]} mode\n")
+    configured_mode = existing.get("learning_mode")
+    if configured_mode not in MODE_NAMES:
+        configured_mode = "balanced"
+
+    if mode is not None:
+        learning_mode = mode
+    elif yes:
+        learning_mode = configured_mode
+    else:
+        import inquirer
+
+        # Ask for learning mode selection
+        learning_mode_question = [
+            inquirer.List(
+                'mode',
+                message="Choose your learning mode",
+                choices=[
+                    ('Balanced         - Mix of theory, practice, and application', 'balanced'),
+                    ('Exam-Oriented   - Printable exam papers, practice tests, and certification prep', 'exam'),
+                    ('Theory-Focused   - Deep conceptual understanding and mental models', 'theory'),
+                    ('Practical        - Build projects immediately, learn by doing', 'practical'),
+                    ('Programming      - Learn programming through building projects', 'programming'),
+                ],
+                default=configured_mode,
+            ),
+        ]
+
+        mode_answer = inquirer.prompt(learning_mode_question)
+        learning_mode = mode_answer['mode'] if mode_answer else 'balanced'
+
+    print_success(f"Selected: {MODE_NAMES[learning_mode]} mode\n")
 
     # Ask about macOS Reminders (only on macOS)
-    macos_reminders = False
-    if platform.system() == "Darwin":
+    macos_reminders = bool(existing.get("macos_reminders_enabled", False))
+    if platform.system() == "Darwin" and not yes:
         response = input(f"{Colors.CYAN}Enable macOS Reminders for review notifications? (y/n):{Colors.RESET} ").strip().lower()
         macos_reminders = response in ['y', 'yes']
 
-    # Create .claude directory structure
-    claude_dir = cwd / ".claude"
-    claude_dir.mkdir(exist_ok=True)
+    from learn_faster import __version__
+
+    result = setup_project(cwd, learning_mode, macos_reminders, link=link, force=force, version=__version__)
 
-    # Copy mode-specific agents and commands
-    mode_templates_dir = templates_dir / "modes" / learning_mode
+    print_success(f"{result['settings'].capitalize()} {cwd / '.claude' / 'settings.local.json'}")
+    if result["config"] == "recreated":
+        print_warning("config.json was not valid JSON, recreated it")
+    print_success(f"Saved config.json (Mode: {MODE_NAMES[learning_mode]}, macOS Reminders: {'enabled' if macos_reminders else 'disabled'})")
+    print_sync_report(result["templates"])
 
-    # Copy agents for selected mode
-    agents_dest = claude_dir / "agents"
-    agents_dest.mkdir(exist_ok=True)
-    agents_src = mode_templates_dir / "agents"
+    print(f"\n{Colors.GREEN}{Colors.BOLD}Initialization complete!{Colors.RESET}\n")
+
+    print_header("Available commands in Claude Code:")
+    print(f"  {Colors.CYAN}/learn [topic]{Colors.RESET}    - Initialize or continue learning")
+    print(f"  {Colors.CYAN}/review{Colors.RESET}           - Spaced repetition review session")
+    print(f"  {Colors.CYAN}/progress{Colors.RESET}         - Show detailed progress report")
+    print()
 
-    if agents_src.exists():
-        for file in agents_src.glob("*.md"):
-            shutil.copy2(file, agents_dest / file.name)
-            print_success(f"Copied agent: {file.name}")
 
-    # Copy commands for selected mode
-    commands_dest = claude_dir / "commands"
-    commands_dest.mkdir(exist_ok=True)
-    commands_src = mode_templates_dir / "commands"
+def strip_frontmatter(text: str) -> str:
+    """Remove a leading YAML frontmatter block (between --- lines) and surrounding whitespace."""
+    lines = text.splitlines(keepends=True)
+    if lines and lines[0].strip() == "---":
+        for i, line in enumerate(lines[1:], start=1):
+            if line.strip() == "---":
+                return "".join(lines[i + 1:]).strip()
+    return text.strip()
 
-    if commands_src.exists():
-        for file in commands_src.glob("*.md"):
-            shutil.copy2(file, commands_dest / file.name)
-            print_success(f"Copied command: {file.name}")
 
-    # Create/update settings.local.json
-    create_or_update_settings(claude_dir)
+def compile_system_prompt(learning_mode: str) -> Path:
+    """
+    Return the path of the mode's system prompt, ready to pass to Claude Code.
+
+    The prompt is compiled (frontmatter stripped) into .learning/system_prompt.md
+    once. .learning/system_prompt.json records the package version, mode,
+    template stat and content hash it was built from. While those match, the
+    template isn't even read; a template that was touched but not changed is
+    re-hashed but not recompiled.
+
+    Args:
+        learning_mode: Learning mode whose template to use
+
+    Returns:
+        Path to the compiled prompt
+
+    Raises:
+        FileNotFoundError: If the mode has no system prompt template
+    """
+    import hashlib
+    from learn_faster import __version__
+
+    source = get_templates_dir() / "modes" / learning_mode / "system_prompts" / "learn-faster.md"
+    stat = source.stat()
+
+    learning_dir = Path.cwd() / ".learning"
+    prompt_path = learning_dir / PROMPT_CACHE_FILE
+    meta_path = learning_dir / PROMPT_CACHE_META
+    try:
+        with open(meta_path, "r") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        meta = {}
+
+    key = {"version": __version__, "mode": learning_mode, "source_mtime_ns": stat.st_mtime_ns, "source_size": stat.st_size}
+    if prompt_path.exists() and all(meta.get(name) == value for name, value in key.items()):
+        return prompt_path
+
+    text = source.read_text(encoding="utf-8")
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    unchanged = (prompt_path.exists() and meta.get("version") == __version__ and meta.get("mode") == learning_mode
+                 and meta.get("sha256") == digest)
 
-    # Create .learning directory structure
-    learning_dir = cwd / ".learning"
     learning_dir.mkdir(exist_ok=True)
+    if not unchanged:
+        write_atomic(prompt_path, strip_frontmatter(text))
+    write_atomic(meta_path, json.dumps({**key, "sha256": digest}, indent=2))
+    return prompt_path
 
-    # Create config.json with initialization flag
-    config = {
-        "initialized": True,
-        "learning_mode": learning_mode,
-        "macos_reminders_enabled": macos_reminders
-    }
-    config_path = learning_dir / "config.json"
-    with open(config_path, "w") as f:
-        json.dump(config, f, indent=2)
-    print_success(f"Created config.json (Mode: {mode_names[learning_mode]}, macOS Reminders: {'enabled' if macos_reminders else 'disabled'})")
-
-    # Copy scripts
-    scripts_dest = learning_dir / "scripts"
-    scripts_dest.mkdir(exist_ok=True)
-    scripts_src = templates_dir / "scripts"
-    if scripts_src.exists():
-        for file in scripts_src.glob("*.py"):
-            shutil.copy2(file, scripts_dest / file.name)
-            print_success(f"Copied script: {file.name}")
-
-    # Copy references
-    references_dest = learning_dir / "references"
-    references_dest.mkdir(exist_ok=True)
-    references_src = templates_dir / "references"
-    if references_src.exists():
-        for file in references_src.glob("*.md"):
-            shutil.copy2(file, references_dest / file.name)
-            print_success(f"Copied reference: {file.name}")
-
-    # Copy instructions.md to project root as CLAUDE.md
-    instructions_src = templates_dir / "instructions.md"
-    claude_md_dest = cwd / "CLAUDE.md"
-    if instructions_src.exists() and not claude_md_dest.exists():
-        shutil.copy2(instructions_src, claude_md_dest)
-        print_success("Copied instructions to CLAUDE.md in project root")
-    elif claude_md_dest.exists():
-        print_warning("CLAUDE.md already exists, skipping")
 
-    print(f"\n{Colors.GREEN}{Colors.BOLD}Initialization complete!{Colors.RESET}\n")
+def fits_on_command_line(text: str) -> bool:
+    """
+    Check whether a command line argument of this size can be passed to a program.
 
-    print_header("Available commands in Claude Code:")
-    print(f"  {Colors.CYAN}/learn [topic]{Colors.RESET}    - Initialize or continue learning")
-    print(f"  {Colors.CYAN}/review{Colors.RESET}           - Spaced repetition review session")
-    print(f"  {Colors.CYAN}/progress{Colors.RESET}         - Show detailed progress report")
-    print()
+    Counts it against the per-argument limit and against ARG_MAX together with
+    the environment, which shares that space.
+    """
+    size = len(text.encode("utf-8")) + 1
+    try:
+        arg_max = os.sysconf("SC_ARG_MAX")
+    except (AttributeError, ValueError, OSError):
+        arg_max = MAX_ARG_BYTES
+    environment = sum(len(key) + len(value) + 2 for key, value in os.environ.items())
+    # Leave room for the other arguments and the pointer arrays
+    return size <= MAX_ARG_BYTES and size + environment + 4096 <= arg_max
 
 
 def launch_coach(auto_review: bool = False) -> None:
     """Launch Claude Code with learn-faster system prompt."""
+    import errno
     import subprocess
 
     # Get the learning mode from config
@@ -302,46 +474,37 @@ def launch_coach(auto_review: bool = False) -> None:
         except:
             pass
 
-    # Get the path to the system prompt template
-    templates_dir = Path(__file__).parent.parent / "templates"
-    system_prompt_path = templates_dir / "modes" / learning_mode / "system_prompts" / "learn-faster.md"
-
-    if not system_prompt_path.exists():
+    # Get the compiled system prompt for this mode
+    try:
+        system_prompt_path = compile_system_prompt(learning_mode)
+    except FileNotFoundError as e:
         print_error(f"Error: System prompt for '{learning_mode}' mode not found")
-        print_dim(f"Expected at: {system_prompt_path}")
+        print_dim(f"Expected at: {e.filename}")
         sys.exit(1)
 
-    # Read the system prompt content (skip frontmatter)
-    with open(system_prompt_path, "r", encoding="utf-8") as f:
-        lines = f.readlines()
-
-    # Skip frontmatter (between --- lines)
-    in_frontmatter = False
-    content_lines = []
-    for line in lines:
-        if line.strip() == "---":
-            if not in_frontmatter:
-                in_frontmatter = True
-                continue
-            else:
-                in_frontmatter = False
-                continue
-        if not in_frontmatter:
-            content_lines.append(line)
-
-    system_prompt = "".join(content_lines).strip()
-
     # Launch Claude Code with the system prompt
     print_info("Launching Claude Code in learning coach mode...")
     print_dim("(Using FASTER framework system prompt)\n")
 
-    # Build command with optional /review prefix
-    cmd = ["claude", "--system-prompt", system_prompt]
-    if auto_review:
-        cmd.extend(["/review"])
+    # The prompt is passed inline where possible: most Claude Code versions only
+    # accept --system-prompt-file in print mode (-p). A prompt too large for the
+    # command line goes by file instead of failing with "Argument list too long".
+    via = os.environ.get(PROMPT_VIA_ENV)
+    prompt = None if via == "file" else system_prompt_path.read_text(encoding="utf-8")
+    if via != "inline" and prompt is not None and not fits_on_command_line(prompt):
+        prompt = None
+
+    def command(inline: bool) -> list:
+        cmd = ["claude", "--system-prompt", prompt] if inline else ["claude", "--system-prompt-file", str(system_prompt_path)]
+        return cmd + (["/review"] if auto_review else [])
 
     try:
-        subprocess.run(cmd, check=False)
+        try:
+            subprocess.run(command(prompt is not None), check=False)
+        except OSError as e:
+            if e.errno != errno.E2BIG or prompt is None:
+                raise
+            subprocess.run(command(False), check=False)
     except FileNotFoundError:
         print_error("Error: 'claude' command not found")
         print_dim("Make sure Claude Code CLI is installed and in your PATH")
@@ -349,6 +512,94 @@ def launch_coach(auto_review: bool = False) -> None:
         sys.exit(1)
 
 
+def serve() -> None:
+    """Run the learning daemon for the current project in the foreground."""
+    import subprocess
+
+    daemon_path = Path.cwd() / ".learning" / "scripts" / "learning_daemon.py"
+    if not daemon_path.exists():
+        print_error("Error: learning daemon not found in .learning/scripts/")
+        print_dim("Run 'learn-faster init' first (re-run it to update older projects)")
+        sys.exit(1)
+
+    print_info("Serving learning scripts on .learning/daemon.sock (Ctrl+C to stop)...")
+    try:
+        result = subprocess.run([sys.executable, str(daemon_path), "serve"], check=False)
+    except KeyboardInterrupt:
+        return
+    if result.returncode != 0:
+        sys.exit(result.returncode)
+
+
+def _import_times(module: str) -> tuple:
+    """
+    Import a module in a fresh interpreter with -X importtime.
+
+    Returns:
+        (wall-clock milliseconds of the interpreter run, {module: cumulative
+        microseconds} for top-level imports, or None if the import failed)
+    """
+    import time
+    import subprocess
+
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            capture_output=True, text=True, check=False)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    if result.returncode != 0:
+        return elapsed_ms, None
+
+    times = {}
+    for line in result.stderr.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        name = fields[2].rstrip()
+        # Nested imports are indented further under the module that triggered them
+        if len(name) - len(name.lstrip()) <= 1:
+            times[name.strip()] = int(fields[1])
+    return elapsed_ms, times
+
+
+def profile_startup() -> None:
+    """Report interpreter startup and CLI import time, and what init's deferred imports cost."""
+    baseline_ms, _ = _import_times("sys")
+    total_ms, times = _import_times("learn_faster.cli.main")
+    if times is None:
+        print_error("Error: learn_faster.cli.main failed to import")
+        sys.exit(1)
+
+    print_header("Startup profile")
+    print(f"  Interpreter startup          {baseline_ms:8.1f} ms")
+    print(f"  learn-faster CLI import      {times.get('learn_faster.cli.main', 0) / 1000:8.1f} ms")
+    print(f"  Total                        {total_ms:8.1f} ms")
+
+    print_header("\nSlowest top-level imports")
+    for name, us in sorted(times.items(), key=lambda item: -item[1])[:5]:
+        print(f"  {name:<28} {us / 1000:8.1f} ms")
+
+    print_header("\nDeferred to 'learn-faster init'")
+    for module in ("inquirer",):
+        _, deferred = _import_times(module)
+        cost = f"{deferred.get(module, 0) / 1000:8.1f} ms" if deferred is not None else "not installed"
+        print(f"  {module:<28} {cost}")
+
+
+def parse_init_args(argv: list) -> dict:
+    """Parse `learn-faster init` options into init_project keyword arguments."""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="learn-faster init", description="Initialize or update Learn FASTER")
+    parser.add_argument("--mode", choices=list(MODE_NAMES), help="learning mode (skips the mode question)")
+    parser.add_argument("--yes", "-y", action="store_true",
+                        help="don't prompt; keep the configured mode and reminder setting or use the defaults")
+    parser.add_argument("--link", choices=["hardlink", "symlink"],
+                        help="link templates into the installed package instead of copying them "
+                             "(edits then change the package's files)")
+    parser.add_argument("--force", action="store_true", help="overwrite template files edited in this project")
+    return vars(parser.parse_args(argv))
+
+
 def main() -> None:
     """Main CLI entry point."""
     # Check for explicit commands
@@ -356,7 +607,16 @@ def main() -> None:
         command = sys.argv[1]
 
         if command == "init":
-            init_project()
+            init_project(**parse_init_args(sys.argv[2:]))
+            return
+        elif command == "provision":
+            from learn_faster.cli import provision
+            sys.exit(provision.main(sys.argv[2:]))
+        elif command == "serve":
+            serve()
+            return
+        elif command == "--profile-startup":
+            profile_startup()
             return
         elif command == "version":
             from learn_faster import __version__
@@ -366,8 +626,13 @@ def main() -> None:
             print("Learn FASTER - Accelerate learning with FASTER framework\n")
             print("Usage:")
             print("  learn-faster           Auto-init and launch Claude Code in coach mode")
-            print("  learn-faster init      Force re-initialization")
+            print("  learn-faster init      Re-initialize; only changed templates are updated")
+            print("                         [--mode MODE] [--yes] [--link hardlink|symlink] [--force]")
+            print("  learn-faster provision <paths...> [--from-file FILE] [--mode MODE] [--jobs N]")
+            print("                         Initialize many projects in parallel; prints a JSON report")
+            print("  learn-faster serve     Keep learning data in memory for faster script calls")
             print("  learn-faster version   Show version")
+            print("  learn-faster --profile-startup   Report CLI import time")
             print()
             print("For more info: https://github.com/cheukyin175/learn-faster-kit")
             return
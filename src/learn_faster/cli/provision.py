@@ -0,0 +1,186 @@
+"""
+Non-interactive initialization of many projects at once.
+
+    learn-faster provision <paths...> [--from-file FILE] [--mode MODE]
+                           [--jobs N] [--link hardlink|symlink] [--force]
+
+Every project is set up like `learn-faster init --yes`: it keeps its
+configured learning mode (or gets --mode, or "balanced") and only template
+files that changed are written. Projects are handled by a pool of worker
+processes. The templates of each mode in use are read once, in the parent,
+and handed to every worker when it starts, so workers write projects from
+memory instead of re-reading and re-hashing the package for each one.
+
+A JSON report with one entry per project is printed to stdout:
+
+    {"status": "success", "projects": [{"path": "/repos/a", "status": "success",
+      "mode": "balanced", "settings": "created", "config": "created",
+      "templates": {"added": 31, "unchanged": 0, ...}, "kept": []}],
+     "summary": {"total": 1, "succeeded": 1, "failed": 0, "elapsed_seconds": 0.05}}
+
+The exit status is 1 if any project failed.
+"""
+
+import os
+import sys
+import json
+import time
+from pathlib import Path
+
+
+# Templates by learning mode, set in each worker process by _init_worker
+_TEMPLATES = {}
+
+
+def read_paths(from_file: str) -> list:
+    """Read project paths from a file (or stdin for "-"), one per line; blank lines and # comments are skipped."""
+    if from_file == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(from_file, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    return [line.strip() for line in lines if line.strip() and not line.lstrip().startswith("#")]
+
+
+def _init_worker(templates: dict) -> None:
+    global _TEMPLATES
+    _TEMPLATES = templates
+
+
+def provision_project(path: str, mode: str, link: str = None, force: bool = False, version: str = None) -> dict:
+    """
+    Initialize or update one project; never raises.
+
+    Args:
+        path: Project root
+        mode: Learning mode to install
+        link: Install templates as "hardlink"s or "symlink"s instead of copies
+        force: Overwrite template files that were edited in the project
+        version: Package version to record in the install manifest
+
+    Returns:
+        The project's report entry
+    """
+    from learn_faster.cli.main import load_config, setup_project
+
+    entry = {"path": path, "mode": mode}
+    try:
+        project_dir = Path(path)
+        macos_reminders = bool((load_config(project_dir) or {}).get("macos_reminders_enabled", False))
+        result = setup_project(project_dir, mode, macos_reminders, link=link, force=force,
+                               templates=_TEMPLATES.get(mode), version=version)
+    except Exception as e:
+        return {**entry, "status": "error", "error": f"{type(e).__name__}: {e}"}
+
+    report = result["templates"]
+    return {
+        **entry,
+        "status": "success",
+        "settings": result["settings"],
+        "config": result["config"],
+        "templates": {outcome: len(paths) for outcome, paths in report.items()},
+        "kept": report["kept"]
+    }
+
+
+def _provision_args(args: tuple) -> dict:
+    return provision_project(*args)
+
+
+def provision(paths: list, mode: str = None, jobs: int = None, link: str = None, force: bool = False) -> dict:
+    """
+    Initialize or update many projects in parallel.
+
+    Args:
+        paths: Project roots; each must be an existing directory
+        mode: Learning mode for every project (default: each project's configured mode, or "balanced")
+        jobs: Worker processes (default: one per CPU, at most one per project)
+        link: Install templates as "hardlink"s or "symlink"s instead of copies
+        force: Overwrite template files that were edited in the projects
+
+    Returns:
+        Report with one entry per project, in the order given, and a summary
+    """
+    from learn_faster import __version__
+    from learn_faster.cli import template_sync
+    from learn_faster.cli.main import MODE_NAMES, get_templates_dir, load_config
+
+    started = time.perf_counter()
+    entries, tasks, seen = [], [], set()
+    for path in paths:
+        project_dir = Path(path).expanduser().resolve()
+        if project_dir in seen:
+            continue
+        seen.add(project_dir)
+        if not project_dir.is_dir():
+            entries.append({"path": str(project_dir), "mode": mode, "status": "error", "error": "Not a directory"})
+            continue
+        project_mode = mode or (load_config(project_dir) or {}).get("learning_mode")
+        if project_mode not in MODE_NAMES:
+            project_mode = "balanced"
+        entries.append(None)
+        tasks.append((str(project_dir), project_mode, link, force, __version__))
+
+    templates_dir = get_templates_dir()
+    templates = {task[1]: None for task in tasks}
+    for project_mode in templates:
+        templates[project_mode] = template_sync.load_templates(templates_dir, project_mode)
+
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(tasks)))
+    if jobs == 1:
+        _init_worker(templates)
+        results = [_provision_args(task) for task in tasks]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(templates,)) as pool:
+            results = list(pool.map(_provision_args, tasks, chunksize=max(1, len(tasks) // (jobs * 4))))
+
+    results = iter(results)
+    projects = [entry if entry is not None else next(results) for entry in entries]
+    failed = sum(1 for entry in projects if entry["status"] != "success")
+    return {
+        "status": "success" if not failed else "error" if failed == len(projects) else "partial",
+        "projects": projects,
+        "summary": {
+            "total": len(projects),
+            "succeeded": len(projects) - failed,
+            "failed": failed,
+            "jobs": jobs,
+            "elapsed_seconds": round(time.perf_counter() - started, 3)
+        }
+    }
+
+
+def main(argv: list) -> int:
+    """Run `learn-faster provision`; returns the exit status."""
+    import argparse
+
+    from learn_faster.cli.main import MODE_NAMES
+
+    parser = argparse.ArgumentParser(prog="learn-faster provision",
+                                     description="Initialize or update Learn FASTER in many projects at once")
+    parser.add_argument("paths", nargs="*", help="project directories")
+    parser.add_argument("--from-file", metavar="FILE", help="read project directories from FILE, one per line (- for stdin)")
+    parser.add_argument("--mode", choices=list(MODE_NAMES),
+                        help="learning mode for every project (default: keep each project's mode)")
+    parser.add_argument("--jobs", "-j", type=int, help="worker processes (default: number of CPUs)")
+    parser.add_argument("--link", choices=["hardlink", "symlink"],
+                        help="link templates into the installed package instead of copying them")
+    parser.add_argument("--force", action="store_true", help="overwrite template files edited in the projects")
+    args = parser.parse_args(argv)
+
+    paths = list(args.paths)
+    if args.from_file:
+        try:
+            paths.extend(read_paths(args.from_file))
+        except OSError as e:
+            parser.error(f"cannot read {args.from_file}: {e.strerror}")
+    if not paths:
+        parser.error("no project paths given")
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    report = provision(paths, mode=args.mode, jobs=args.jobs, link=args.link, force=args.force)
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    return 0 if report["status"] == "success" else 1
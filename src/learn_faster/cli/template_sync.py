@@ -0,0 +1,260 @@
+"""
+Incremental installation of the Learn FASTER templates into a project.
+
+`learn-faster init` used to copy every template file on every run. Instead,
+.learning/install_manifest.json records the content hash (and stat) of every
+file it installed:
+
+    {"version": "1.2.0", "files": {".learning/scripts/storage.py":
+        {"source": "scripts/storage.py", "sha256": "...", "size": 1234,
+         "mtime_ns": ..., "method": "copy"}}}
+
+On the next run each file is compared with its template and the manifest:
+
+- unchanged: already matches the template; nothing is written
+- added: did not exist yet
+- updated: the template changed and the installed file was not edited
+- kept: the file was edited in the project, so it is left alone (use force)
+- replaced: installed before manifests existed and differing from the
+  template; overwritten after saving a .bak copy
+- removed: no longer part of the templates (e.g. after switching modes) and
+  not edited in the project
+
+Files can be installed as copies (default), hard links or symbolic links to
+the package's templates. Copies are written from templates read into memory
+once (`load_templates`), so provisioning many projects doesn't re-read and
+re-hash the package for each one.
+"""
+
+import os
+import json
+import stat
+import shutil
+import hashlib
+import tempfile
+from pathlib import Path
+
+
+MANIFEST_FILE = "install_manifest.json"
+
+METHODS = ("copy", "hardlink", "symlink")
+
+
+def file_hash(path: Path) -> str:
+    """SHA-256 of a file's contents."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def template_files(templates_dir: Path, mode: str) -> list:
+    """
+    List the template files installed for a learning mode.
+
+    Returns:
+        (source path, destination path relative to the project root,
+        whether an existing untracked destination may be replaced) tuples
+    """
+    mode_dir = templates_dir / "modes" / mode
+    groups = [
+        (mode_dir / "agents", "*.md", Path(".claude") / "agents"),
+        (mode_dir / "commands", "*.md", Path(".claude") / "commands"),
+        (templates_dir / "scripts", "*.py", Path(".learning") / "scripts"),
+        (templates_dir / "references", "*.md", Path(".learning") / "references"),
+    ]
+    files = []
+    for src_dir, pattern, dest_dir in groups:
+        if src_dir.exists():
+            files.extend((src, dest_dir / src.name, True) for src in sorted(src_dir.glob(pattern)))
+    # CLAUDE.md predating the manifest is assumed to be the user's own
+    instructions = templates_dir / "instructions.md"
+    if instructions.exists():
+        files.append((instructions, Path("CLAUDE.md"), False))
+    return files
+
+
+def load_templates(templates_dir: Path, mode: str) -> list:
+    """
+    Read a learning mode's template files into memory.
+
+    Returns:
+        Template dicts with "src", "dest" (relative to the project root),
+        "source" (relative to templates_dir), "sha256", "data", "file_mode"
+        and "replace_untracked" (see `template_files`)
+    """
+    templates = []
+    for src, rel_dest, replace_untracked in template_files(templates_dir, mode):
+        data = src.read_bytes()
+        templates.append({
+            "src": src,
+            "dest": rel_dest,
+            "source": src.relative_to(templates_dir).as_posix(),
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "data": data,
+            "file_mode": stat.S_IMODE(src.stat().st_mode),
+            "replace_untracked": replace_untracked
+        })
+    return templates
+
+
+def load_manifest(project_dir: Path) -> dict:
+    """Load the project's install manifest (empty if there is none)."""
+    try:
+        with open(project_dir / ".learning" / MANIFEST_FILE, "r") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {"files": {}}
+    manifest.setdefault("files", {})
+    return manifest
+
+
+def _temp_path(path: Path) -> Path:
+    """Reserve a uniquely named temporary file next to path, so concurrent runs never share one."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    os.close(fd)
+    return Path(tmp_path)
+
+
+def _save_manifest(project_dir: Path, manifest: dict) -> None:
+    path = project_dir / ".learning" / MANIFEST_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = _temp_path(path)
+    try:
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _install(template: dict, dest: Path, method: str) -> str:
+    """Write dest from a template with the given method; returns the method actually used."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = _temp_path(dest)
+    try:
+        if method != "copy":
+            # Links need the reserved name free; it stays unique to this run
+            tmp_path.unlink()
+            try:
+                if method == "symlink":
+                    os.symlink(template["src"].resolve(), tmp_path)
+                else:
+                    os.link(template["src"], tmp_path)
+            except OSError:
+                # Links are not possible across filesystems (or on some platforms)
+                method = "copy"
+        if method == "copy":
+            with open(tmp_path, "wb") as f:
+                f.write(template["data"])
+            os.chmod(tmp_path, template["file_mode"])
+        os.replace(tmp_path, dest)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return method
+
+
+def _installed_as(src: Path, dest: Path, method: str) -> bool:
+    """Whether dest is installed the requested way: a copy, a hard link to src or a symlink to src."""
+    if method == "symlink":
+        return dest.is_symlink() and dest.resolve() == src.resolve()
+    if method == "hardlink":
+        return not dest.is_symlink() and os.path.samefile(src, dest)
+    # A copy must not share the template's inode, or editing it would edit the package
+    return not dest.is_symlink() and not os.path.samefile(src, dest)
+
+
+def _record(dest: Path, source: str, digest: str, method: str) -> dict:
+    stat = dest.lstat() if method == "symlink" else dest.stat()
+    return {"source": source, "sha256": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "method": method}
+
+
+def _matches_record(dest: Path, record: dict) -> bool:
+    """Whether dest still holds what was installed, checked by stat first and by hash if needed."""
+    if record.get("method") == "symlink":
+        return dest.is_symlink() and dest.exists() and file_hash(dest) == record["sha256"]
+    stat = dest.stat()
+    if stat.st_size == record.get("size") and stat.st_mtime_ns == record.get("mtime_ns"):
+        return True
+    return file_hash(dest) == record["sha256"]
+
+
+def sync_templates(templates_dir: Path, project_dir: Path, mode: str, method: str = "copy",
+                   force: bool = False, version: str = None, templates: list = None) -> dict:
+    """
+    Bring a project's installed templates up to date, writing only what changed.
+
+    Args:
+        templates_dir: The package's templates directory
+        project_dir: Project root
+        mode: Learning mode whose agents and commands to install
+        method: "copy", "hardlink" or "symlink"
+        force: Overwrite files edited in the project
+        version: Package version to record in the manifest
+        templates: The mode's templates from `load_templates`, if already loaded
+
+    Returns:
+        Mapping of outcome ("added", "updated", "unchanged", "kept",
+        "replaced", "removed") to destination paths
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown install method '{method}'. Use one of: {', '.join(METHODS)}")
+
+    manifest = load_manifest(project_dir)
+    old_records = manifest["files"]
+    records = {}
+    report = {outcome: [] for outcome in ("added", "updated", "unchanged", "kept", "replaced", "removed")}
+
+    if templates is None:
+        templates = load_templates(templates_dir, mode)
+    for template in templates:
+        src, source, digest = template["src"], template["source"], template["sha256"]
+        key = template["dest"].as_posix()
+        dest = project_dir / template["dest"]
+        record = old_records.get(key)
+
+        if not dest.exists():
+            outcome = "added"
+        elif record is not None and record["sha256"] == digest and _installed_as(src, dest, method) \
+                and _matches_record(dest, record):
+            outcome = "unchanged"
+        elif _installed_as(src, dest, method) and file_hash(dest) == digest:
+            # Same content already (e.g. installed before the manifest): just start tracking it
+            records[key] = _record(dest, source, digest, method)
+            report["unchanged"].append(key)
+            continue
+        elif record is not None and (force or _matches_record(dest, record)):
+            outcome = "updated"
+        elif record is None and (force or template["replace_untracked"]):
+            outcome = "replaced"
+            shutil.copy2(dest, dest.with_name(dest.name + ".bak"))
+        else:
+            # Edited in the project: keep it, and keep its old record so it stays "edited"
+            if record is not None:
+                records[key] = record
+            report["kept"].append(key)
+            continue
+
+        if outcome == "unchanged":
+            records[key] = record
+        else:
+            used = _install(template, dest, method)
+            records[key] = _record(dest, source, digest, used)
+        report[outcome].append(key)
+
+    # Files installed before but no longer part of the templates
+    for key, record in old_records.items():
+        if key in records or key in report["kept"]:
+            continue
+        dest = project_dir / key
+        if not (dest.exists() or dest.is_symlink()):
+            continue
+        if force or _matches_record(dest, record):
+            dest.unlink()
+            report["removed"].append(key)
+        else:
+            report["kept"].append(key)
+
+    manifest.update(files=records, version=version, mode=mode)
+    _save_manifest(project_dir, manifest)
+    return report
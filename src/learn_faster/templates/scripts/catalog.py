@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Materialized catalog of learning topics.
+
+.learning/catalog.json keeps one summary per topic, so listing topics costs
+one small read plus a stat of each topic's metadata.json instead of parsing
+every topic's files:
+
+    {"v": 2, "topics": {"<slug>": {"topic": "React Hooks", "status": "in_progress",
+     "sessions": 3, "syllabus_exists": true, "concept_count": 12,
+     "next_due": "2025-01-07T09:00:00", "last_activity": "2025-01-05T18:20:11",
+     "metadata_mtime_ns": 1736097611000000000}}}
+
+The scripts that write topic data update their topic's entry as they go:
+init_learning (new topics), log_progress (sessions), generate_syllabus
+(syllabus), review_scheduler (concept count and next due review, through the
+due index) and concept_quiz (activity). A missing catalog, or a topic
+without an entry, is rebuilt from the topic files. When the catalog is read,
+entries of deleted topic directories are dropped, and a topic whose
+metadata.json changed since its entry was written (e.g. a hand edit) is
+scanned again; `catalog.py rebuild` re-reads every topic, e.g. after editing
+a review schedule by hand.
+
+With the SQLite backend the same summaries come from one aggregate query
+(learning_db.topic_catalog) and this file is not used.
+"""
+
+from datetime import datetime
+from pathlib import Path
+
+import storage
+
+
+CATALOG_FILE = "catalog.json"
+CATALOG_VERSION = 2
+
+
+def metadata_fields(metadata: dict) -> dict:
+    """Catalog fields taken from a topic's metadata document."""
+    return {
+        "topic": metadata["topic"],
+        "status": metadata["status"],
+        "sessions": metadata.get("total_sessions", 0),
+        "syllabus_exists": metadata.get("syllabus_generated", False)
+    }
+
+
+def last_activity(*timestamps):
+    """Latest of several ISO timestamps, ignoring missing ones."""
+    return max((t for t in timestamps if t), default=None)
+
+
+def _metadata_mtime_ns(topic_dir: Path):
+    try:
+        return (Path(topic_dir) / "metadata.json").stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _is_current(base_dir: Path, slug: str, entry: dict) -> bool:
+    """Whether an entry was written after the last change to its metadata.json."""
+    mtime_ns = entry.get("metadata_mtime_ns")
+    return mtime_ns is not None and mtime_ns == _metadata_mtime_ns(base_dir / slug)
+
+
+def scan_topic(topic_dir: Path):
+    """
+    Build a topic's catalog entry from its files.
+
+    Returns:
+        The entry, or None if the directory is not a topic
+    """
+    metadata = storage.load_json(Path(topic_dir) / "metadata.json")
+    if not isinstance(metadata, dict) or "topic" not in metadata:
+        return None
+    reviews = (storage.load_json(Path(topic_dir) / "review_schedule.json") or {}).get("reviews", [])
+    return {
+        **metadata_fields(metadata),
+        "concept_count": len(reviews),
+        "next_due": min((item["next_review"] for item in reviews), default=None),
+        "last_activity": last_activity(
+            metadata.get("created_at"), metadata.get("last_session"), metadata.get("syllabus_updated_at"),
+            *(item.get("last_reviewed") or item.get("learned_date") for item in reviews)
+        ),
+        "metadata_mtime_ns": _metadata_mtime_ns(topic_dir)
+    }
+
+
+def _save(base_dir: Path, topics: dict) -> None:
+    storage.save_json(base_dir / CATALOG_FILE, {"v": CATALOG_VERSION, "topics": topics}, indent=None)
+
+
+def rebuild(base_dir: str = ".learning") -> dict:
+    """
+    Re-read every topic and rewrite the catalog.
+
+    Returns:
+        Mapping of topic slug to catalog entry
+    """
+    base_dir = Path(base_dir)
+    topics = {}
+    if base_dir.is_dir():
+        # Scan under the lock so no update lands between the scan and the save
+        with storage.locked(base_dir):
+            for topic_dir in sorted(base_dir.iterdir()):
+                if topic_dir.is_dir():
+                    entry = scan_topic(topic_dir)
+                    if entry is not None:
+                        topics[topic_dir.name] = entry
+            _save(base_dir, topics)
+    return topics
+
+
+def load(base_dir: str = ".learning") -> dict:
+    """
+    Read the catalog, building it first if there is none.
+
+    Each entry is checked against its topic's metadata.json: entries of
+    topics whose directory (or metadata.json) was deleted are dropped, and
+    topics whose metadata.json changed since the entry was written are
+    scanned again.
+
+    Returns:
+        Mapping of topic slug to catalog entry
+    """
+    base_dir = Path(base_dir)
+    catalog = storage.load_json(base_dir / CATALOG_FILE)
+    if not isinstance(catalog, dict) or catalog.get("v") != CATALOG_VERSION:
+        return rebuild(base_dir)
+    topics = catalog["topics"]
+    if all(_is_current(base_dir, slug, entry) for slug, entry in topics.items()):
+        return topics
+    with storage.locked(base_dir):
+        catalog = storage.load_json(base_dir / CATALOG_FILE)
+        if not isinstance(catalog, dict) or catalog.get("v") != CATALOG_VERSION:
+            return rebuild(base_dir)
+        topics = catalog["topics"]
+        for slug, entry in list(topics.items()):
+            if not _is_current(base_dir, slug, entry):
+                entry = scan_topic(base_dir / slug) if (base_dir / slug).is_dir() else None
+                if entry is None:
+                    del topics[slug]
+                else:
+                    topics[slug] = entry
+        _save(base_dir, topics)
+    return topics
+
+
+def update(base_dir: str, slug: str, fields: dict):
+    """
+    Update fields of a topic's catalog entry.
+
+    A topic without an entry, or whose metadata.json changed since its entry
+    was written, is scanned from its files first, and a missing catalog is
+    rebuilt from every topic's files (which already include the
+    change).
+
+    Args:
+        base_dir: Base directory for learning data
+        slug: Topic slug
+        fields: Entry fields to set
+
+    Returns:
+        The topic's entry, or None if the directory is not a topic
+    """
+    base_dir = Path(base_dir)
+    with storage.locked(base_dir):
+        catalog = storage.load_json(base_dir / CATALOG_FILE)
+        if not isinstance(catalog, dict) or catalog.get("v") != CATALOG_VERSION:
+            return rebuild(base_dir).get(slug)
+        topics = catalog["topics"]
+        entry = topics.get(slug)
+        if entry is None or not _is_current(base_dir, slug, entry):
+            # Scanning also picks up the caller's own metadata.json write
+            entry = scan_topic(base_dir / slug)
+            if entry is None:
+                topics.pop(slug, None)
+                _save(base_dir, topics)
+                return None
+            topics[slug] = entry
+        entry.update(fields)
+        _save(base_dir, topics)
+    return entry
+
+
+def touch(base_dir: str, slug: str, **fields):
+    """Update a topic's entry and set its last activity to now."""
+    return update(base_dir, slug, {**fields, "last_activity": datetime.now().isoformat()})
+
+
+if __name__ == "__main__":
+    import sys
+
+    import cli_output
+    import learning_daemon
+
+    learning_daemon.forward(__file__)
+    cli_output.configure()
+
+    if len(sys.argv) < 2:
+        print("Usage:")
+        print("  Rebuild after hand edits:  python3 catalog.py rebuild")
+        sys.exit(1)
+
+    if sys.argv[1] == "rebuild":
+        topics = rebuild()
+        cli_output.emit({"status": "success", "topic_count": len(topics), "topics": sorted(topics)})
+    else:
+        print("❌ Invalid command or missing arguments")
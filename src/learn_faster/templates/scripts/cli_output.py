@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+JSON output shared by the learning scripts.
+
+Every script accepts these options anywhere on its command line. They are
+removed from sys.argv before the script parses its own arguments:
+
+    --compact            Minified JSON (or LEARN_FASTER_OUTPUT=compact)
+    --fields a,b         Keep only these top-level fields (or LEARN_FASTER_FIELDS)
+    --limit N            Longest paged list returned, 0 for no limit (or LEARN_FASTER_LIMIT)
+    --cursor C           Where the next page starts: a "<field>_next_cursor" value
+                         from a previous call (e.g. reviews:50), or a plain offset
+
+Only read listings that can grow with the learner's data (due reviews, the
+topic list) are paged; results of writes always come back whole. A paged
+list longer than the limit is cut to one page and the output gains
+"<field>_total" and "<field>_next_cursor" (null on the last page), so
+several lists in one output page independently.
+"""
+
+import os
+import sys
+import json
+
+
+DEFAULT_LIMIT = 50
+
+# "cursor" maps a list's field name (or None, for every list) to its offset
+_options = {"compact": False, "fields": None, "limit": DEFAULT_LIMIT, "cursor": {}}
+
+
+def _non_negative_int(name: str, value: str) -> int:
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        number = -1
+    if number < 0:
+        raise ValueError(f"{name} must be a non-negative integer, got '{value}'")
+    return number
+
+
+def configure(argv: list = None) -> dict:
+    """
+    Read output options from the environment and the command line.
+
+    Exits with a JSON error if --limit or --cursor is not a non-negative integer.
+
+    Args:
+        argv: Argument list to strip options from, in place (default: sys.argv)
+
+    Returns:
+        The active options
+    """
+    argv = sys.argv if argv is None else argv
+    try:
+        return _configure(argv)
+    except ValueError as e:
+        print(json.dumps({"status": "error", "error": str(e)}, indent=2))
+        sys.exit(1)
+
+
+def _configure(argv: list) -> dict:
+    fields = os.environ.get("LEARN_FASTER_FIELDS")
+    _options.update(
+        compact=os.environ.get("LEARN_FASTER_OUTPUT", "").lower() == "compact",
+        fields=fields,
+        limit=_non_negative_int("LEARN_FASTER_LIMIT", os.environ.get("LEARN_FASTER_LIMIT", DEFAULT_LIMIT)),
+        cursor={}
+    )
+
+    remaining = argv[:1]
+    args = iter(argv[1:])
+    for arg in args:
+        name, has_value, value = arg.partition("=")
+        if arg == "--compact":
+            _options["compact"] = True
+        elif name in ("--fields", "--limit", "--cursor"):
+            if not has_value:
+                value = next(args, None)
+            if name == "--fields":
+                _options["fields"] = value
+            elif name == "--cursor":
+                field, _, offset = (value or "").rpartition(":")
+                _options["cursor"] = {field or None: _non_negative_int(name, offset)}
+            else:
+                _options["limit"] = _non_negative_int(name, value)
+        else:
+            remaining.append(arg)
+    argv[:] = remaining
+
+    if isinstance(_options["fields"], str):
+        _options["fields"] = [field.strip() for field in _options["fields"].split(",") if field.strip()] or None
+    return dict(_options)
+
+
+def page(items: list, field: str = None):
+    """
+    Cut a list to the requested page.
+
+    Lists no longer than the limit are returned whole.
+
+    Args:
+        items: The full list
+        field: Output field holding the list, whose cursor applies
+
+    Returns:
+        (items on this page, offset of the next page or None, offset of the
+        page's first item)
+    """
+    cursors = _options["cursor"]
+    limit, cursor = _options["limit"], cursors.get(field, cursors.get(None, 0))
+    if not limit or len(items) <= limit:
+        return items, None, 0
+    end = cursor + limit
+    return items[cursor:end], (end if end < len(items) else None), cursor
+
+
+def paged(output: dict, field: str, items: list):
+    """
+    Put one page of a list into an output field, with its total and next cursor.
+
+    Returns:
+        Same as `page`
+    """
+    shown, next_cursor, offset = page(items, field)
+    output[field] = shown
+    if shown is not items:
+        output[f"{field}_total"] = len(items)
+        output[f"{field}_next_cursor"] = f"{field}:{next_cursor}" if next_cursor is not None else None
+    return shown, next_cursor, offset
+
+
+def emit(output: dict, paginate=()) -> None:
+    """
+    Print a script result as JSON, applying the output options.
+
+    Args:
+        output: Result dictionary
+        paginate: Name (or names) of the read listings in `output` to page;
+            every other list is printed whole
+    """
+    output = dict(output)
+    for field in ([paginate] if isinstance(paginate, str) else paginate):
+        if isinstance(output.get(field), list):
+            paged(output, field, output[field])
+
+    if _options["fields"]:
+        keep = set(_options["fields"]) | {"error"}
+        keep |= {f"{field}{suffix}" for field in _options["fields"] for suffix in ("_total", "_next_cursor")}
+        output = {key: value for key, value in output.items() if key in keep}
+
+    if _options["compact"]:
+        print(json.dumps(output, separators=(",", ":"), ensure_ascii=False))
+    else:
+        print(json.dumps(output, indent=2))
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Index over a topic's concept files for quiz target selection.
+
+<topic>/concept_index.json keeps one small entry per concepts/<slug>.json:
+
+    {"v": 3, "dir_mtime_ns": ..., "concepts": {"<slug>": {"concept": ..., "review_count": 2,
+     "quiz_accuracy": 0.5, "quiz_count": 4, "quiz_correct_count": 2, "quiz_ewma_accuracy": 0.37,
+     "learned_date": ..., "last_reviewed": ..., "last_quizzed": ...}},
+     "aliases": {"<normalized alias>": "<slug>"}}
+
+Quiz attempts and the review scheduler update entries as they write concept
+files, and quiz generation scores the entries (see recall.py) or takes the
+least reviewed ones with heapq.nsmallest instead of opening every file.
+Concept files added or removed by hand are picked up from a directory
+listing when the concepts directory changes; `concept_quiz.py reindex` re-reads every file after hand edits.
+The entries' names and the aliases make up the topic's concept name
+registry (see concept_names.py).
+
+A concept document keeps only its last QUIZ_HISTORY_SIZE quiz attempts in
+"quiz_history", plus running totals, an exponentially weighted accuracy and
+the current streak of correct answers. Older attempts are appended to
+<topic>/quiz_archive.ndjson, so documents stay small however often a
+concept is quizzed.
+"""
+
+import os
+import json
+import heapq
+from datetime import datetime
+from pathlib import Path
+
+import concept_names
+import storage
+
+
+INDEX_FILE = "concept_index.json"
+INDEX_VERSION = 3
+CONCEPTS_DIR = "concepts"
+ARCHIVE_FILE = "quiz_archive.ndjson"
+
+# Quiz attempts kept in a concept document; older ones move to the archive
+QUIZ_HISTORY_SIZE = 20
+# Weight of the latest answer in the exponentially weighted quiz accuracy
+QUIZ_EWMA_ALPHA = 0.3
+
+
+def new_concept(concept: str, learned_date: str = None, slug: str = None) -> dict:
+    """Build the document for a newly learned concept (slug defaults to one derived from the name)."""
+    return {
+        "concept": concept,
+        "concept_slug": slug or concept_names.concept_slug(concept),
+        "learned_date": learned_date or datetime.now().isoformat(),
+        "review_count": 0,
+        "last_reviewed": None,
+        "quiz_count": 0,
+        "quiz_correct_count": 0,
+        "quiz_ewma_accuracy": None,
+        "quiz_streak": 0,
+        "quiz_history": []
+    }
+
+
+def record_attempt(data: dict, correct: bool, timestamp: str = None) -> list:
+    """
+    Add a quiz attempt to a concept document and update its quiz aggregates.
+
+    Args:
+        data: Concept document, updated in place
+        correct: Whether the answer was correct
+        timestamp: ISO time of the attempt (default: now)
+
+    Returns:
+        Attempts that no longer fit in "quiz_history", oldest first, for the archive
+    """
+    history = data.get("quiz_history") or []
+    quiz_count = data.get("quiz_count", 0)
+    previous = data.get("quiz_ewma_accuracy")
+    if previous is None and quiz_count:
+        # Document from before the aggregates existed: start from the overall accuracy
+        previous = data.get("quiz_correct_count", 0) / quiz_count
+    if "quiz_streak" not in data:
+        data["quiz_streak"] = 0
+        for attempt in reversed(history):
+            if not attempt.get("correct"):
+                break
+            data["quiz_streak"] += 1
+
+    data["quiz_count"] = quiz_count + 1
+    data["quiz_correct_count"] = data.get("quiz_correct_count", 0) + int(correct)
+    data["quiz_ewma_accuracy"] = round(
+        float(correct) if previous is None else QUIZ_EWMA_ALPHA * correct + (1 - QUIZ_EWMA_ALPHA) * previous, 4
+    )
+    data["quiz_streak"] = data["quiz_streak"] + 1 if correct else 0
+
+    history.append({"timestamp": timestamp or datetime.now().isoformat(), "correct": correct})
+    overflow = history[:-QUIZ_HISTORY_SIZE]
+    data["quiz_history"] = history[-QUIZ_HISTORY_SIZE:]
+    return overflow
+
+
+def archive_attempts(topic_dir: Path, concept_slug: str, attempts: list) -> None:
+    """
+    Append quiz attempts to the topic's archive in one O_APPEND write.
+
+    Callers that may run concurrently should hold the topic lock.
+    """
+    if not attempts:
+        return
+    lines = "".join(
+        json.dumps({"concept_slug": concept_slug, **attempt}, ensure_ascii=False) + "\n" for attempt in attempts
+    )
+    fd = os.open(Path(topic_dir) / ARCHIVE_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, lines.encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
+def archived_attempts(topic_dir: Path):
+    """Stream archived quiz attempts in the order they were archived, skipping torn lines."""
+    try:
+        f = open(Path(topic_dir) / ARCHIVE_FILE, "r", encoding="utf-8")
+    except FileNotFoundError:
+        return
+    with f:
+        for line in f:
+            try:
+                attempt = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(attempt, dict) and "concept_slug" in attempt:
+                yield attempt
+
+
+def _entry(data: dict) -> dict:
+    quiz_count = data.get("quiz_count", 0)
+    quiz_history = data.get("quiz_history") or []
+    return {
+        "concept": data["concept"],
+        "review_count": data.get("review_count", 0),
+        "quiz_accuracy": round(data.get("quiz_correct_count", 0) / quiz_count, 4) if quiz_count else None,
+        "quiz_count": quiz_count,
+        "quiz_correct_count": data.get("quiz_correct_count", 0),
+        "quiz_ewma_accuracy": data.get("quiz_ewma_accuracy"),
+        "learned_date": data.get("learned_date"),
+        "last_reviewed": data.get("last_reviewed"),
+        "last_quizzed": quiz_history[-1].get("timestamp") if quiz_history else None
+    }
+
+
+def priority(entry: dict) -> tuple:
+    """
+    Sort key for least-reviewed quiz targets: fewest reviews, then lowest quiz
+    accuracy (never quizzed first), then oldest. Missing learned dates sort first.
+    """
+    accuracy = entry["quiz_accuracy"]
+    return entry["review_count"], -1.0 if accuracy is None else accuracy, entry["learned_date"] or ""
+
+
+def _dir_mtime_ns(concepts_dir: Path):
+    try:
+        return concepts_dir.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def load_index(topic_dir: Path, rebuild: bool = False) -> dict:
+    """
+    Load the topic's concept index, syncing it with the concepts directory.
+
+    When the directory changed since the index was saved, its listing is
+    compared with the index: new files are read and removed ones dropped.
+    Existing files are only re-read when `rebuild` is set.
+
+    Args:
+        topic_dir: Topic directory
+        rebuild: Re-read every concept file
+
+    Returns:
+        Mapping of concept slug to index entry
+    """
+    return _load(topic_dir, rebuild)["concepts"]
+
+
+def _save(topic_dir: Path, index: dict, dir_mtime_ns) -> None:
+    storage.save_json(topic_dir / INDEX_FILE, {
+        "v": INDEX_VERSION,
+        "dir_mtime_ns": dir_mtime_ns,
+        "concepts": index["concepts"],
+        "aliases": index["aliases"]
+    }, indent=None)
+
+
+def _load(topic_dir: Path, rebuild: bool = False) -> dict:
+    """Load the whole index (entries and aliases); see `load_index`."""
+    topic_dir = Path(topic_dir)
+    concepts_dir = topic_dir / CONCEPTS_DIR
+    index_path = topic_dir / INDEX_FILE
+    index = storage.load_json(index_path, {})
+    if index.get("v") != INDEX_VERSION:
+        # Written by an older version: entries lack fields, re-read every file
+        rebuild = True
+    entries = {} if rebuild else index.get("concepts", {})
+    aliases = index.get("aliases", {})
+    dir_mtime_ns = _dir_mtime_ns(concepts_dir)
+
+    if not rebuild and index and index.get("dir_mtime_ns") == dir_mtime_ns:
+        return {"concepts": entries, "aliases": aliases}
+
+    slugs = {path.stem for path in concepts_dir.glob("*.json")} if dir_mtime_ns is not None else set()
+    changed = rebuild or not index
+    for slug in list(entries):
+        if slug not in slugs:
+            del entries[slug]
+            changed = True
+    for slug in slugs - entries.keys():
+        data = storage.load_json(concepts_dir / f"{slug}.json")
+        if isinstance(data, dict) and "concept" in data:
+            entries[slug] = _entry(data)
+            changed = True
+
+    if changed or index.get("dir_mtime_ns") != dir_mtime_ns:
+        with storage.locked(topic_dir):
+            _save(topic_dir, {"concepts": entries, "aliases": aliases}, dir_mtime_ns)
+    return {"concepts": entries, "aliases": aliases}
+
+
+def save_concepts(topic_dir: Path, documents: list) -> None:
+    """
+    Write concept documents and update their index entries.
+
+    Callers should hold the topic lock around the load-modify-save sequence.
+
+    Args:
+        topic_dir: Topic directory
+        documents: Concept documents, each with "concept" and "concept_slug"
+    """
+    if not documents:
+        return
+    topic_dir = Path(topic_dir)
+    concepts_dir = topic_dir / CONCEPTS_DIR
+    with storage.locked(topic_dir):
+        index = _load(topic_dir)
+        concepts_dir.mkdir(exist_ok=True)
+        for data in documents:
+            storage.save_json(concepts_dir / f"{data['concept_slug']}.json", data)
+            index["concepts"][data["concept_slug"]] = _entry(data)
+        _save(topic_dir, index, _dir_mtime_ns(concepts_dir))
+
+
+def registry(topic_dir: Path) -> concept_names.ConceptRegistry:
+    """Build the topic's concept name registry from the index."""
+    index = _load(topic_dir)
+    return concept_names.ConceptRegistry(
+        {slug: entry["concept"] for slug, entry in index["concepts"].items()}, index["aliases"]
+    )
+
+
+def add_alias(topic_dir: Path, alias_key: str, slug: str) -> None:
+    """
+    Store an alias (already normalized with concept_names.concept_key) for a concept.
+
+    Callers that may run concurrently should hold the topic lock.
+    """
+    topic_dir = Path(topic_dir)
+    index = _load(topic_dir)
+    index["aliases"][alias_key] = slug
+    _save(topic_dir, index, _dir_mtime_ns(topic_dir / CONCEPTS_DIR))
+
+
+def least_reviewed(topic_dir: Path, limit: int = 3) -> list:
+    """
+    Pick the `limit` concepts most in need of a quiz by `priority` from the index.
+
+    Returns:
+        Index entries with their "slug", best target first
+    """
+    entries = load_index(topic_dir)
+    chosen = heapq.nsmallest(limit, entries.items(), key=lambda item: priority(item[1]))
+    return [{"slug": slug, **entry} for slug, entry in chosen]
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Concept name resolution shared by the review scheduler and the concept quiz.
+
+Every concept has one ID, its slug (the concept document's file name and the
+concepts.slug column in SQLite). A topic's registry maps normalized names and
+aliases to slugs, so "Big-O notation", "big-o   Notation" and an alias like
+"asymptotic complexity" all resolve to the same concept. Names that only
+match the start of one known concept ("Big-O") resolve through a prefix trie
+when a command asks for it.
+
+Lookups go from most to least specific: a concept's own name always wins
+over another concept's alias, and both win over a prefix. A prefix that
+starts several names is ambiguous and resolves to nothing.
+
+Normalization (`concept_key`) applies Unicode NFKC, case folding and
+whitespace collapsing. Slugs keep Unicode letters and digits and turn every
+other run of characters into "-".
+"""
+
+import re
+import hashlib
+import unicodedata
+from pathlib import Path
+
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+# Names suggested when a lookup fails
+MAX_SUGGESTIONS = 5
+
+
+def concept_key(concept: str) -> str:
+    """Normalize a concept name for lookups: NFKC, case-folded, with collapsed whitespace."""
+    return " ".join(unicodedata.normalize("NFKC", concept).casefold().split())
+
+
+def concept_slug(concept: str) -> str:
+    """
+    Derive a file-name-safe slug from a concept name.
+
+    Names without any letters or digits get a hash-based slug.
+    """
+    key = concept_key(concept)
+    slug = _NON_WORD.sub("-", key).strip("-")
+    return slug or "concept-" + hashlib.sha1(key.encode("utf-8")).hexdigest()[:10]
+
+
+class ConceptRegistry:
+    """
+    Names and aliases of a topic's concepts, resolved to slugs.
+
+    Exact lookups are one dictionary access on the normalized name. The
+    prefix trie is built on the first prefix lookup; after that a lookup
+    walks len(name) nodes.
+    """
+
+    def __init__(self, names: dict, aliases: dict = None):
+        """
+        Args:
+            names: Mapping of slug to concept name
+            aliases: Mapping of normalized alias to slug
+        """
+        self.names = dict(names)
+        self.name_keys = {concept_key(name): slug for slug, name in self.names.items()}
+        self.keys = {key: slug for key, slug in (aliases or {}).items() if slug in self.names}
+        self.keys.update(self.name_keys)
+        self._trie = None
+
+    def _build_trie(self) -> dict:
+        trie = {}
+        for key, slug in self.keys.items():
+            self._insert(trie, key, slug)
+        return trie
+
+    @staticmethod
+    def _insert(trie: dict, key: str, slug: str) -> None:
+        node = trie
+        for char in key:
+            node = node.setdefault(char, {})
+        # Characters are never None, so None marks the end of a name
+        node[None] = slug
+
+    def _prefix_slugs(self, key: str, limit: int) -> list:
+        """Distinct slugs of names starting with `key`, up to `limit`."""
+        if self._trie is None:
+            self._trie = self._build_trie()
+        node = self._trie
+        for char in key:
+            node = node.get(char)
+            if node is None:
+                return []
+
+        slugs = []
+        stack = [node]
+        while stack and len(slugs) < limit:
+            node = stack.pop()
+            for char, child in node.items():
+                if char is None:
+                    if child not in slugs:
+                        slugs.append(child)
+                else:
+                    stack.append(child)
+        return slugs[:limit]
+
+    def resolve(self, concept: str, prefix: bool = False):
+        """
+        Find the slug of a concept name or alias.
+
+        Args:
+            concept: Name in any case, spacing or Unicode form
+            prefix: Also accept the start of a name if it matches exactly one concept
+
+        Returns:
+            The slug, or None if the name is unknown (or an ambiguous prefix)
+        """
+        key = concept_key(concept)
+        slug = self.keys.get(key)
+        if slug is None and prefix and key:
+            matches = self._prefix_slugs(key, 2)
+            slug = matches[0] if len(matches) == 1 else None
+        return slug
+
+    def lookup(self, concept: str) -> tuple:
+        """
+        Resolve a name as commands accept it: exact name or alias, then an unambiguous prefix.
+
+        Args:
+            concept: Name in any case, spacing or Unicode form
+
+        Returns:
+            Tuple of (slug or None, names of the concepts an ambiguous prefix matched)
+        """
+        key = concept_key(concept)
+        slug = self.keys.get(key)
+        if slug is not None or not key:
+            return slug, []
+        matches = self._prefix_slugs(key, MAX_SUGGESTIONS)
+        if len(matches) == 1:
+            return matches[0], []
+        return None, [self.names[slug] for slug in matches]
+
+    def name(self, slug: str) -> str:
+        """Canonical name of a concept."""
+        return self.names[slug]
+
+    def canonical(self, concept: str, prefix: bool = False) -> str:
+        """Canonical name for `concept`, or `concept` itself if it is unknown."""
+        slug = self.resolve(concept, prefix)
+        return self.names[slug] if slug is not None else concept
+
+    def suggestions(self, concept: str) -> list:
+        """Names of concepts starting with `concept`, for "did you mean" messages."""
+        key = concept_key(concept)
+        return [self.names[slug] for slug in self._prefix_slugs(key, MAX_SUGGESTIONS)] if key else []
+
+    def new_slug(self, concept: str) -> str:
+        """Slug for a new concept, suffixed with -2, -3, ... if another concept has it."""
+        base = concept_slug(concept)
+        slug, n = base, 1
+        while slug in self.names:
+            n += 1
+            slug = f"{base}-{n}"
+        return slug
+
+    def register(self, slug: str, concept: str) -> None:
+        """Add a concept under its slug."""
+        self.names[slug] = concept
+        key = concept_key(concept)
+        self.name_keys[key] = slug
+        self._set(key, slug)
+
+    def add_alias(self, alias: str, slug: str) -> str:
+        """
+        Make `alias` resolve to `slug`, unless it is another concept's name.
+
+        Returns:
+            The normalized alias
+        """
+        key = concept_key(alias)
+        if self.name_keys.get(key, slug) == slug:
+            self._set(key, slug)
+        return key
+
+    def _set(self, key: str, slug: str) -> None:
+        self.keys[key] = slug
+        if self._trie is not None:
+            self._insert(self._trie, key, slug)
+
+
+if __name__ == "__main__":
+    import sys
+
+    import cli_output
+    import concept_index
+    import learning_daemon
+    import learning_db
+    import storage
+
+    learning_daemon.forward(__file__)
+    cli_output.configure()
+
+    if len(sys.argv) < 4:
+        print("Usage:")
+        print("  Resolve a name: python3 concept_names.py resolve <topic_slug> <name>")
+        print("  Add an alias:   python3 concept_names.py alias <topic_slug> <alias> <concept>")
+        sys.exit(1)
+
+    command, topic = sys.argv[1], sys.argv[2]
+    topic_dir = Path(".learning") / topic
+    if not topic_dir.is_dir():
+        cli_output.emit({"status": "error", "error": f"Topic '{topic}' not found"})
+        sys.exit(1)
+
+    store = learning_db.open_store()
+    registry = learning_db.concept_registry(store, topic) if store is not None else concept_index.registry(topic_dir)
+
+    if command == "resolve":
+        slug, candidates = registry.lookup(sys.argv[3])
+        if candidates:
+            cli_output.emit({"status": "ambiguous", "name": sys.argv[3], "candidates": candidates})
+        elif slug is None:
+            cli_output.emit({"status": "not_found", "name": sys.argv[3], "suggestions": registry.suggestions(sys.argv[3])})
+        else:
+            cli_output.emit({"status": "success", "name": sys.argv[3], "concept": registry.name(slug), "slug": slug})
+    elif command == "alias" and len(sys.argv) >= 5:
+        slug = registry.resolve(sys.argv[4])
+        if slug is None:
+            cli_output.emit({"status": "error", "error": f"Concept '{sys.argv[4]}' not found",
+                             "suggestions": registry.suggestions(sys.argv[4])})
+            sys.exit(1)
+        key = concept_key(sys.argv[3])
+        if registry.name_keys.get(key, slug) != slug:
+            cli_output.emit({"status": "error", "error": f"'{sys.argv[3]}' is the name of another concept",
+                             "concept": registry.name(registry.name_keys[key])})
+            sys.exit(1)
+        if store is not None:
+            learning_db.add_alias(store, topic, key, slug)
+        else:
+            with storage.locked(topic_dir):
+                concept_index.add_alias(topic_dir, key, slug)
+        cli_output.emit({"status": "success", "alias": sys.argv[3], "concept": registry.name(slug), "slug": slug})
+    else:
+        print("❌ Invalid command or missing arguments")
+
+    if store is not None:
+        store.close()
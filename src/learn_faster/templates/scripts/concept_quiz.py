@@ -1,17 +1,34 @@
 #!/usr/bin/env python3
 """
-Generate quick conceptual multiple-choice quizzes based on least-reviewed concepts.
-Called after progress logging to reinforce learning.
+Generate quick conceptual multiple-choice quizzes on the concepts the learner
+is most likely to have forgotten. Called after progress logging to reinforce learning.
 """
 
-import json
 from pathlib import Path
-from datetime import datetime
 
+import catalog
+import cli_output
+import concept_index
+import learning_daemon
+import learning_db
+import recall
+import storage
+import syllabus
 
-def get_least_asked_concepts(topic_slug: str, limit: int = 3, base_dir: str = ".learning"):
+
+# Quiz target selection, set with "quiz_targets" in config.json
+QUIZ_TARGETS = ("recall", "least_reviewed")
+DEFAULT_QUIZ_TARGETS = "recall"
+
+
+def get_quiz_targets(topic_slug: str, limit: int = 3, base_dir: str = ".learning"):
     """
-    Get the least-asked concepts that need reinforcement.
+    Get the concepts most in need of a quiz.
+
+    By default these are the concepts with the lowest predicted recall, spread
+    across syllabus phases. With "quiz_targets": "least_reviewed" in
+    config.json they are the least reviewed concepts (see
+    concept_index.priority), read from the index without scoring every concept.
 
     Args:
         topic_slug: Slug of the topic
@@ -19,35 +36,55 @@ def get_least_asked_concepts(topic_slug: str, limit: int = 3, base_dir: str = ".
         base_dir: Base directory for learning data
 
     Returns:
-        List of concept dictionaries with review data
+        List of concept dictionaries with review data, predicted recall and phase
+
+    Raises:
+        ValueError: If config.json names an unknown quiz target selection
     """
-    topic_dir = Path(base_dir) / topic_slug
-    concepts_dir = topic_dir / "concepts"
+    targets = storage.load_json(Path(base_dir) / "config.json", {}).get("quiz_targets", DEFAULT_QUIZ_TARGETS)
+    if targets not in QUIZ_TARGETS:
+        raise ValueError(f"Unknown quiz targets '{targets}'. Choose from: {', '.join(QUIZ_TARGETS)}")
+    least_reviewed = targets == "least_reviewed"
 
-    if not concepts_dir.exists():
+    topic_dir = Path(base_dir) / topic_slug
+    store = learning_db.open_store(base_dir)
+    if store is not None:
+        if least_reviewed:
+            candidates = learning_db.least_reviewed_concepts(store, topic_slug, limit)
+        else:
+            candidates = learning_db.quiz_candidates(store, topic_slug)
+        store.close()
+    elif topic_dir.exists():
+        if least_reviewed:
+            candidates = concept_index.least_reviewed(topic_dir, limit)
+        else:
+            candidates = [{"slug": slug, **entry} for slug, entry in concept_index.load_index(topic_dir).items()]
+    else:
         return []
 
-    concepts = []
-    for concept_file in concepts_dir.glob("*.json"):
-        with open(concept_file, "r") as f:
-            data = json.load(f)
-            concepts.append({
-                "concept": data["concept"],
-                "slug": data["concept_slug"],
-                "review_count": data.get("review_count", 0),
-                "last_reviewed": data.get("last_reviewed"),
-                "learned_date": data.get("learned_date")
-            })
-
-    # Sort by review_count (ascending) then by learned_date (oldest first)
-    concepts.sort(key=lambda x: (x["review_count"], x["learned_date"]))
-
-    return concepts[:limit]
+    phases = recall.syllabus_phases(syllabus.load_tree(topic_dir), [entry["concept"] for entry in candidates])
+    if least_reviewed:
+        chosen = [
+            {**entry, "predicted_recall": round(predicted, 4), "phase": phases.get(entry["concept"])}
+            for entry, predicted in zip(candidates, recall.predicted_recall(candidates))
+        ]
+    else:
+        chosen = recall.choose_targets(candidates, limit, phases)
+    return [{
+        "concept": entry["concept"],
+        "slug": entry["slug"],
+        "phase": entry["phase"],
+        "predicted_recall": entry["predicted_recall"],
+        "review_count": entry["review_count"],
+        "quiz_accuracy": entry["quiz_accuracy"],
+        "last_reviewed": entry["last_reviewed"],
+        "learned_date": entry["learned_date"]
+    } for entry in chosen]
 
 
 def generate_quiz_directive(topic_slug: str, base_dir: str = ".learning"):
     """
-    Generate LLM directive for creating MC questions about least-asked concepts.
+    Generate LLM directive for creating MC questions about the weakest concepts.
 
     Args:
         topic_slug: Slug of the topic
@@ -56,7 +93,7 @@ def generate_quiz_directive(topic_slug: str, base_dir: str = ".learning"):
     Returns:
         JSON output with quiz directive for LLM
     """
-    concepts = get_least_asked_concepts(topic_slug, limit=3, base_dir=base_dir)
+    concepts = get_quiz_targets(topic_slug, limit=3, base_dir=base_dir)
 
     if not concepts:
         output = {
@@ -64,7 +101,7 @@ def generate_quiz_directive(topic_slug: str, base_dir: str = ".learning"):
             "quiz_needed": False,
             "llm_directive": "No concepts available for quiz. Continue with learning."
         }
-        print(json.dumps(output, indent=2))
+        cli_output.emit(output)
         return
 
     # Build directive for LLM
@@ -73,7 +110,7 @@ def generate_quiz_directive(topic_slug: str, base_dir: str = ".learning"):
     directive = f"""
 After logging progress, create a quick conceptual quiz using AskUserQuestion.
 
-Pick ONE concept from these least-reviewed concepts: {', '.join(concept_names)}
+Pick ONE concept from these concepts, weakest first (lowest predicted recall): {', '.join(concept_names)}
 
 Create a multiple-choice question that tests understanding (not memorization):
 - Question should test conceptual understanding
@@ -94,18 +131,18 @@ Example format for AskUserQuestion:
   ]
 }}
 
-After quiz, update the concept's quiz_count in .learning/{topic_slug}/concepts/[concept-slug].json
+After quiz, record the answer: python3 .learning/scripts/concept_quiz.py record {topic_slug} "<concept>" <true|false>
 """
 
     output = {
         "status": "quiz_ready",
         "quiz_needed": True,
-        "least_reviewed_concepts": concepts,
+        "quiz_targets": concepts,
         "llm_directive": directive.strip(),
         "suggested_prompt": f"Quick quiz time! Let's test your understanding of one of these: {', '.join(concept_names)}"
     }
 
-    print(json.dumps(output, indent=2))
+    cli_output.emit(output)
 
 
 def record_quiz_attempt(topic_slug: str, concept: str, correct: bool, base_dir: str = ".learning"):
@@ -119,39 +156,40 @@ def record_quiz_attempt(topic_slug: str, concept: str, correct: bool, base_dir:
         base_dir: Base directory for learning data
     """
     topic_dir = Path(base_dir) / topic_slug
-    concepts_dir = topic_dir / "concepts"
-
-    # Find the concept file
-    concept_slug = concept.lower().replace(" ", "-").replace("/", "-")
-    concept_file = concepts_dir / f"{concept_slug}.json"
-
-    if not concept_file.exists():
-        print(f"❌ Concept '{concept}' not found")
+    store = learning_db.open_store(base_dir)
+    if store is not None:
+        registry = learning_db.concept_registry(store, topic_slug)
+    else:
+        registry = concept_index.registry(topic_dir)
+
+    # Resolve the name, then an alias, then an unambiguous prefix to the concept's slug
+    concept_slug, candidates = registry.lookup(concept)
+    if concept_slug is None:
+        if store is not None:
+            store.close()
+        if candidates:
+            print(f"❌ '{concept}' matches several concepts: {', '.join(candidates)}. Use the full name.")
+            return False
+        suggestions = registry.suggestions(concept)
+        print(f"❌ Concept '{concept}' not found" + (f". Did you mean: {', '.join(suggestions)}?" if suggestions else ""))
         return False
-
-    with open(concept_file, "r") as f:
-        data = json.load(f)
-
-    # Update quiz history
-    if "quiz_history" not in data:
-        data["quiz_history"] = []
-
-    data["quiz_history"].append({
-        "timestamp": datetime.now().isoformat(),
-        "correct": correct
-    })
-
-    if "quiz_count" not in data:
-        data["quiz_count"] = 0
-    data["quiz_count"] += 1
-
-    if "quiz_correct_count" not in data:
-        data["quiz_correct_count"] = 0
-    if correct:
-        data["quiz_correct_count"] += 1
-
-    with open(concept_file, "w") as f:
-        json.dump(data, f, indent=2)
+    concept = registry.name(concept_slug)
+
+    if store is not None:
+        data = learning_db.record_quiz(store, topic_slug, concept_slug, correct)
+        store.close()
+        if data is None:
+            print(f"❌ Concept '{concept}' not found")
+            return False
+    else:
+        concept_file = topic_dir / concept_index.CONCEPTS_DIR / f"{concept_slug}.json"
+        with storage.locked(topic_dir):
+            data = storage.load_json(concept_file)
+            # Archive attempts that no longer fit before the document drops them
+            overflow = concept_index.record_attempt(data, correct)
+            concept_index.archive_attempts(topic_dir, concept_slug, overflow)
+            concept_index.save_concepts(topic_dir, [data])
+            catalog.touch(base_dir, topic_slug)
 
     accuracy = (data["quiz_correct_count"] / data["quiz_count"] * 100) if data["quiz_count"] > 0 else 0
 
@@ -161,29 +199,47 @@ def record_quiz_attempt(topic_slug: str, concept: str, correct: bool, base_dir:
         "correct": correct,
         "quiz_count": data["quiz_count"],
         "accuracy": round(accuracy, 1),
+        "recent_accuracy": round(data["quiz_ewma_accuracy"] * 100, 1),
+        "streak": data["quiz_streak"],
         "llm_directive": f"Quiz attempt recorded. {'Great job!' if correct else 'Keep practicing this concept.'}"
     }
 
-    print(json.dumps(output, indent=2))
+    cli_output.emit(output)
     return True
 
 
 if __name__ == "__main__":
     import sys
 
+    learning_daemon.forward(__file__)
+    cli_output.configure()
+
     if len(sys.argv) < 2:
         print("Usage:")
         print("  Generate quiz:  python3 concept_quiz.py generate <topic_slug>")
         print("  Record attempt: python3 concept_quiz.py record <topic_slug> <concept> <correct>")
+        print("  Rebuild index:  python3 concept_quiz.py reindex <topic_slug>")
         sys.exit(1)
 
     command = sys.argv[1]
 
     if command == "generate" and len(sys.argv) >= 3:
-        generate_quiz_directive(sys.argv[2])
+        try:
+            generate_quiz_directive(sys.argv[2])
+        except ValueError as e:
+            # Unknown "quiz_targets" in config.json
+            cli_output.emit({"status": "error", "error": str(e)})
+            sys.exit(1)
     elif command == "record" and len(sys.argv) >= 5:
         concept = sys.argv[3]
         correct = sys.argv[4].lower() in ['true', '1', 'yes']
         record_quiz_attempt(sys.argv[2], concept, correct)
+    elif command == "reindex" and len(sys.argv) >= 3:
+        topic_dir = Path(".learning") / sys.argv[2]
+        if not topic_dir.is_dir():
+            cli_output.emit({"status": "error", "error": f"Topic '{sys.argv[2]}' not found"})
+            sys.exit(1)
+        entries = concept_index.load_index(topic_dir, rebuild=True)
+        cli_output.emit({"status": "success", "concepts": len(entries)})
     else:
         print("❌ Invalid command or missing arguments")
@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Markdown tokenizer for exam papers, shared by the PDF and HTML renderers.
+
+`iter_blocks` reads lines once, in order, and yields block nodes as soon as
+they are complete; inline markup in each block is tokenized with a single
+precompiled pattern. Renderers only walk the resulting tree, so every
+backend sees the same structure and nothing is re-parsed.
+
+Blocks are dicts with a "type":
+
+    {"type": "heading", "level": 2, "inlines": [...]}
+    {"type": "paragraph", "inlines": [...]}        lines joined by breaks
+    {"type": "rule"}                               --- or ***
+    {"type": "code", "lang": "python", "text": "..."}
+    {"type": "list", "ordered": True, "start": 1,
+     "items": [{"depth": 0, "ordered": True, "checked": None, "inlines": [...]}]}
+    {"type": "table", "align": [None, "center"], "header": [[...], [...]],
+     "rows": [[[...], [...]]]}
+    {"type": "quote", "inlines": [...]}
+
+Inlines are tuples: ("text", str), ("strong", [...]), ("em", [...]),
+("code", str), ("blank", length) for ___ answer lines, ("link", [...], url)
+and ("break",). Link URLs may contain balanced parentheses, one level deep
+(e.g. https://en.wikipedia.org/wiki/Heap_(data_structure)).
+
+Exam conventions differ from CommonMark in two places: line breaks inside
+a paragraph are kept (answer options are usually one per line), and a line
+of underscores is an answer line rather than a rule.
+"""
+
+import re
+from html import escape
+
+
+FENCE = re.compile(r"^ {0,3}(`{3,}|~{3,})\s*([^`\s]*)")
+HEADING = re.compile(r"^ {0,3}(#{1,6})(?:\s+(.*?))?(?:\s+#+)?\s*$")
+RULE = re.compile(r"^ {0,3}([-*])(?:\s*\1){2,}\s*$")
+LIST_ITEM = re.compile(r"^(\s*)([-*+]|\d{1,9}[.)])\s+(.*)$")
+TASK = re.compile(r"^\[([ xX])\]\s+(.*)$")
+QUOTE = re.compile(r"^ {0,3}>\s?(.*)$")
+TABLE_DELIMITER = re.compile(r"^\s*\|?\s*:?-+:?\s*(?:\|\s*:?-+:?\s*)*\|?\s*$")
+
+INLINE = re.compile(r"""
+    (?P<code_fence>`+)(?P<code>.+?)(?P=code_fence)
+  | (?P<blank>_{3,})
+  | \[(?P<link_text>[^\]\n]+)\]\((?P<link_url>(?:[^()\s]|\([^()\s]*\))+)\)
+  | \*\*(?P<strong>\S(?:.*?\S)?)\*\*
+  | (?<!\w)__(?P<strong_u>\S(?:.*?\S)?)__(?!\w)
+  | \*(?P<em>[^\s*](?:.*?[^\s*])?)\*
+  | (?<!\w)_(?P<em_u>[^\s_](?:.*?[^\s_])?)_(?!\w)
+  | \\(?P<escaped>[\\`*_\[\](){}#+\-.!|>])
+""", re.VERBOSE)
+
+# Spaces of indentation per list nesting level
+LIST_INDENT = 2
+
+
+def parse_inline(text: str) -> list:
+    """
+    Tokenize inline markup.
+
+    Args:
+        text: One line (or table cell) of markdown
+
+    Returns:
+        Inline nodes; adjacent text is merged
+    """
+    nodes = []
+    position = 0
+    for match in INLINE.finditer(text):
+        if match.start() > position:
+            _append_text(nodes, text[position:match.start()])
+        kind = match.lastgroup
+        if kind == "code":
+            nodes.append(("code", match.group("code").strip()))
+        elif kind == "blank":
+            nodes.append(("blank", len(match.group("blank"))))
+        elif kind == "link_url":
+            nodes.append(("link", parse_inline(match.group("link_text")), match.group("link_url")))
+        elif kind in ("strong", "strong_u"):
+            nodes.append(("strong", parse_inline(match.group(kind))))
+        elif kind in ("em", "em_u"):
+            nodes.append(("em", parse_inline(match.group(kind))))
+        else:
+            _append_text(nodes, match.group("escaped"))
+        position = match.end()
+    if position < len(text):
+        _append_text(nodes, text[position:])
+    return nodes
+
+
+def _append_text(nodes: list, text: str) -> None:
+    if nodes and nodes[-1][0] == "text":
+        nodes[-1] = ("text", nodes[-1][1] + text)
+    else:
+        nodes.append(("text", text))
+
+
+def _join_lines(lines: list) -> list:
+    """Inline nodes of several lines, separated by breaks."""
+    nodes = []
+    for line in lines:
+        if nodes:
+            nodes.append(("break",))
+        nodes.extend(parse_inline(line))
+    return nodes
+
+
+def _split_row(line: str) -> list:
+    row = line.strip()
+    if row.startswith("|"):
+        row = row[1:]
+    if row.endswith("|") and not row.endswith("\\|"):
+        row = row[:-1]
+    return [cell.strip().replace("\\|", "|") for cell in re.split(r"(?<!\\)\|", row)]
+
+
+def _alignment(cell: str):
+    left, right = cell.startswith(":"), cell.endswith(":")
+    return "center" if left and right else "right" if right else "left" if left else None
+
+
+def iter_blocks(lines):
+    """
+    Tokenize markdown into block nodes in a single pass.
+
+    Args:
+        lines: Iterable of lines (a file object, or text.splitlines())
+
+    Yields:
+        Block nodes (see the module docstring), in document order
+    """
+    paragraph = []
+    quote = []
+    items = None
+    ordered = False
+    start = None
+    table = None
+    fence = None
+    code = []
+    lang = ""
+
+    def flush():
+        nonlocal items, table
+        blocks = []
+        if paragraph:
+            blocks.append({"type": "paragraph", "inlines": _join_lines(paragraph)})
+            paragraph.clear()
+        if quote:
+            blocks.append({"type": "quote", "inlines": _join_lines(quote)})
+            quote.clear()
+        if items:
+            blocks.append({"type": "list", "ordered": ordered, "start": start, "items": items})
+        items = None
+        if table is not None:
+            blocks.append(table)
+            table = None
+        return blocks
+
+    for raw in lines:
+        line = raw.rstrip("\r\n")
+
+        if fence is not None:
+            if line.strip().startswith(fence) and not line.strip().strip(fence[0]):
+                yield {"type": "code", "lang": lang, "text": "\n".join(code)}
+                fence = None
+                code = []
+            else:
+                code.append(line)
+            continue
+
+        if not line.strip():
+            yield from flush()
+            continue
+
+        match = FENCE.match(line)
+        if match:
+            yield from flush()
+            fence, lang = match.group(1), match.group(2)
+            continue
+
+        if table is not None:
+            if "|" in line:
+                cells = [parse_inline(cell) for cell in _split_row(line)]
+                width = len(table["header"])
+                table["rows"].append((cells + [[] for _ in range(width)])[:width])
+                continue
+            yield from flush()
+
+        match = HEADING.match(line)
+        if match:
+            yield from flush()
+            yield {"type": "heading", "level": len(match.group(1)), "inlines": parse_inline(match.group(2) or "")}
+            continue
+
+        if RULE.match(line):
+            yield from flush()
+            yield {"type": "rule"}
+            continue
+
+        match = QUOTE.match(line)
+        if match:
+            if not quote:
+                yield from flush()
+            quote.append(match.group(1))
+            continue
+        if quote:
+            yield from flush()
+
+        match = LIST_ITEM.match(line)
+        if match:
+            indent, marker, text = match.groups()
+            is_ordered = marker[0].isdigit()
+            if paragraph or (items and indent == "" and is_ordered != ordered):
+                yield from flush()
+            if items is None:
+                items, ordered = [], is_ordered
+                start = int(marker[:-1]) if is_ordered else None
+            task = TASK.match(text)
+            item = {
+                "depth": len(indent.expandtabs(4)) // LIST_INDENT,
+                "ordered": is_ordered,
+                "checked": (task.group(1) != " ") if task else None,
+                "inlines": parse_inline(task.group(2) if task else text)
+            }
+            items.append(item)
+            continue
+
+        if items:
+            if raw[:1].isspace():
+                # Indented continuation of the last item
+                items[-1]["inlines"].extend([("break",)] + parse_inline(line.strip()))
+                continue
+            yield from flush()
+
+        if paragraph and TABLE_DELIMITER.match(line) and "|" in paragraph[-1] and "|" in line:
+            header = paragraph.pop()
+            yield from flush()
+            cells = _split_row(header)
+            align = [_alignment(cell) for cell in _split_row(line)]
+            table = {
+                "type": "table",
+                "align": (align + [None] * len(cells))[:len(cells)],
+                "header": [parse_inline(cell) for cell in cells],
+                "rows": []
+            }
+            continue
+
+        paragraph.append(line.strip())
+
+    if fence is not None:
+        # Unclosed fence: the rest of the file is code
+        yield {"type": "code", "lang": lang, "text": "\n".join(code)}
+    yield from flush()
+
+
+def parse(text: str) -> list:
+    """Tokenize a whole markdown document into block nodes."""
+    return list(iter_blocks(text.splitlines()))
+
+
+def plain_text(inlines: list) -> str:
+    """Text of inline nodes without markup (e.g. for titles)."""
+    parts = []
+    for node in inlines:
+        kind = node[0]
+        if kind in ("text", "code"):
+            parts.append(node[1])
+        elif kind == "blank":
+            parts.append("_" * node[1])
+        elif kind == "break":
+            parts.append(" ")
+        else:
+            parts.append(plain_text(node[1]))
+    return "".join(parts)
+
+
+def _safe_url(url: str) -> str:
+    return "#" if url.strip().lower().startswith(("javascript:", "data:", "vbscript:")) else url
+
+
+def inline_html(inlines: list) -> str:
+    """Render inline nodes as HTML."""
+    parts = []
+    for node in inlines:
+        kind = node[0]
+        if kind == "text":
+            parts.append(escape(node[1], quote=False))
+        elif kind == "strong":
+            parts.append(f"<strong>{inline_html(node[1])}</strong>")
+        elif kind == "em":
+            parts.append(f"<em>{inline_html(node[1])}</em>")
+        elif kind == "code":
+            parts.append(f"<code>{escape(node[1], quote=False)}</code>")
+        elif kind == "blank":
+            parts.append('<span class="blank-line">_________________</span>')
+        elif kind == "link":
+            parts.append(f'<a href="{escape(_safe_url(node[2]))}">{inline_html(node[1])}</a>')
+        else:
+            parts.append("<br>\n")
+    return "".join(parts)
+
+
+def inline_markup(inlines: list) -> str:
+    """Render inline nodes as reportlab paragraph markup."""
+    parts = []
+    for node in inlines:
+        kind = node[0]
+        if kind == "text":
+            parts.append(escape(node[1], quote=False))
+        elif kind == "strong":
+            parts.append(f"<b>{inline_markup(node[1])}</b>")
+        elif kind == "em":
+            parts.append(f"<i>{inline_markup(node[1])}</i>")
+        elif kind == "code":
+            parts.append(f'<font face="Courier">{escape(node[1], quote=False)}</font>')
+        elif kind == "blank":
+            parts.append("_" * max(node[1], 17))
+        elif kind == "link":
+            parts.append(f'<a href="{escape(_safe_url(node[2]))}" color="blue">{inline_markup(node[1])}</a>')
+        else:
+            parts.append("<br/>")
+    return "".join(parts)
+
+
+def _html_list(block: dict):
+    start = block["start"]
+    tags = ["ol" if block["ordered"] else "ul"]
+    yield f'<ol start="{start}">' if block["ordered"] and start not in (None, 1) else f"<{tags[0]}>"
+    for i, item in enumerate(block["items"]):
+        # Nest at most one level deeper than the previous item
+        depth = min(item["depth"], len(tags))
+        if i:
+            if depth == len(tags):
+                tags.append("ol" if item["ordered"] else "ul")
+                yield f"\n<{tags[-1]}>"
+            else:
+                yield "</li>"
+                while len(tags) > depth + 1:
+                    yield f"</{tags.pop()}></li>"
+        checkbox = ""
+        if item["checked"] is not None:
+            checkbox = f'<span class="checkbox">{"☑" if item["checked"] else "☐"}</span> '
+        yield f"\n<li>{checkbox}{inline_html(item['inlines'])}"
+    yield "</li>"
+    while len(tags) > 1:
+        yield f"</{tags.pop()}></li>"
+    yield f"\n</{tags[0]}>\n"
+
+
+def _html_table(block: dict):
+    def cells(row, tag):
+        return "".join(
+            f'<{tag} style="text-align: {align}">{inline_html(cell)}</{tag}>' if align else
+            f"<{tag}>{inline_html(cell)}</{tag}>"
+            for cell, align in zip(row, block["align"])
+        )
+
+    yield f"<table>\n<thead><tr>{cells(block['header'], 'th')}</tr></thead>\n<tbody>\n"
+    for row in block["rows"]:
+        yield f"<tr>{cells(row, 'td')}</tr>\n"
+    yield "</tbody>\n</table>\n"
+
+
+def html_chunks(blocks):
+    """
+    Render block nodes as HTML, one chunk at a time.
+
+    Args:
+        blocks: Block nodes, e.g. straight from `iter_blocks`
+
+    Yields:
+        HTML fragments to be written out in order
+    """
+    for block in blocks:
+        kind = block["type"]
+        if kind == "heading":
+            yield f"<h{block['level']}>{inline_html(block['inlines'])}</h{block['level']}>\n"
+        elif kind == "paragraph":
+            yield f"<p>{inline_html(block['inlines'])}</p>\n"
+        elif kind == "rule":
+            yield "<hr>\n"
+        elif kind == "code":
+            lang = f' class="language-{escape(block["lang"])}"' if block["lang"] else ""
+            yield f"<pre><code{lang}>{escape(block['text'], quote=False)}</code></pre>\n"
+        elif kind == "list":
+            yield from _html_list(block)
+        elif kind == "table":
+            yield from _html_table(block)
+        elif kind == "quote":
+            yield f"<blockquote><p>{inline_html(block['inlines'])}</p></blockquote>\n"
@@ -1,40 +1,251 @@
 #!/usr/bin/env python3
 """
-Convert exam markdown files to professional PDF documents using reportlab.
+Convert exam markdown files to professional PDF documents using reportlab,
+or to self-contained, print-ready HTML.
+
+--format pdf needs reportlab; --format html never imports it and streams
+the page to disk as the markdown is parsed. The default, auto, writes a PDF
+when reportlab is installed and falls back to HTML otherwise. --answers
+separate moves an answer key section ("Answer Key", "Answers", "Marking
+Scheme", ...) into <name>-ANSWERS.html; --answers omit leaves it out.
+
+Rendered files are recorded in a per-directory cache manifest,
+<dir>/.exam_render_cache.json:
+
+    {"v": 2, "files": {"exam-x.md:pdf": {"sha256": "...", "renderer": 2,
+     "answers": "include", "outputs": {"exam-x.pdf": [size, mtime_ns]}}}}
+
+A markdown file whose content hash, options and RENDERER_VERSION match its
+entry, and whose outputs are still the ones written, is not rendered again.
+`batch` renders a directory or glob of exam files across a process pool, so
+regenerating a practice set only costs the papers that changed.
 """
 
-import sys
-import json
+import os
 import re
+import sys
+import glob
+import time
+import hashlib
+from html import escape
 from pathlib import Path
 from datetime import datetime
 
+import cli_output
+import exam_markdown
+import storage
+
+
+# Bump whenever the rendered output changes, so cached PDFs are rebuilt
+RENDERER_VERSION = 2
+
+CACHE_FILE = ".exam_render_cache.json"
+CACHE_VERSION = 2
+
+FORMATS = ("auto", "pdf", "html")
+ANSWER_MODES = ("include", "separate", "omit")
+
+# Headings (level 1 or 2) that start an exam's answer key
+ANSWER_HEADING = re.compile(r"^\W*(answer key|answers|marking scheme|mark scheme|model answers|solutions)\b",
+                            re.IGNORECASE)
 
-def generate_pdf_reportlab(markdown_path: Path, pdf_path: Path) -> bool:
+REPORTLAB_MISSING = {
+    "status": "error",
+    "error": "PDF generation library not available.",
+    "llm_directive": "Inform user to install reportlab.",
+    "suggested_response": "❌ PDF library not installed.\n\n💡 Install with: uv pip install reportlab"
+                          "\n   or create a printable HTML version with --format html"
+}
+
+# Paragraph styles, built once per process by _pdf_styles
+_styles = None
+
+
+def _pdf_styles() -> dict:
+    """Build the reportlab paragraph styles on first use and reuse them for every file."""
+    global _styles
+    if _styles is None:
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.enums import TA_CENTER
+        from reportlab.lib.units import cm
+
+        styles = getSampleStyleSheet()
+        _styles = {
+            "title": ParagraphStyle(
+                'CustomTitle',
+                parent=styles['Heading1'],
+                fontSize=18,
+                alignment=TA_CENTER,
+                spaceAfter=20
+            ),
+            "heading": ParagraphStyle(
+                'CustomHeading',
+                parent=styles['Heading2'],
+                fontSize=14,
+                spaceAfter=10,
+                spaceBefore=15
+            ),
+            "subheading": ParagraphStyle(
+                'CustomSubheading',
+                parent=styles['Heading3'],
+                fontSize=12,
+                spaceAfter=6,
+                spaceBefore=10
+            ),
+            "normal": ParagraphStyle(
+                'ExamBody',
+                parent=styles['Normal'],
+                spaceAfter=0.3*cm
+            ),
+            "list_item": ParagraphStyle(
+                'ExamListItem',
+                parent=styles['Normal'],
+                spaceAfter=0.1*cm
+            ),
+            "quote": ParagraphStyle(
+                'ExamQuote',
+                parent=styles['Normal'],
+                leftIndent=1*cm,
+                textColor='#444444',
+                spaceAfter=0.3*cm
+            ),
+            "cell": styles['Normal'],
+            "code": ParagraphStyle(
+                'ExamCode',
+                parent=styles['Code'],
+                spaceAfter=0.3*cm
+            )
+        }
+    return _styles
+
+
+def _list_flowables(block: dict, styles: dict) -> list:
+    """One bulleted or numbered paragraph per list item, indented by nesting depth."""
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.lib.units import cm
+    from reportlab.platypus import Paragraph
+
+    flowables = []
+    counters = []
+    for item in block["items"]:
+        depth = min(item["depth"], len(counters))
+        del counters[depth + 1:]
+        if depth == len(counters):
+            counters.append((block["start"] or 1) - 1 if depth == 0 else 0)
+        counters[depth] += 1
+
+        if item["checked"] is not None:
+            bullet = "[x]" if item["checked"] else "[ ]"
+        else:
+            bullet = f"{counters[depth]}." if item["ordered"] else "•"
+        style = styles.get(f"list_item_{depth}")
+        if style is None:
+            style = styles[f"list_item_{depth}"] = ParagraphStyle(
+                f"ExamListItem{depth}",
+                parent=styles["list_item"],
+                leftIndent=(depth + 1) * 0.8*cm,
+                bulletIndent=depth * 0.8*cm + 0.2*cm
+            )
+        flowables.append(Paragraph(exam_markdown.inline_markup(item["inlines"]), style, bulletText=bullet))
+    return flowables
+
+
+def _table_flowable(block: dict, styles: dict):
+    from reportlab.platypus import Paragraph, Table, TableStyle
+
+    alignments = {"left": "LEFT", "center": "CENTER", "right": "RIGHT"}
+    data = [[Paragraph(f"<b>{exam_markdown.inline_markup(cell)}</b>", styles["cell"]) for cell in block["header"]]]
+    data += [[Paragraph(exam_markdown.inline_markup(cell), styles["cell"]) for cell in row] for row in block["rows"]]
+    commands = [
+        ('GRID', (0, 0), (-1, -1), 0.5, '#666666'),
+        ('BACKGROUND', (0, 0), (-1, 0), '#EEEEEE'),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ]
+    for column, align in enumerate(block["align"]):
+        if align:
+            commands.append(('ALIGN', (column, 0), (column, -1), alignments[align]))
+    table = Table(data, repeatRows=1, hAlign='LEFT')
+    table.setStyle(TableStyle(commands))
+    return table
+
+
+def pdf_flowables(blocks) -> list:
+    """
+    Turn parsed exam markdown (see exam_markdown.py) into reportlab flowables.
+
+    Args:
+        blocks: Block nodes, e.g. straight from exam_markdown.iter_blocks
+
+    Returns:
+        Flowables for SimpleDocTemplate.build
+    """
+    from reportlab.lib.units import cm
+    from reportlab.platypus import Paragraph, Spacer, Preformatted
+    from reportlab.platypus.flowables import HRFlowable
+
+    styles = _pdf_styles()
+    heading_styles = {1: styles["title"], 2: styles["heading"]}
+    story = []
+    for block in blocks:
+        kind = block["type"]
+        if kind == "heading":
+            style = heading_styles.get(block["level"], styles["subheading"])
+            story.append(Paragraph(exam_markdown.inline_markup(block["inlines"]), style))
+        elif kind == "paragraph":
+            story.append(Paragraph(exam_markdown.inline_markup(block["inlines"]), styles["normal"]))
+        elif kind == "rule":
+            story.append(HRFlowable(width="100%", thickness=0.5, color='#666666',
+                                    spaceBefore=0.25*cm, spaceAfter=0.25*cm))
+        elif kind == "code":
+            story.append(Preformatted(block["text"], styles["code"]))
+        elif kind == "list":
+            story.extend(_list_flowables(block, styles))
+            story.append(Spacer(1, 0.2*cm))
+        elif kind == "table":
+            story.append(_table_flowable(block, styles))
+            story.append(Spacer(1, 0.3*cm))
+        elif kind == "quote":
+            story.append(Paragraph(exam_markdown.inline_markup(block["inlines"]), styles["quote"]))
+    return story
+
+
+def generate_pdf_reportlab(markdown_path: Path, pdf_path: Path, answers: str = "include"):
     """
     Generate PDF using reportlab (simple, no system dependencies).
 
     Args:
         markdown_path: Path to markdown file
         pdf_path: Output PDF path
+        answers: "include" the answer key (on a new page), write it to a
+            "separate" -ANSWERS file, or "omit" it
 
     Returns:
-        True if successful
+        Paths of the PDFs written, or False if reportlab is not installed
     """
     try:
         from reportlab.lib.pagesizes import A4
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
         from reportlab.lib.units import cm
-        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
-        from reportlab.lib.enums import TA_CENTER, TA_LEFT
+        from reportlab.platypus import SimpleDocTemplate, PageBreak
+    except ImportError:
+        return False
 
-        # Read markdown
-        with open(markdown_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+    # Parse the markdown as it is read and build content, sorting it into exam and answer key
+    stories = {pdf_path: []}
+    story = stories[pdf_path]
+    with open(markdown_path, 'r', encoding='utf-8') as f:
+        for block, in_answers, starts in _route_answers(exam_markdown.iter_blocks(f)):
+            if in_answers and answers == "omit":
+                continue
+            if starts and answers == "separate":
+                story = stories.setdefault(answer_key_path(pdf_path), [])
+            elif starts:
+                story.append(PageBreak())
+            story.extend(pdf_flowables((block,)))
 
+    for path, story in stories.items():
         # Create PDF
         doc = SimpleDocTemplate(
-            str(pdf_path),
+            str(path),
             pagesize=A4,
             rightMargin=2*cm,
             leftMargin=2*cm,
@@ -42,106 +253,17 @@ def generate_pdf_reportlab(markdown_path: Path, pdf_path: Path) -> bool:
             bottomMargin=2*cm
         )
 
-        # Styles
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=18,
-            alignment=TA_CENTER,
-            spaceAfter=20
-        )
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=14,
-            spaceAfter=10,
-            spaceBefore=15
-        )
-        normal_style = styles['Normal']
-
-        # Build content
-        story = []
-        lines = content.split('\n')
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                story.append(Spacer(1, 0.3*cm))
-                continue
-
-            # Title
-            if line.startswith('# '):
-                text = line[2:]
-                story.append(Paragraph(text, title_style))
-
-            # Section heading
-            elif line.startswith('## '):
-                text = line[3:]
-                story.append(Paragraph(text, heading_style))
-
-            # Horizontal rule
-            elif line == '---':
-                story.append(Spacer(1, 0.5*cm))
-
-            # Regular text
-            else:
-                # Simple bold conversion - properly match pairs
-                text = re.sub(r'\*\*([^\*]+)\*\*', r'<b>\1</b>', line)
-                story.append(Paragraph(text, normal_style))
-
         # Generate PDF
         doc.build(story)
-        return True
-
-    except ImportError:
-        return False
+    return list(stories)
 
 
-def markdown_to_html(markdown_text: str, title: str) -> str:
-    """
-    Convert markdown to HTML with exam paper styling (fallback).
-
-    Args:
-        markdown_text: Markdown content
-        title: Document title
-
-    Returns:
-        HTML string with embedded CSS
-    """
-    import re
-    html_content = markdown_text
-
-    # Convert headers
-    html_content = html_content.replace('# ', '<h1>')
-    html_content = html_content.replace('\n## ', '</h1>\n<h2>')
-    html_content = html_content.replace('\n### ', '</h2>\n<h3>')
-
-    # Convert bold and italic
-    html_content = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', html_content)
-    html_content = re.sub(r'\*(.+?)\*', r'<em>\1</em>', html_content)
-
-    # Convert horizontal rules
-    html_content = html_content.replace('\n---\n', '\n<hr>\n')
-
-    # Convert underscores to input lines
-    html_content = re.sub(r'_{3,}', '<span class="blank-line">_________________</span>', html_content)
-
-    # Wrap in paragraphs
-    lines = html_content.split('\n')
-    processed_lines = []
-    for line in lines:
-        line = line.strip()
-        if line and not line.startswith('<') and not line == '':
-            processed_lines.append(f'<p>{line}</p>')
-        else:
-            processed_lines.append(line)
-
-    html_content = '\n'.join(processed_lines)
+def html_head(title: str) -> str:
+    """Start of a self-contained HTML exam page, up to and including <body>."""
+    title = escape(title)
 
     # Professional exam paper CSS
-    html = f"""
-<!DOCTYPE html>
+    return f"""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
@@ -228,25 +350,361 @@ def markdown_to_html(markdown_text: str, title: str) -> str:
         }}
 
         /* Question spacing */
-        p:contains("**") {{
+        p:has(> strong:first-child) {{
             margin-top: 0.5cm;
         }}
+
+        code, pre {{
+            font-family: 'Courier New', Courier, monospace;
+            font-size: 10pt;
+        }}
+
+        pre {{
+            background: #f5f5f5;
+            border: 1px solid #ccc;
+            padding: 0.3cm;
+            white-space: pre-wrap;
+            page-break-inside: avoid;
+        }}
+
+        table {{
+            border-collapse: collapse;
+            margin: 0.3cm 0;
+        }}
+
+        th, td {{
+            border: 1px solid #666;
+            padding: 0.1cm 0.25cm;
+            vertical-align: top;
+        }}
+
+        th {{
+            background: #eee;
+        }}
+
+        blockquote {{
+            margin: 0.3cm 0 0.3cm 1cm;
+            color: #444;
+        }}
+
+        li {{
+            margin: 0.1cm 0;
+        }}
+
+        .checkbox {{
+            font-family: 'DejaVu Sans', 'Segoe UI Symbol', sans-serif;
+        }}
+
+        @media screen {{
+            body {{
+                max-width: 17cm;
+                margin: 1cm auto;
+                padding: 0 1cm;
+            }}
+        }}
+
+        @media print {{
+            a {{
+                color: inherit;
+                text-decoration: none;
+            }}
+
+            h1, h2, h3 {{
+                break-after: avoid;
+            }}
+        }}
     </style>
 </head>
 <body>
-{html_content}
-</body>
-</html>
 """
-    return html
 
 
-def generate_pdf(markdown_path: str) -> bool:
+HTML_FOOT = "</body>\n</html>\n"
+
+
+def markdown_to_html(markdown_text: str, title: str) -> str:
     """
-    Generate PDF from markdown exam file.
+    Convert markdown to HTML with exam paper styling.
+
+    Args:
+        markdown_text: Markdown content
+        title: Document title
+
+    Returns:
+        HTML string with embedded CSS
+    """
+    blocks = exam_markdown.iter_blocks(markdown_text.splitlines())
+    return html_head(title) + "".join(exam_markdown.html_chunks(blocks)) + HTML_FOOT
+
+
+def answer_key_path(path: Path) -> Path:
+    """Where the separated answer key of an exam output goes (exam.html -> exam-ANSWERS.html)."""
+    return path.with_name(f"{path.stem}-ANSWERS{path.suffix}")
+
+
+def _is_answer_heading(block: dict) -> bool:
+    return (block["type"] == "heading" and block["level"] <= 2
+            and ANSWER_HEADING.match(exam_markdown.plain_text(block["inlines"])) is not None)
+
+
+def _route_answers(blocks):
+    """
+    Tag blocks with whether they belong to the exam's answer key.
+
+    The answer key starts at the first answer heading after the exam's own
+    content, so a file that is nothing but an answer key stays one document.
+
+    Yields:
+        (block, in_answers, starts_answers) tuples
+    """
+    seen_content = in_answers = False
+    for block in blocks:
+        starts = not in_answers and seen_content and _is_answer_heading(block)
+        in_answers = in_answers or starts
+        seen_content = seen_content or block["type"] != "heading" or block["level"] > 1
+        yield block, in_answers, starts
+
+
+def write_html(markdown_path: Path, html_path: Path, answers: str = "include") -> list:
+    """
+    Stream an exam to a print-ready HTML file while its markdown is parsed.
+
+    Only the block being rendered is held in memory. Files are written under
+    temporary names and renamed into place when complete.
 
     Args:
         markdown_path: Path to markdown file
+        html_path: Output HTML path
+        answers: "include" the answer key (after a page break), write it to
+            a "separate" -ANSWERS file, or "omit" it
+
+    Returns:
+        Paths of the files written
+    """
+    title = markdown_path.stem
+    outputs = {}
+
+    def output(path: Path, page_title: str):
+        if path not in outputs:
+            tmp_path = path.with_name(f".{path.name}.tmp")
+            f = open(tmp_path, "w", encoding="utf-8")
+            f.write(html_head(page_title))
+            outputs[path] = (f, tmp_path)
+        return outputs[path][0]
+
+    try:
+        with open(markdown_path, "r", encoding="utf-8") as md:
+            out = output(html_path, title)
+            for block, in_answers, starts in _route_answers(exam_markdown.iter_blocks(md)):
+                if in_answers and answers == "omit":
+                    continue
+                if starts and answers == "separate":
+                    out = output(answer_key_path(html_path), f"{title} - Answer Key")
+                elif starts:
+                    out.write('<div class="page-break"></div>\n')
+                for chunk in exam_markdown.html_chunks((block,)):
+                    out.write(chunk)
+        for f, tmp_path in outputs.values():
+            f.write(HTML_FOOT)
+            f.close()
+        for path, (f, tmp_path) in outputs.items():
+            os.replace(tmp_path, path)
+    except BaseException:
+        for f, tmp_path in outputs.values():
+            f.close()
+            tmp_path.unlink(missing_ok=True)
+        raise
+    return list(outputs)
+
+
+def content_hash(path: Path) -> str:
+    """SHA-256 of a file's contents."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def load_cache(directory: Path) -> dict:
+    """Load a directory's render cache manifest (empty if missing or from another version)."""
+    cache = storage.load_json(Path(directory) / CACHE_FILE, {})
+    if not isinstance(cache, dict) or cache.get("v") != CACHE_VERSION:
+        cache = {"v": CACHE_VERSION, "files": {}}
+    cache.setdefault("files", {})
+    return cache
+
+
+def _cache_key(md_path: Path, fmt: str) -> str:
+    return f"{md_path.name}:{fmt}"
+
+
+def is_cached(cache: dict, md_path: Path, digest: str, fmt: str = "pdf", answers: str = "include") -> bool:
+    """Whether md_path was rendered from this content with these options by this renderer, and its outputs are still in place."""
+    entry = cache["files"].get(_cache_key(md_path, fmt))
+    if (not entry or entry.get("sha256") != digest or entry.get("renderer") != RENDERER_VERSION
+            or entry.get("answers") != answers or not entry.get("outputs")):
+        return False
+    for name, (size, mtime_ns) in entry["outputs"].items():
+        try:
+            stat = (md_path.parent / name).stat()
+        except OSError:
+            return False
+        if stat.st_size != size or stat.st_mtime_ns != mtime_ns:
+            return False
+    return True
+
+
+def record_render(cache: dict, md_path: Path, outputs: list, digest: str, fmt: str = "pdf",
+                  answers: str = "include") -> None:
+    """Add a freshly rendered file and its output files to a cache manifest."""
+    cache["files"][_cache_key(md_path, fmt)] = {
+        "sha256": digest,
+        "renderer": RENDERER_VERSION,
+        "answers": answers,
+        "outputs": {path.name: [path.stat().st_size, path.stat().st_mtime_ns] for path in map(Path, outputs)}
+    }
+
+
+def reportlab_available() -> bool:
+    """Whether reportlab can be imported, without importing it."""
+    import importlib.util
+    return importlib.util.find_spec("reportlab") is not None
+
+
+def resolve_format(fmt: str) -> str:
+    """Turn "auto" into "pdf" if reportlab is installed, "html" otherwise."""
+    if fmt == "auto":
+        return "pdf" if reportlab_available() else "html"
+    return fmt
+
+
+def render(md_path: Path, fmt: str, answers: str = "include") -> list:
+    """
+    Render one exam next to its markdown file.
+
+    Args:
+        md_path: Path to markdown file
+        fmt: "pdf" or "html"
+        answers: "include", "separate" or "omit" the answer key
+
+    Returns:
+        Paths of the files written
+
+    Raises:
+        ImportError: If fmt is "pdf" and reportlab is not installed
+    """
+    if fmt == "html":
+        return write_html(md_path, md_path.with_suffix(".html"), answers)
+    outputs = generate_pdf_reportlab(md_path, md_path.with_suffix(".pdf"), answers)
+    if outputs is False:
+        raise ImportError("reportlab is not installed")
+    return outputs
+
+
+def _render(task: tuple) -> dict:
+    """Render one (markdown path, format, answers) task (run in batch worker processes)."""
+    markdown_path, fmt, answers = task
+    try:
+        outputs = render(Path(markdown_path), fmt, answers)
+    except Exception as e:
+        return {"markdown_path": markdown_path, "status": "failed", "error": f"{type(e).__name__}: {e}"}
+    return {"markdown_path": markdown_path, "status": "rendered", "outputs": [str(path) for path in outputs]}
+
+
+def exam_files(target: str) -> list:
+    """
+    Find the exam markdown files to render.
+
+    Args:
+        target: A directory (its *.md files), a glob pattern (** recurses) or a single file
+
+    Returns:
+        Sorted markdown file paths
+    """
+    path = Path(target)
+    if path.is_dir():
+        files = path.glob("*.md")
+    elif path.is_file():
+        files = [path]
+    else:
+        files = (Path(match) for match in glob.glob(target, recursive=True))
+    return sorted(path for path in files if path.suffix.lower() == ".md" and path.is_file())
+
+
+def batch(target: str, jobs: int = None, force: bool = False, fmt: str = "auto", answers: str = "include") -> dict:
+    """
+    Render many exam files, skipping those whose cached output is up to date.
+
+    Args:
+        target: Directory, glob pattern or file (see `exam_files`)
+        jobs: Worker processes (default: one per CPU, at most one per file to render)
+        force: Render every file even if its cache entry matches
+        fmt: "auto", "pdf" or "html"
+        answers: "include", "separate" or "omit" the answer keys
+
+    Returns:
+        Summary with the rendered, skipped and failed files
+    """
+    started = time.perf_counter()
+    fmt = resolve_format(fmt)
+    files = exam_files(target)
+    caches, digests, pending, skipped = {}, {}, [], []
+    for md_path in files:
+        cache = caches.get(md_path.parent)
+        if cache is None:
+            cache = caches[md_path.parent] = load_cache(md_path.parent)
+        digests[md_path] = content_hash(md_path)
+        if not force and is_cached(cache, md_path, digests[md_path], fmt, answers):
+            skipped.append(str(md_path))
+        else:
+            pending.append(md_path)
+
+    tasks = [(str(md_path), fmt, answers) for md_path in pending]
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(pending) or 1))
+    if jobs == 1:
+        results = [_render(task) for task in tasks]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(_render, tasks))
+
+    rendered, failed = [], []
+    rendered_files = 0
+    for md_path, result in zip(pending, results):
+        if result["status"] == "rendered":
+            record_render(caches[md_path.parent], md_path, result["outputs"], digests[md_path], fmt, answers)
+            rendered.extend(result["outputs"])
+            rendered_files += 1
+        else:
+            failed.append({"markdown_path": result["markdown_path"], "error": result["error"]})
+
+    for directory, cache in caches.items():
+        # Forget files that were deleted since they were rendered
+        cache["files"] = {key: entry for key, entry in cache["files"].items()
+                          if (directory / key.rpartition(":")[0]).exists()}
+        storage.save_json(directory / CACHE_FILE, cache)
+
+    return {
+        "status": "success" if not failed else "error" if not rendered and not skipped else "partial",
+        "target": target,
+        "format": fmt,
+        "rendered": rendered,
+        "skipped": skipped,
+        "failed": failed,
+        "counts": {"total": len(files), "rendered": rendered_files, "skipped": len(skipped), "failed": len(failed)},
+        "jobs": jobs,
+        "elapsed_seconds": round(time.perf_counter() - started, 3)
+    }
+
+
+def generate_pdf(markdown_path: str, force: bool = False, fmt: str = "auto", answers: str = "include") -> bool:
+    """
+    Generate PDF (or print-ready HTML) from markdown exam file.
+
+    Args:
+        markdown_path: Path to markdown file
+        force: Render even if the cached output is up to date
+        fmt: "auto" (PDF if reportlab is installed, else HTML), "pdf" or "html"
+        answers: "include", "separate" or "omit" the answer key
 
     Returns:
         True if successful, False otherwise
@@ -254,45 +712,114 @@ def generate_pdf(markdown_path: str) -> bool:
     md_path = Path(markdown_path)
 
     if not md_path.exists():
-        print(json.dumps({
+        cli_output.emit({
             "status": "error",
             "error": f"File not found: {markdown_path}"
-        }))
+        })
         return False
 
-    # Determine output path
-    pdf_path = md_path.with_suffix('.pdf')
-    title = md_path.stem
-
-    # Try reportlab (simple, no system deps)
-    if generate_pdf_reportlab(md_path, pdf_path):
-        output = {
-            "status": "success",
-            "pdf_path": str(pdf_path),
-            "markdown_path": str(md_path),
-            "title": title,
-            "llm_directive": "Inform user PDF was generated successfully. Show the file path.",
-            "suggested_response": f"✅ PDF generated: {pdf_path.name}"
-        }
-        print(json.dumps(output, indent=2))
-        return True
+    resolved = resolve_format(fmt)
+    if resolved == "pdf" and not reportlab_available():
+        cli_output.emit(REPORTLAB_MISSING)
+        return False
 
-    # reportlab not available
+    # Determine output paths
+    output_path = md_path.with_suffix(f".{resolved}")
+    title = md_path.stem
     output = {
-        "status": "error",
-        "error": "PDF generation library not available.",
-        "llm_directive": "Inform user to install reportlab.",
-        "suggested_response": f"❌ PDF library not installed.\n\n💡 Install with: uv pip install reportlab"
+        "status": "success",
+        "format": resolved,
+        f"{resolved}_path": str(output_path),
+        "markdown_path": str(md_path),
+        "title": title
     }
-    print(json.dumps(output, indent=2))
-    return False
+    if resolved == "pdf":
+        output["llm_directive"] = "Inform user PDF was generated successfully. Show the file path."
+        output["suggested_response"] = f"✅ PDF generated: {output_path.name}"
+    else:
+        output["llm_directive"] = ("Inform user the exam was saved as print-ready HTML. Show the file path and "
+                                   "tell them to open it in a browser and print it (or Save as PDF).")
+        output["suggested_response"] = f"✅ Printable exam generated: {output_path.name} (open in a browser and print)"
+        if fmt == "auto":
+            output["note"] = "reportlab is not installed, so the exam was written as HTML instead of PDF."
+            output["suggested_response"] += "\n\n💡 For PDF output install reportlab: uv pip install reportlab"
+
+    cache = load_cache(md_path.parent)
+    digest = content_hash(md_path)
+    if not force and is_cached(cache, md_path, digest, resolved, answers):
+        outputs = [md_path.parent / name for name in cache["files"][_cache_key(md_path, resolved)]["outputs"]]
+        cached = True
+    else:
+        outputs = render(md_path, resolved, answers)
+        record_render(cache, md_path, outputs, digest, resolved, answers)
+        storage.save_json(md_path.parent / CACHE_FILE, cache)
+        cached = False
+
+    if len(outputs) > 1:
+        output["answers_path"] = str(outputs[1])
+        output["suggested_response"] += f"\n🔑 Answer key: {outputs[1].name}"
+    cli_output.emit({**output, "cached": cached})
+    return True
+
+
+def _pop_option(args: list, name: str, choices: tuple = None):
+    """Remove `name value` (or `name=value`) from args and return the value, or None if absent."""
+    for i, arg in enumerate(args):
+        if arg == name or arg.startswith(name + "="):
+            value = arg.partition("=")[2] if "=" in arg else (args[i + 1] if i + 1 < len(args) else None)
+            del args[i:i + (1 if "=" in arg else 2)]
+            if value is None or (choices and value not in choices):
+                expected = f"one of: {', '.join(choices)}" if choices else "a value"
+                cli_output.emit({"status": "error", "error": f"{name} needs {expected}"})
+                sys.exit(1)
+            return value
+    return None
 
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python3 generate_exam_pdf.py <path-to-exam.md>")
+    cli_output.configure()
+
+    args = sys.argv[1:]
+    force = "--force" in args
+    args = [arg for arg in args if arg != "--force"]
+    fmt = _pop_option(args, "--format", FORMATS) or "auto"
+    answers = _pop_option(args, "--answers", ANSWER_MODES) or "include"
+    jobs = _pop_option(args, "--jobs")
+    if jobs is not None:
+        if not jobs.isdigit() or int(jobs) < 1:
+            cli_output.emit({"status": "error", "error": "--jobs must be a positive integer"})
+            sys.exit(1)
+        jobs = int(jobs)
+
+    if not args:
+        print("Usage:")
+        print("  Render one exam:    python3 generate_exam_pdf.py <path-to-exam.md>")
+        print("  Render many exams:  python3 generate_exam_pdf.py batch <directory|glob> [--jobs N]")
+        print("Options:")
+        print("  --format auto|pdf|html         auto: PDF if reportlab is installed, else print-ready HTML")
+        print("  --answers include|separate|omit  Where an answer key section goes (separate: <name>-ANSWERS)")
+        print("  --force                        Render even if the output is up to date")
+        sys.exit(1)
+
+    if args[0] == "batch" and len(args) >= 2:
+        if fmt == "pdf" and not reportlab_available():
+            cli_output.emit(REPORTLAB_MISSING)
+            sys.exit(1)
+        summary = batch(args[1], jobs=jobs, force=force, fmt=fmt, answers=answers)
+        counts = summary["counts"]
+        summary["llm_directive"] = "Report how many exams were generated, skipped as unchanged, and any failures."
+        summary["suggested_response"] = (
+            f"✅ {counts['rendered']} {summary['format'].upper()} file(s) generated, {counts['skipped']} unchanged"
+            + (f", ❌ {counts['failed']} failed" if counts["failed"] else "")
+        )
+        if not counts["total"]:
+            summary.update(status="error", error=f"No markdown files match: {args[1]}",
+                           suggested_response=f"❌ No exam files found in {args[1]}")
+        cli_output.emit(summary)
+        sys.exit(0 if summary["status"] == "success" else 1)
+    elif args[0] == "batch":
+        print("❌ Invalid command or missing arguments")
         sys.exit(1)
 
-    markdown_file = sys.argv[1]
-    success = generate_pdf(markdown_file)
+    success = generate_pdf(args[0], force=force, fmt=fmt, answers=answers)
     sys.exit(0 if success else 1)
@@ -4,10 +4,15 @@ Generate a structured learning syllabus for a topic.
 This is a helper that Claude will use to create comprehensive learning paths.
 """
 
-import json
 from pathlib import Path
 from datetime import datetime
 
+import catalog
+import cli_output
+import learning_daemon
+import learning_db
+import storage
+
 
 def update_syllabus(topic_slug: str, syllabus_content: str, base_dir: str = ".learning"):
     """
@@ -28,16 +33,7 @@ def update_syllabus(topic_slug: str, syllabus_content: str, base_dir: str = ".le
     with open(syllabus_path, "w") as f:
         f.write(syllabus_content)
 
-    # Update metadata
-    metadata_path = topic_dir / "metadata.json"
-    with open(metadata_path, "r") as f:
-        metadata = json.load(f)
-
-    metadata["syllabus_generated"] = True
-    metadata["syllabus_updated_at"] = datetime.now().isoformat()
-
-    with open(metadata_path, "w") as f:
-        json.dump(metadata, f, indent=2)
+    mark_syllabus_generated(topic_slug, base_dir)
 
     print(f"✅ Syllabus updated for '{topic_slug}'")
     print(f"📄 {syllabus_path}")
@@ -45,6 +41,36 @@ def update_syllabus(topic_slug: str, syllabus_content: str, base_dir: str = ".le
     return True
 
 
+def mark_syllabus_generated(topic_slug: str, base_dir: str = ".learning") -> bool:
+    """
+    Record in the topic's metadata (and the catalog) that its syllabus was written.
+
+    Args:
+        topic_slug: Slug of the topic
+        base_dir: Base directory for learning data
+
+    Returns:
+        False if the topic does not exist
+    """
+    topic_dir = Path(base_dir) / topic_slug
+    updates = {"syllabus_generated": True, "syllabus_updated_at": datetime.now().isoformat()}
+    store = learning_db.open_store(base_dir)
+    if store is not None:
+        metadata = learning_db.update_topic(store, topic_slug, updates)
+        store.close()
+        return metadata is not None
+
+    metadata_path = topic_dir / "metadata.json"
+    if not metadata_path.exists():
+        return False
+    with storage.locked(topic_dir):
+        metadata = storage.load_json(metadata_path)
+        metadata.update(updates)
+        storage.save_json(metadata_path, metadata)
+        catalog.update(base_dir, topic_slug, {"syllabus_exists": True, "last_activity": updates["syllabus_updated_at"]})
+    return True
+
+
 def get_topic_info(topic_slug: str, base_dir: str = ".learning"):
     """
     Get information about a learning topic.
@@ -61,15 +87,31 @@ def get_topic_info(topic_slug: str, base_dir: str = ".learning"):
     if not topic_dir.exists():
         return None
 
-    metadata_path = topic_dir / "metadata.json"
-    with open(metadata_path, "r") as f:
-        metadata = json.load(f)
+    store = learning_db.open_store(base_dir)
+    if store is not None:
+        entry = learning_db.topic_catalog(store, topic_slug).get(topic_slug)
+        store.close()
+    else:
+        entry = catalog.load(base_dir).get(topic_slug)
+        if entry is None:
+            # Created outside the scripts: scan it into the catalog
+            entry = catalog.update(base_dir, topic_slug, {})
+
+    return _topic_info(entry, topic_dir) if entry is not None else None
 
+
+def _topic_info(entry: dict, topic_dir: Path, now: str = None) -> dict:
+    """Build the topic summary returned by `info` and `list` from a catalog entry."""
+    now = now or datetime.now().isoformat()
     return {
-        "topic": metadata["topic"],
-        "status": metadata["status"],
-        "sessions": metadata["total_sessions"],
-        "syllabus_exists": metadata.get("syllabus_generated", False),
+        "topic": entry["topic"],
+        "status": entry["status"],
+        "sessions": entry["sessions"],
+        "syllabus_exists": entry["syllabus_exists"],
+        "concept_count": entry["concept_count"],
+        "next_due": entry["next_due"],
+        "reviews_due": entry["next_due"] is not None and entry["next_due"] <= now,
+        "last_activity": entry["last_activity"],
         "directory": str(topic_dir)
     }
 
@@ -78,6 +120,9 @@ def list_topics(base_dir: str = ".learning"):
     """
     List all learning topics.
 
+    Reads the topic catalog (or, with SQLite storage, one aggregate query)
+    rather than every topic's files.
+
     Args:
         base_dir: Base directory for learning data
 
@@ -89,23 +134,28 @@ def list_topics(base_dir: str = ".learning"):
     if not learning_dir.exists():
         return []
 
-    topics = []
-    for topic_dir in learning_dir.iterdir():
-        if topic_dir.is_dir() and (topic_dir / "metadata.json").exists():
-            info = get_topic_info(topic_dir.name, base_dir)
-            if info:
-                topics.append(info)
+    store = learning_db.open_store(base_dir)
+    if store is not None:
+        entries = learning_db.topic_catalog(store)
+        store.close()
+    else:
+        entries = catalog.load(base_dir)
 
-    return topics
+    now = datetime.now().isoformat()
+    return [_topic_info(entry, learning_dir / slug, now) for slug, entry in sorted(entries.items())]
 
 
 if __name__ == "__main__":
     import sys
 
+    learning_daemon.forward(__file__)
+    cli_output.configure()
+
     if len(sys.argv) < 2:
         print("Usage:")
         print("  List topics:  python3 generate_syllabus.py list")
         print("  Topic info:   python3 generate_syllabus.py info <topic_slug>")
+        print("  Mark written: python3 generate_syllabus.py mark-generated <topic_slug>")
         sys.exit(1)
 
     command = sys.argv[1]
@@ -119,7 +169,7 @@ if __name__ == "__main__":
                 "llm_directive": "No learning topics found. Ask user what they'd like to learn and initialize a new topic.",
                 "suggested_response": "No learning topics found yet. What would you like to learn?"
             }
-            print(json.dumps(output, indent=2))
+            cli_output.emit(output)
         else:
             output = {
                 "status": "success",
@@ -128,10 +178,11 @@ if __name__ == "__main__":
                 "llm_directive": "Show user the list of topics. Ask which one they'd like to work on or if they want to start a new one.",
                 "suggested_response": f"You have {len(topics)} learning topic(s):\n\n" + "\n".join([
                     f"{'✅' if t['status'] == 'completed' else '📖'} {t['topic']} - {t['sessions']} sessions"
+                    + (" (reviews due)" if t["reviews_due"] else "")
                     for t in topics
                 ]) + "\n\nWhich topic would you like to work on?"
             }
-            print(json.dumps(output, indent=2))
+            cli_output.emit(output, paginate="topics")
 
     elif command == "info" and len(sys.argv) >= 3:
         info = get_topic_info(sys.argv[2])
@@ -139,14 +190,30 @@ if __name__ == "__main__":
             output = {
                 "status": "success",
                 "topic_info": info,
-                "llm_directive": "Display topic information to user. Check if reviews are due for this topic.",
-                "suggested_response": f"Topic: {info['topic']}\nSessions: {info['sessions']}\nStatus: {info['status']}"
+                "llm_directive": "Display topic information to user." + (
+                    " Reviews are due for this topic: conduct them before new learning." if info["reviews_due"] else ""
+                ),
+                "suggested_response": f"Topic: {info['topic']}\nSessions: {info['sessions']}\nStatus: {info['status']}\n"
+                                      f"Concepts tracked: {info['concept_count']}"
             }
-            print(json.dumps(output, indent=2))
+            cli_output.emit(output)
         else:
             output = {
                 "status": "error",
                 "error": f"Topic '{sys.argv[2]}' not found",
                 "llm_directive": "Inform user topic not found. Suggest listing all topics or creating new one."
             }
-            print(json.dumps(output, indent=2))
+            cli_output.emit(output)
+
+    elif command == "mark-generated" and len(sys.argv) >= 3:
+        if mark_syllabus_generated(sys.argv[2]):
+            cli_output.emit({"status": "success", "topic_slug": sys.argv[2], "syllabus_exists": True})
+        else:
+            cli_output.emit({
+                "status": "error",
+                "error": f"Topic '{sys.argv[2]}' not found",
+                "llm_directive": "Inform user topic not found. Suggest listing all topics or creating new one."
+            })
+
+    else:
+        print("❌ Invalid command or missing arguments")
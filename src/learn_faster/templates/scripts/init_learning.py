@@ -4,12 +4,16 @@ Initialize a new learning topic with structured syllabus and tracking files.
 On first initialization, copies scripts to .learning/ directory.
 """
 
-import os
-import json
 import shutil
 from datetime import datetime
 from pathlib import Path
 
+import catalog
+import cli_output
+import learning_daemon
+import learning_db
+import storage
+
 
 def init_learning_topic(topic_name: str, base_dir: str = ".learning"):
     """
@@ -43,8 +47,12 @@ def init_learning_topic(topic_name: str, base_dir: str = ".learning"):
         "last_reviewed": None
     }
 
-    with open(topic_dir / "metadata.json", "w") as f:
-        json.dump(metadata, f, indent=2)
+    store = learning_db.open_store(base_dir)
+    if store is not None:
+        learning_db.create_topic(store, topic_slug, metadata)
+        store.close()
+    else:
+        storage.save_json(topic_dir / "metadata.json", metadata)
 
     # Create syllabus template
     with open(topic_dir / "syllabus.md", "w") as f:
@@ -86,9 +94,10 @@ def init_learning_topic(topic_name: str, base_dir: str = ".learning"):
         f.write("## Daily Logs\n\n")
         f.write("<!-- Daily learning entries will be added here -->\n")
 
-    # Create review schedule
-    with open(topic_dir / "review_schedule.json", "w") as f:
-        json.dump({"reviews": []}, f, indent=2)
+    # Create review schedule (kept in the database when SQLite storage is enabled)
+    if store is None:
+        storage.save_json(topic_dir / "review_schedule.json", {"reviews": []})
+        catalog.update(base_dir, topic_slug, {})
 
     # Create mastery checklist
     with open(topic_dir / "mastery.md", "w") as f:
@@ -105,6 +114,10 @@ def init_learning_topic(topic_name: str, base_dir: str = ".learning"):
         "topic_slug": topic_slug,
         "directory": str(topic_dir),
         "files_created": [
+            "syllabus.md",
+            "progress.md",
+            "mastery.md"
+        ] if store is not None else [
             "metadata.json",
             "syllabus.md",
             "progress.md",
@@ -116,13 +129,16 @@ def init_learning_topic(topic_name: str, base_dir: str = ".learning"):
         "suggested_response": f"✅ Created learning environment for {topic_name}!\n\nGenerating comprehensive syllabus now..."
     }
 
-    print(json.dumps(output, indent=2))
+    cli_output.emit(output)
     return str(topic_dir)
 
 
 if __name__ == "__main__":
     import sys
 
+    learning_daemon.forward(__file__)
+    cli_output.configure()
+
     if len(sys.argv) < 2:
         print("Usage: python3 init_learning.py <topic_name> [base_dir]")
         print("\nExample: python3 init_learning.py 'React Hooks' .learning")
@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Optional long-lived server for the learning scripts.
+
+Start it from the project root with `learn-faster serve` (or
+`python3 .learning/scripts/learning_daemon.py serve`). It listens on
+.learning/daemon.sock and runs the same script commands in-process, so
+interpreter startup and JSON parsing are paid once: parsed files stay in
+memory between calls (see storage.py). Writes are on disk before a command's
+response is sent, and a failure to write is reported as the command's
+result. When any of the scripts changes (e.g. after `learn-faster init`
+updated them), the modules imported from them are dropped and imported
+afresh by the next command.
+
+Every script calls forward() at the start of its `__main__` block. When the
+daemon is running the command executes there and its output is relayed;
+otherwise the script carries on with direct file access.
+"""
+
+import io
+import os
+import sys
+import json
+import signal
+import socket
+import builtins
+import importlib
+import traceback
+from pathlib import Path
+
+import storage
+
+
+BASE_DIR = ".learning"
+SOCKET_FILE = "daemon.sock"
+
+# Client environment variables with this prefix (e.g. LEARN_FASTER_OUTPUT) apply to the forwarded command
+ENV_PREFIX = "LEARN_FASTER_"
+
+# Set in the daemon process so scripts it runs don't forward to themselves
+SERVING_ENV = "LEARN_FASTER_DAEMON"
+
+CONNECT_TIMEOUT = 0.5
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+# Script path -> (mtime_ns, compiled code)
+_code_cache = {}
+
+# File of each sibling module imported into the daemon -> its mtime_ns when first seen
+_module_mtimes = {}
+
+# Set by SIGTERM. A running command is finished and answered before the daemon stops.
+_stop_requested = False
+_busy = False
+
+
+class _NeedsStdin(Exception):
+    """A forwarded command tried to read stdin that the client has not sent yet."""
+
+
+class _ForwardedStdin(io.StringIO):
+    """Stdin for a forwarded command: the client's input, requested on first read."""
+
+    def __init__(self, text: str, tty: bool):
+        super().__init__(text or "")
+        self._missing = text is None and not tty
+        self._tty = tty
+
+    def isatty(self) -> bool:
+        return self._tty
+
+    def read(self, *args):
+        if self._missing:
+            raise _NeedsStdin
+        return super().read(*args)
+
+    def readline(self, *args):
+        if self._missing:
+            raise _NeedsStdin
+        return super().readline(*args)
+
+
+def _send(sock: socket.socket, message: dict) -> None:
+    sock.sendall((json.dumps(message) + "\n").encode("utf-8"))
+
+
+def _receive(sock: socket.socket) -> dict:
+    with sock.makefile("rb") as f:
+        line = f.readline()
+    if not line:
+        raise ConnectionError("Connection closed before a response was received")
+    return json.loads(line)
+
+
+def _connect(base_dir: str = BASE_DIR) -> socket.socket:
+    """Connect to a running daemon; raises OSError if none is listening."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(str(Path(base_dir) / SOCKET_FILE))
+        sock.settimeout(None)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def _request(message: dict, base_dir: str = BASE_DIR) -> dict:
+    """Send one request to the daemon and wait for its response."""
+    with _connect(base_dir) as sock:
+        _send(sock, message)
+        return _receive(sock)
+
+
+def forward(script_path: str, argv: list = None) -> None:
+    """
+    Run the current script invocation in the daemon if one is running.
+
+    Relays the daemon's output and exit code and exits. Returns without doing
+    anything when no daemon is listening, so the caller falls back to direct
+    file access.
+
+    Args:
+        script_path: __file__ of the calling script
+        argv: Command arguments (default: sys.argv[1:])
+    """
+    if os.environ.get(SERVING_ENV) or not (Path(BASE_DIR) / SOCKET_FILE).exists():
+        return
+
+    message = {
+        "script": Path(script_path).name,
+        "argv": sys.argv[1:] if argv is None else argv,
+        "cwd": os.getcwd(),
+        "env": {key: value for key, value in os.environ.items() if key.startswith(ENV_PREFIX) and key != SERVING_ENV},
+        "stdin": None,
+        "stdin_tty": sys.stdin is None or sys.stdin.isatty()
+    }
+
+    try:
+        sock = _connect()
+    except OSError:
+        # Stale socket file from a daemon that is no longer running
+        return
+
+    try:
+        with sock:
+            _send(sock, message)
+            response = _receive(sock)
+        if response.get("needs_stdin"):
+            message["stdin"] = sys.stdin.read()
+            response = _request(message)
+    except (OSError, ValueError) as e:
+        # The command may already have run, so don't retry it locally
+        print(json.dumps({"status": "error", "error": f"Learning daemon failed: {e}"}, indent=2))
+        sys.exit(1)
+
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    sys.exit(response["exit_code"])
+
+
+def _compile(script: Path):
+    """Compile a script once, recompiling when the file changes."""
+    mtime_ns = script.stat().st_mtime_ns
+    cached = _code_cache.get(script)
+    if cached is None or cached[0] != mtime_ns:
+        cached = (mtime_ns, compile(script.read_text(encoding="utf-8"), str(script), "exec"))
+        _code_cache[script] = cached
+    return cached[1]
+
+
+def _sync_modules() -> bool:
+    """
+    Drop the script modules imported so far if any of their files changed.
+
+    Scripts are recompiled when they change (see _compile), but the sibling
+    modules they import stay in sys.modules. Mixing old and new versions
+    would break, so all of them are dropped together, after flushing, and
+    the next command imports them again with a fresh storage cache.
+
+    Returns:
+        Whether modules were dropped
+    """
+    global storage
+    loaded = {}
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None)
+        if name != "__main__" and path and Path(path).resolve().parent == SCRIPTS_DIR:
+            loaded[name] = Path(path).resolve()
+
+    changed = False
+    for path in loaded.values():
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = None
+        changed |= _module_mtimes.setdefault(path, mtime_ns) != mtime_ns
+    if not changed:
+        return False
+
+    storage.flush()
+    for name in loaded:
+        del sys.modules[name]
+    _module_mtimes.clear()
+    storage = importlib.import_module("storage")
+    storage.enable_cache()
+    return True
+
+
+def _on_sigterm(signum, frame) -> None:
+    """Stop serving: at once when idle, otherwise after the current command."""
+    global _stop_requested
+    _stop_requested = True
+    if not _busy:
+        raise SystemExit(0)
+
+
+def run_command(message: dict) -> dict:
+    """
+    Run one forwarded script invocation in-process and capture its output.
+
+    Args:
+        message: Request with script name, argv, cwd, LEARN_FASTER_* environment
+            and optional stdin
+
+    Returns:
+        Response with stdout, stderr and exit_code, or {"needs_stdin": True}
+        when the command must be re-sent with the client's stdin
+    """
+    script = SCRIPTS_DIR / Path(message["script"]).name
+    if script.suffix != ".py" or not script.is_file() or script.name == Path(__file__).name:
+        return {"stdout": "", "stderr": f"Unknown script: {message['script']}\n", "exit_code": 2}
+
+    stdout, stderr = io.StringIO(), io.StringIO()
+    saved = sys.argv, sys.stdin, sys.stdout, sys.stderr
+    cwd = os.getcwd()
+    saved_env = {key: value for key, value in os.environ.items() if key.startswith(ENV_PREFIX)}
+    for key in saved_env:
+        if key != SERVING_ENV:
+            del os.environ[key]
+    os.environ.update({key: value for key, value in message.get("env", {}).items() if key.startswith(ENV_PREFIX)})
+    sys.argv = [str(script)] + list(message["argv"])
+    sys.stdin = _ForwardedStdin(message.get("stdin"), message.get("stdin_tty", True))
+    sys.stdout, sys.stderr = stdout, stderr
+    exit_code = 0
+
+    try:
+        os.chdir(message["cwd"])
+        try:
+            exec(_compile(script), {"__name__": "__main__", "__file__": str(script), "__builtins__": builtins})
+        except SystemExit as e:
+            if isinstance(e.code, str):
+                print(e.code, file=stderr)
+            exit_code = e.code if isinstance(e.code, int) else (1 if e.code else 0)
+        try:
+            # Write before responding, so the client learns about failed writes
+            storage.flush()
+        except OSError as e:
+            storage.invalidate()
+            stdout = io.StringIO()
+            print(json.dumps({"status": "error", "error": f"Changes could not be saved: {e}"}, indent=2), file=stdout)
+            exit_code = 1
+    except _NeedsStdin:
+        storage.invalidate()
+        return {"needs_stdin": True}
+    except Exception:
+        # Don't keep half-applied changes from a failed command
+        storage.invalidate()
+        traceback.print_exc(file=stderr)
+        exit_code = 1
+    finally:
+        sys.argv, sys.stdin, sys.stdout, sys.stderr = saved
+        os.chdir(cwd)
+        for key in [key for key in os.environ if key.startswith(ENV_PREFIX)]:
+            del os.environ[key]
+        os.environ.update(saved_env)
+
+    return {"stdout": stdout.getvalue(), "stderr": stderr.getvalue(), "exit_code": exit_code}
+
+
+def serve(base_dir: str = BASE_DIR) -> bool:
+    """
+    Serve script commands on the daemon socket until stopped.
+
+    Requests are handled one at a time, so commands never interleave. Each
+    command's writes are flushed before its response is sent. SIGTERM stops
+    the daemon once the command in progress, if any, has been answered.
+
+    Args:
+        base_dir: Base directory for learning data
+
+    Returns:
+        False if another daemon is already serving this directory
+    """
+    global _busy, _stop_requested
+    socket_path = Path(base_dir) / SOCKET_FILE
+    if socket_path.exists():
+        try:
+            _connect(base_dir).close()
+            return False
+        except OSError:
+            socket_path.unlink()
+
+    os.environ[SERVING_ENV] = "1"
+    storage.enable_cache()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(socket_path))
+    server.listen()
+    _stop_requested = False
+    signal.signal(signal.SIGTERM, _on_sigterm)
+
+    print(json.dumps({"status": "serving", "socket": str(socket_path), "pid": os.getpid()}), flush=True)
+
+    try:
+        while not _stop_requested:
+            conn, _ = server.accept()
+            _busy = True
+            try:
+                with conn:
+                    message = _receive(conn)
+                    if message.get("control") == "stop":
+                        _send(conn, {"status": "stopped"})
+                        break
+                    _sync_modules()
+                    response = run_command(message)
+                    _sync_modules()
+                    _send(conn, response)
+            except (OSError, ValueError):
+                # Client went away; its command (if any) still completed
+                pass
+            finally:
+                _busy = False
+    except KeyboardInterrupt:
+        pass
+    finally:
+        storage.flush()
+        server.close()
+        socket_path.unlink(missing_ok=True)
+
+    return True
+
+
+def stop(base_dir: str = BASE_DIR) -> bool:
+    """Ask a running daemon to flush and exit. Returns False if none is running."""
+    try:
+        _request({"control": "stop"}, base_dir)
+    except OSError:
+        return False
+    return True
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage:")
+        print("  Start daemon:  python3 learning_daemon.py serve [base_dir]")
+        print("  Stop daemon:   python3 learning_daemon.py stop [base_dir]")
+        sys.exit(1)
+
+    command = sys.argv[1]
+    base = sys.argv[2] if len(sys.argv) > 2 else BASE_DIR
+
+    if command == "serve":
+        if not Path(base).is_dir():
+            print(json.dumps({"status": "error", "error": f"{base} not found. Run from the project root."}, indent=2))
+            sys.exit(1)
+        if not serve(base):
+            print(json.dumps({"status": "error", "error": "A learning daemon is already running."}, indent=2))
+            sys.exit(1)
+    elif command == "stop":
+        stopped = stop(base)
+        print(json.dumps({"status": "success" if stopped else "not_running"}, indent=2))
+    else:
+        print("❌ Invalid command or missing arguments")
\ No newline at end of file
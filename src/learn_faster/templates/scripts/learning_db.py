@@ -0,0 +1,540 @@
+#!/usr/bin/env python3
+"""
+Optional SQLite storage backend for learning data.
+
+Keeps topics, review items, concepts and quiz history for every topic in a
+single WAL-mode database (.learning/learning.db) instead of per-topic JSON
+files. Enabled by setting "storage": "sqlite" in .learning/config.json, which
+the migrator does after importing the existing JSON layout. Markdown files
+(syllabus.md, progress.md, mastery.md) stay on disk in either mode.
+"""
+
+import json
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+import catalog
+import cli_output
+import concept_index
+import concept_names
+import learning_daemon
+import storage
+
+
+DB_FILE = "learning.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS topics (
+    slug TEXT PRIMARY KEY,
+    metadata TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS reviews (
+    id INTEGER PRIMARY KEY,
+    topic TEXT NOT NULL,
+    concept TEXT NOT NULL,
+    concept_key TEXT NOT NULL,
+    learned_date TEXT,
+    review_count INTEGER NOT NULL DEFAULT 0,
+    next_review TEXT NOT NULL,
+    last_reviewed TEXT,
+    state TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS reviews_due ON reviews (topic, next_review);
+CREATE INDEX IF NOT EXISTS reviews_concept ON reviews (topic, concept_key);
+
+CREATE TABLE IF NOT EXISTS concepts (
+    topic TEXT NOT NULL,
+    slug TEXT NOT NULL,
+    concept TEXT NOT NULL,
+    review_count INTEGER NOT NULL DEFAULT 0,
+    learned_date TEXT,
+    last_reviewed TEXT,
+    quiz_count INTEGER NOT NULL DEFAULT 0,
+    quiz_correct_count INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL DEFAULT '{}',
+    PRIMARY KEY (topic, slug)
+);
+CREATE INDEX IF NOT EXISTS concepts_quiz_priority ON concepts (
+    topic, review_count, (CASE WHEN quiz_count > 0 THEN CAST(quiz_correct_count AS REAL) / quiz_count END), learned_date
+);
+
+CREATE TABLE IF NOT EXISTS quiz_history (
+    id INTEGER PRIMARY KEY,
+    topic TEXT NOT NULL,
+    concept_slug TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    correct INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS quiz_history_concept ON quiz_history (topic, concept_slug);
+
+CREATE TABLE IF NOT EXISTS concept_aliases (
+    topic TEXT NOT NULL,
+    alias_key TEXT NOT NULL,
+    slug TEXT NOT NULL,
+    PRIMARY KEY (topic, alias_key)
+);
+"""
+
+SCHEMA_VERSION = 5
+
+# Quiz accuracy as used by concepts_quiz_priority; NULL (never quizzed) sorts first
+QUIZ_ACCURACY = "CASE WHEN quiz_count > 0 THEN CAST(quiz_correct_count AS REAL) / quiz_count END"
+
+# Columns of the reviews table; other review item fields (scheduler state) are kept in `state`
+REVIEW_COLUMNS = ("concept", "learned_date", "review_count", "next_review", "last_reviewed")
+
+# Columns of the concepts table; anything else in a concept document is kept in `data`
+CONCEPT_COLUMNS = ("concept", "review_count", "learned_date", "last_reviewed", "quiz_count", "quiz_correct_count")
+
+
+def is_enabled(base_dir: str = ".learning") -> bool:
+    """Check whether config.json selects the SQLite backend."""
+    try:
+        return storage.load_json(Path(base_dir) / "config.json", {}).get("storage") == "sqlite"
+    except (OSError, ValueError):
+        return False
+
+
+def connect(base_dir: str = ".learning") -> sqlite3.Connection:
+    """
+    Open the learning database, creating or upgrading the schema if needed.
+
+    The schema is only touched when the database's user_version is older
+    than SCHEMA_VERSION, so opening an up-to-date database costs one PRAGMA.
+
+    Args:
+        base_dir: Base directory for learning data
+
+    Returns:
+        Connection in autocommit mode with WAL journaling
+    """
+    conn = sqlite3.connect(Path(base_dir) / DB_FILE, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+        conn.executescript(SCHEMA)
+        _upgrade(conn)
+    return conn
+
+
+def _upgrade(conn: sqlite3.Connection) -> None:
+    """Bring databases created by older versions up to SCHEMA_VERSION."""
+    with transaction(conn):
+        # Checked again under the write lock, in case another process upgraded first
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
+        if version < 2:
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(reviews)")}
+            if "state" not in columns:
+                conn.execute("ALTER TABLE reviews ADD COLUMN state TEXT NOT NULL DEFAULT '{}'")
+            # Version 2 orders quiz targets by accuracy too (concepts_quiz_priority)
+            conn.execute("DROP INDEX IF EXISTS concepts_least_reviewed")
+        if version < 3:
+            # Version 3 normalizes concept keys with Unicode NFKC
+            rows = conn.execute("SELECT id, concept FROM reviews").fetchall()
+            conn.executemany("UPDATE reviews SET concept_key = ? WHERE id = ?",
+                             [(concept_names.concept_key(row["concept"]), row["id"]) for row in rows])
+        # Version 4 dropped concepts_quiz_priority; version 5 has it again (created by SCHEMA)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+def open_store(base_dir: str = ".learning"):
+    """Return a database connection if the SQLite backend is enabled, else None."""
+    if not is_enabled(base_dir):
+        return None
+    return connect(base_dir)
+
+
+@contextmanager
+def transaction(conn: sqlite3.Connection):
+    """Run the enclosed statements in one write transaction."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+# Topics
+
+def create_topic(conn: sqlite3.Connection, slug: str, metadata: dict) -> None:
+    """Insert a topic with its metadata document."""
+    conn.execute("INSERT OR IGNORE INTO topics (slug, metadata) VALUES (?, ?)", (slug, json.dumps(metadata)))
+
+
+def get_topic(conn: sqlite3.Connection, slug: str):
+    """Return the metadata document for a topic, or None if it does not exist."""
+    row = conn.execute("SELECT metadata FROM topics WHERE slug = ?", (slug,)).fetchone()
+    return json.loads(row["metadata"]) if row else None
+
+
+def update_topic(conn: sqlite3.Connection, slug: str, updates: dict = None, increment_sessions: bool = False):
+    """
+    Update a topic's metadata in a single-row transaction.
+
+    Args:
+        conn: Database connection
+        slug: Topic slug
+        updates: Fields to set on the metadata document
+        increment_sessions: Whether to add one to total_sessions
+
+    Returns:
+        Updated metadata document, or None if the topic does not exist
+    """
+    with transaction(conn):
+        metadata = get_topic(conn, slug)
+        if metadata is None:
+            return None
+        if increment_sessions:
+            metadata["total_sessions"] = metadata.get("total_sessions", 0) + 1
+        metadata.update(updates or {})
+        conn.execute("UPDATE topics SET metadata = ? WHERE slug = ?", (json.dumps(metadata), slug))
+    return metadata
+
+
+def list_topics(conn: sqlite3.Connection) -> list:
+    """Return (slug, metadata) pairs for every topic."""
+    return [(row["slug"], json.loads(row["metadata"])) for row in conn.execute("SELECT slug, metadata FROM topics ORDER BY slug")]
+
+
+def topic_catalog(conn: sqlite3.Connection, slug: str = None) -> dict:
+    """
+    Summarize topics with their review counts in one aggregate query.
+
+    Args:
+        conn: Database connection
+        slug: Topic slug, or None for every topic
+
+    Returns:
+        Mapping of topic slug to an entry shaped like catalog.json's
+    """
+    query = (
+        "SELECT t.slug, t.metadata, COUNT(r.id) AS concept_count, MIN(r.next_review) AS next_due, "
+        "MAX(COALESCE(r.last_reviewed, r.learned_date)) AS last_reviewed FROM topics t LEFT JOIN reviews r ON r.topic = t.slug"
+    )
+    if slug is None:
+        rows = conn.execute(query + " GROUP BY t.slug ORDER BY t.slug")
+    else:
+        rows = conn.execute(query + " WHERE t.slug = ? GROUP BY t.slug", (slug,))
+    topics = {}
+    for row in rows:
+        metadata = json.loads(row["metadata"])
+        topics[row["slug"]] = {
+            **catalog.metadata_fields(metadata),
+            "concept_count": row["concept_count"],
+            "next_due": row["next_due"],
+            "last_activity": catalog.last_activity(
+                metadata.get("created_at"), metadata.get("last_session"), metadata.get("syllabus_updated_at"),
+                row["last_reviewed"]
+            )
+        }
+    return topics
+
+
+# Reviews
+
+def _review_from_row(row: sqlite3.Row) -> dict:
+    item = {column: row[column] for column in REVIEW_COLUMNS}
+    item.update(json.loads(row["state"]))
+    return item
+
+
+def _review_state(item: dict) -> str:
+    return json.dumps({k: v for k, v in item.items() if k not in REVIEW_COLUMNS})
+
+
+def add_review(conn: sqlite3.Connection, topic: str, item: dict) -> None:
+    """Insert a review item for a topic."""
+    conn.execute(
+        "INSERT INTO reviews (topic, concept, concept_key, learned_date, review_count, next_review, last_reviewed, state) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (topic, item["concept"], concept_names.concept_key(item["concept"]), item.get("learned_date"),
+         item.get("review_count", 0), item["next_review"], item.get("last_reviewed"), _review_state(item))
+    )
+
+
+def find_review(conn: sqlite3.Connection, topic: str, concept: str):
+    """
+    Look up a review item by normalized concept name (see `concept_names.concept_key`).
+
+    Returns:
+        (row_id, item) tuple, or None if not found
+    """
+    row = conn.execute(
+        "SELECT * FROM reviews WHERE topic = ? AND concept_key = ? ORDER BY id LIMIT 1",
+        (topic, concept_names.concept_key(concept))
+    ).fetchone()
+    return (row["id"], _review_from_row(row)) if row else None
+
+
+def update_review(conn: sqlite3.Connection, row_id: int, item: dict) -> None:
+    """Write back the scheduling fields and scheduler state of a review item."""
+    conn.execute(
+        "UPDATE reviews SET review_count = ?, next_review = ?, last_reviewed = ?, state = ? WHERE id = ?",
+        (item["review_count"], item["next_review"], item["last_reviewed"], _review_state(item), row_id)
+    )
+
+
+def due_reviews(conn: sqlite3.Connection, topic: str = None, now: datetime = None) -> list:
+    """
+    Return review items due at `now`, most overdue first.
+
+    Args:
+        conn: Database connection
+        topic: Topic slug, or None for every topic
+        now: Reference time (defaults to the current time)
+
+    Returns:
+        List of (topic, item) tuples
+    """
+    now_iso = (now or datetime.now()).isoformat()
+    if topic is None:
+        rows = conn.execute("SELECT * FROM reviews WHERE next_review <= ? ORDER BY next_review", (now_iso,))
+    else:
+        rows = conn.execute(
+            "SELECT * FROM reviews WHERE topic = ? AND next_review <= ? ORDER BY next_review", (topic, now_iso)
+        )
+    return [(row["topic"], _review_from_row(row)) for row in rows]
+
+
+def next_review_dates(conn: sqlite3.Connection, topic: str) -> list:
+    """Return the next_review value of every review item of a topic."""
+    return [row[0] for row in conn.execute("SELECT next_review FROM reviews WHERE topic = ?", (topic,))]
+
+
+def all_reviews(conn: sqlite3.Connection, topic: str = None) -> list:
+    """
+    Return review items in insertion order.
+
+    Args:
+        conn: Database connection
+        topic: Topic slug, or None for every topic
+
+    Returns:
+        List of (row_id, topic, item) tuples
+    """
+    if topic is None:
+        rows = conn.execute("SELECT * FROM reviews ORDER BY id")
+    else:
+        rows = conn.execute("SELECT * FROM reviews WHERE topic = ? ORDER BY id", (topic,))
+    return [(row["id"], row["topic"], _review_from_row(row)) for row in rows]
+
+
+# Concepts and quizzes
+
+def _concept_from_row(row: sqlite3.Row) -> dict:
+    data = json.loads(row["data"])
+    data.update({column: row[column] for column in CONCEPT_COLUMNS})
+    data["concept_slug"] = row["slug"]
+    return data
+
+
+def upsert_concept(conn: sqlite3.Connection, topic: str, data: dict) -> None:
+    """Insert or replace a concept document."""
+    extra = {k: v for k, v in data.items() if k not in CONCEPT_COLUMNS and k not in ("concept_slug", "quiz_history")}
+    conn.execute(
+        "INSERT OR REPLACE INTO concepts (topic, slug, concept, review_count, learned_date, last_reviewed, "
+        "quiz_count, quiz_correct_count, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (topic, data["concept_slug"], data["concept"], data.get("review_count", 0), data.get("learned_date"),
+         data.get("last_reviewed"), data.get("quiz_count", 0), data.get("quiz_correct_count", 0), json.dumps(extra))
+    )
+
+
+def get_concept(conn: sqlite3.Connection, topic: str, concept_slug: str):
+    """Return a concept document, or None if it does not exist."""
+    row = conn.execute("SELECT * FROM concepts WHERE topic = ? AND slug = ?", (topic, concept_slug)).fetchone()
+    return _concept_from_row(row) if row else None
+
+
+# Concept fields needed to predict recall, shaped like concept_index entries
+CANDIDATE_COLUMNS = (
+    f"slug, concept, review_count, learned_date, last_reviewed, quiz_count, quiz_correct_count, "
+    f"{QUIZ_ACCURACY} AS quiz_accuracy, json_extract(data, '$.quiz_ewma_accuracy') AS quiz_ewma_accuracy, "
+    "(SELECT MAX(timestamp) FROM quiz_history q WHERE q.topic = c.topic AND q.concept_slug = c.slug) AS last_quizzed"
+)
+
+
+def quiz_candidates(conn: sqlite3.Connection, topic: str) -> list:
+    """Return every concept of a topic with the fields needed to predict its recall."""
+    rows = conn.execute(f"SELECT {CANDIDATE_COLUMNS} FROM concepts c WHERE topic = ?", (topic,))
+    return [dict(row) for row in rows]
+
+
+def least_reviewed_concepts(conn: sqlite3.Connection, topic: str, limit: int = 3) -> list:
+    """
+    Return the `limit` least reviewed concepts, ordered like concept_index.priority:
+    fewest reviews, then lowest quiz accuracy (never quizzed first), then oldest.
+    Served by concepts_quiz_priority without a sort.
+    """
+    rows = conn.execute(
+        f"SELECT {CANDIDATE_COLUMNS} FROM concepts c WHERE topic = ? "
+        f"ORDER BY review_count, {QUIZ_ACCURACY}, learned_date LIMIT ?",
+        (topic, limit)
+    )
+    return [dict(row) for row in rows]
+
+
+def concept_registry(conn: sqlite3.Connection, topic: str) -> concept_names.ConceptRegistry:
+    """Build a topic's concept name registry from the concepts and concept_aliases tables."""
+    names = {row["slug"]: row["concept"] for row in conn.execute("SELECT slug, concept FROM concepts WHERE topic = ?",
+                                                                  (topic,))}
+    aliases = {row["alias_key"]: row["slug"] for row in conn.execute(
+        "SELECT alias_key, slug FROM concept_aliases WHERE topic = ?", (topic,))}
+    return concept_names.ConceptRegistry(names, aliases)
+
+
+def add_alias(conn: sqlite3.Connection, topic: str, alias_key: str, slug: str) -> None:
+    """Store an alias (normalized with concept_names.concept_key) for a concept."""
+    conn.execute("INSERT OR REPLACE INTO concept_aliases (topic, alias_key, slug) VALUES (?, ?, ?)",
+                 (topic, alias_key, slug))
+
+
+def add_concepts(conn: sqlite3.Connection, topic: str, documents: list) -> None:
+    """Insert concept documents that don't exist yet; existing concepts are left untouched."""
+    conn.executemany(
+        "INSERT OR IGNORE INTO concepts (topic, slug, concept, review_count, learned_date, last_reviewed) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        [(topic, data["concept_slug"], data["concept"], data.get("review_count", 0), data.get("learned_date"),
+          data.get("last_reviewed")) for data in documents]
+    )
+
+
+def record_concept_review(conn: sqlite3.Connection, topic: str, concept_slug: str, timestamp: str) -> None:
+    """Count a review of a concept, if it has a concept document."""
+    conn.execute(
+        "UPDATE concepts SET review_count = review_count + 1, last_reviewed = ? WHERE topic = ? AND slug = ?",
+        (timestamp, topic, concept_slug)
+    )
+
+
+def record_quiz(conn: sqlite3.Connection, topic: str, concept_slug: str, correct: bool, timestamp: str = None):
+    """
+    Append a quiz attempt and update the concept's quiz aggregates.
+
+    Returns:
+        Updated concept document, or None if the concept does not exist
+    """
+    timestamp = timestamp or datetime.now().isoformat()
+    with transaction(conn):
+        data = get_concept(conn, topic, concept_slug)
+        if data is None:
+            return None
+        # The quiz_history table is the full history; the document keeps only the aggregates
+        concept_index.record_attempt(data, correct, timestamp)
+        data.pop("quiz_history")
+        upsert_concept(conn, topic, data)
+        conn.execute(
+            "INSERT INTO quiz_history (topic, concept_slug, timestamp, correct) VALUES (?, ?, ?, ?)",
+            (topic, concept_slug, timestamp, int(correct))
+        )
+    return data
+
+
+# Migration
+
+def migrate(base_dir: str = ".learning") -> dict:
+    """
+    Import every topic from the per-topic JSON layout and enable the SQLite backend.
+
+    Topics already present in the database are skipped, so the migration can be
+    re-run safely. The JSON files are left in place but are no longer updated.
+
+    Args:
+        base_dir: Base directory for learning data
+
+    Returns:
+        Summary of migrated topics and row counts
+    """
+    learning_dir = Path(base_dir)
+    conn = connect(base_dir)
+    summary = {"topics": [], "skipped": [], "reviews": 0, "concepts": 0, "quiz_attempts": 0}
+
+    try:
+        with transaction(conn):
+            for topic_dir in sorted(learning_dir.iterdir()):
+                metadata_path = topic_dir / "metadata.json"
+                if not topic_dir.is_dir() or not metadata_path.exists():
+                    continue
+
+                slug = topic_dir.name
+                if get_topic(conn, slug) is not None:
+                    summary["skipped"].append(slug)
+                    continue
+
+                create_topic(conn, slug, storage.load_json(metadata_path))
+
+                schedule_path = topic_dir / "review_schedule.json"
+                for item in storage.load_json(schedule_path, {}).get("reviews", []):
+                    add_review(conn, slug, item)
+                    summary["reviews"] += 1
+
+                # Archived quiz attempts predate those still in the concept documents
+                for attempt in concept_index.archived_attempts(topic_dir):
+                    conn.execute(
+                        "INSERT INTO quiz_history (topic, concept_slug, timestamp, correct) VALUES (?, ?, ?, ?)",
+                        (slug, attempt["concept_slug"], attempt["timestamp"], int(attempt["correct"]))
+                    )
+                    summary["quiz_attempts"] += 1
+
+                for concept_file in sorted((topic_dir / "concepts").glob("*.json")):
+                    data = storage.load_json(concept_file)
+                    data.setdefault("concept_slug", concept_file.stem)
+                    upsert_concept(conn, slug, data)
+                    summary["concepts"] += 1
+                    for attempt in data.get("quiz_history", []):
+                        conn.execute(
+                            "INSERT INTO quiz_history (topic, concept_slug, timestamp, correct) VALUES (?, ?, ?, ?)",
+                            (slug, data["concept_slug"], attempt["timestamp"], int(attempt["correct"]))
+                        )
+                        summary["quiz_attempts"] += 1
+
+                aliases = storage.load_json(topic_dir / concept_index.INDEX_FILE, {}).get("aliases", {})
+                for alias_key, alias_slug in aliases.items():
+                    add_alias(conn, slug, alias_key, alias_slug)
+
+                summary["topics"].append(slug)
+    finally:
+        conn.close()
+
+    config_path = learning_dir / "config.json"
+    with storage.locked(learning_dir):
+        config = storage.load_json(config_path, {})
+        config["storage"] = "sqlite"
+        storage.save_json(config_path, config)
+
+    return summary
+
+
+if __name__ == "__main__":
+    import sys
+
+    learning_daemon.forward(__file__)
+    cli_output.configure()
+
+    if len(sys.argv) < 2:
+        print("Usage:")
+        print("  Migrate JSON files:  python3 learning_db.py migrate [base_dir]")
+        sys.exit(1)
+
+    command = sys.argv[1]
+
+    if command == "migrate":
+        base = sys.argv[2] if len(sys.argv) > 2 else ".learning"
+        summary = migrate(base)
+        output = {
+            "status": "success",
+            "database": str(Path(base) / DB_FILE),
+            **summary,
+            "llm_directive": "Inform user learning data now lives in the SQLite database. Scripts keep working as before; per-topic JSON files are no longer updated.",
+            "suggested_response": f"✅ Migrated {len(summary['topics'])} topic(s) to {Path(base) / DB_FILE}."
+        }
+        cli_output.emit(output)
+    else:
+        print("❌ Invalid command or missing arguments")
@@ -3,20 +3,42 @@
 Log daily learning progress for a topic.
 """
 
+import os
 import json
+import struct
 from datetime import datetime
 from pathlib import Path
 
+import catalog
+import cli_output
+import learning_daemon
+import learning_db
+import session_journal
+import storage
 
-def log_progress(topic_slug: str, content: str, concepts_learned: list = None, base_dir: str = ".learning"):
+
+SESSION_HEADER = b"### Session"
+
+# Fixed-width records (session number, start offset, end offset) for every
+# session appended to progress.md, so any session is one seek away.
+SESSION_INDEX_FILE = "progress.idx"
+SESSION_RECORD = struct.Struct("<QQQ")
+
+# Block size for reading progress.md backwards
+TAIL_BLOCK_SIZE = 8192
+
+
+def log_progress(topic_slug: str, content: str, concepts_learned: list = None, base_dir: str = ".learning",
+                 duration_min: float = None):
     """
-    Add a progress entry to the learning log.
+    Add a progress entry to the learning log and the session journal.
 
     Args:
         topic_slug: Slug of the topic (e.g., 'react-hooks')
         content: Description of what was learned
         concepts_learned: List of concepts/skills learned in this session
         base_dir: Base directory for learning data
+        duration_min: Length of the session in minutes, if known
     """
     topic_dir = Path(base_dir) / topic_slug
 
@@ -24,35 +46,45 @@ def log_progress(topic_slug: str, content: str, concepts_learned: list = None, b
         print(f"❌ Topic '{topic_slug}' not found. Initialize it first.")
         return False
 
-    # Update metadata
-    metadata_path = topic_dir / "metadata.json"
-    with open(metadata_path, "r") as f:
-        metadata = json.load(f)
-
-    metadata["total_sessions"] += 1
-    metadata["last_session"] = datetime.now().isoformat()
+    now = datetime.now()
+    timestamp = now.strftime("%Y-%m-%d %H:%M")
 
-    with open(metadata_path, "w") as f:
-        json.dump(metadata, f, indent=2)
-
-    # Add to progress log
-    progress_path = topic_dir / "progress.md"
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-
-    with open(progress_path, "a") as f:
-        f.write(f"\n### Session {metadata['total_sessions']} - {timestamp}\n\n")
-        f.write(f"{content}\n\n")
+    # Number the session and append it under one topic lock, so concurrent
+    # sessions are appended in the order of their numbers
+    with storage.locked(topic_dir):
+        store = learning_db.open_store(base_dir)
+        if store is not None:
+            metadata = learning_db.update_topic(
+                store, topic_slug, {"last_session": now.isoformat()}, increment_sessions=True
+            )
+            store.close()
+            if metadata is None:
+                print(f"❌ Topic '{topic_slug}' not found. Initialize it first.")
+                return False
+        else:
+            metadata_path = topic_dir / "metadata.json"
+            metadata = storage.load_json(metadata_path)
+            metadata["total_sessions"] += 1
+            metadata["last_session"] = now.isoformat()
+            storage.save_json(metadata_path, metadata)
+            catalog.update(base_dir, topic_slug, {
+                "sessions": metadata["total_sessions"], "last_activity": metadata["last_session"]
+            })
 
+        entry = f"\n### Session {metadata['total_sessions']} - {timestamp}\n\n{content}\n\n"
         if concepts_learned:
-            f.write("**Concepts learned:**\n")
-            for concept in concepts_learned:
-                f.write(f"- {concept}\n")
-            f.write("\n")
+            entry += "**Concepts learned:**\n" + "".join(f"- {concept}\n" for concept in concepts_learned) + "\n"
+
+        append_session(topic_dir, metadata["total_sessions"], entry)
+        session_journal.append(topic_dir, session_journal.make_record(
+            metadata["total_sessions"], content, concepts_learned, duration_min, now
+        ))
 
     # Output structured JSON for LLM parsing
     directive = ""
     if concepts_learned:
-        directive = f"1. Add these concepts to review schedule: {concepts_learned}. Use 'python3 .learning/scripts/review_scheduler.py add {topic_slug} <concept>' for each.\n2. After adding concepts, run 'python3 .learning/scripts/concept_quiz.py generate {topic_slug}' to generate a quick quiz on least-reviewed concepts."
+        concept_args = " ".join(json.dumps(concept) for concept in concepts_learned)
+        directive = f"1. Add these concepts to review schedule in one call: 'python3 .learning/scripts/review_scheduler.py add-many {topic_slug} {concept_args}'.\n2. After adding concepts, run 'python3 .learning/scripts/concept_quiz.py generate {topic_slug}' to generate a quick quiz on the concepts most likely forgotten."
     else:
         directive = f"No new concepts to add. Run 'python3 .learning/scripts/concept_quiz.py generate {topic_slug}' to quiz on existing concepts."
 
@@ -66,14 +98,116 @@ def log_progress(topic_slug: str, content: str, concepts_learned: list = None, b
         "suggested_response": f"Session {metadata['total_sessions']} logged!" + (f" Added {len(concepts_learned)} concept(s) to track." if concepts_learned else "")
     }
 
-    print(json.dumps(output, indent=2))
+    cli_output.emit(output)
     return True
 
 
+def append_session(topic_dir: Path, session: int, entry: str) -> None:
+    """
+    Append a session entry to progress.md and record its offsets in the index.
+
+    The caller must hold the topic lock. If progress.md was edited by hand
+    since the last indexed session, the index no longer matches and is
+    dropped; it restarts with this session.
+
+    Args:
+        topic_dir: Topic directory
+        session: Session number
+        entry: Markdown for the session, starting with a newline before its header
+    """
+    progress_path = topic_dir / "progress.md"
+    index_path = topic_dir / SESSION_INDEX_FILE
+    data = entry.encode("utf-8")
+
+    fd = os.open(progress_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        start = os.fstat(fd).st_size
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+    records = _read_session_index(topic_dir, start)
+    mode = "ab" if records else "wb"
+    with open(index_path, mode) as f:
+        f.write(SESSION_RECORD.pack(session, start + data.index(SESSION_HEADER), start + len(data)))
+
+
+def _read_session_index(topic_dir: Path, progress_size: int = None) -> list:
+    """
+    Load the session index if it matches progress.md.
+
+    Args:
+        topic_dir: Topic directory
+        progress_size: Expected end of the last indexed session (default:
+            the current size of progress.md)
+
+    Returns:
+        List of (session, start, end) records, or [] if missing or stale
+    """
+    try:
+        raw = (topic_dir / SESSION_INDEX_FILE).read_bytes()
+        if progress_size is None:
+            progress_size = (topic_dir / "progress.md").stat().st_size
+    except FileNotFoundError:
+        return []
+    if not raw or len(raw) % SESSION_RECORD.size:
+        return []
+    records = list(SESSION_RECORD.iter_unpack(raw))
+    if records[-1][2] != progress_size:
+        return []
+    return records
+
+
+def _tail_session_start(f, sessions: int) -> int:
+    """
+    Find where the last `sessions` session entries start by reading backwards.
+
+    Reads the file from the end in blocks and stops as soon as enough
+    `### Session` headers have been seen, so only the tail is read.
+
+    Returns:
+        Byte offset of the earliest wanted header, or of the oldest header if
+        there are fewer sessions
+    """
+    pattern = b"\n" + SESSION_HEADER
+    position = f.seek(0, os.SEEK_END)
+    buffer = b""
+    # Only occurrences ending before `limit` in the buffer are still unscanned
+    limit = 0
+    found = None
+
+    while position > 0 and sessions > 0:
+        size = min(TAIL_BLOCK_SIZE, position)
+        position -= size
+        f.seek(position)
+        buffer = f.read(size) + buffer
+        limit += size
+
+        while sessions > 0:
+            index = buffer.rfind(pattern, 0, limit)
+            if index < 0:
+                # A header may straddle the next block boundary
+                limit = len(pattern) - 1
+                break
+            found = position + index + 1
+            sessions -= 1
+            limit = index
+
+        # Keep only what later blocks may still need, so memory stays bounded
+        buffer = buffer[:limit + len(pattern) - 1]
+
+    if sessions > 0 and buffer.startswith(SESSION_HEADER) and position == 0:
+        found = 0
+    return found
+
+
 def get_recent_progress(topic_slug: str, sessions: int = 3, base_dir: str = ".learning"):
     """
     Retrieve recent progress entries for review.
 
+    Uses the session index when it covers enough sessions, otherwise reads
+    progress.md backwards until it has found the wanted session headers.
+
     Args:
         topic_slug: Slug of the topic
         sessions: Number of recent sessions to retrieve
@@ -87,34 +221,96 @@ def get_recent_progress(topic_slug: str, sessions: int = 3, base_dir: str = ".le
 
     if not progress_path.exists():
         return None
+    if sessions <= 0:
+        return ""
 
-    with open(progress_path, "r") as f:
-        content = f.read()
+    records = _read_session_index(topic_dir)
+    with open(progress_path, "rb") as f:
+        if len(records) >= sessions:
+            start = records[-sessions][1]
+        else:
+            start = _tail_session_start(f, sessions)
+            if start is None:
+                return ""
+        f.seek(start)
+        return f.read().decode("utf-8").strip("\n")
 
-    # Extract session entries (simple approach - could be enhanced)
-    lines = content.split("\n")
-    session_lines = []
-    in_session = False
-    session_count = 0
 
-    for line in reversed(lines):
-        if line.startswith("### Session"):
-            session_count += 1
-            if session_count > sessions:
-                break
-            in_session = True
+def get_progress_sessions(topic_slug: str, first: int, last: int = None, base_dir: str = ".learning"):
+    """
+    Retrieve a range of sessions by number.
 
-        if in_session:
-            session_lines.insert(0, line)
+    Indexed sessions are fetched with one seek; sessions logged before the
+    index existed are found by scanning progress.md.
 
-    return "\n".join(session_lines)
+    Args:
+        topic_slug: Slug of the topic
+        first: First session number
+        last: Last session number (default: same as first)
+        base_dir: Base directory for learning data
+
+    Returns:
+        String containing the sessions' entries, or None if the topic has no log
+    """
+    last = first if last is None else last
+    topic_dir = Path(base_dir) / topic_slug
+    progress_path = topic_dir / "progress.md"
+
+    if not progress_path.exists():
+        return None
+
+    records = _read_session_index(topic_dir)
+    with open(progress_path, "rb") as f:
+        base = records[0][0] if records else 0
+        if records and base <= first <= last <= records[-1][0] \
+                and records[first - base][0] == first and records[last - base][0] == last:
+            start, end = records[first - base][1], records[last - base][2]
+            f.seek(start)
+            return f.read(end - start).decode("utf-8").strip("\n")
+
+        lines = []
+        in_range = False
+        for raw in f:
+            line = raw.decode("utf-8")
+            if raw.startswith(SESSION_HEADER):
+                words = line[len("### Session"):].split()
+                in_range = bool(words) and words[0].isdigit() and first <= int(words[0]) <= last
+            if in_range:
+                lines.append(line)
+        return "".join(lines).strip("\n")
 
 
 if __name__ == "__main__":
     import sys
 
+    learning_daemon.forward(__file__)
+    cli_output.configure()
+
+    if len(sys.argv) >= 3 and sys.argv[1] == "--recent":
+        sessions = int(sys.argv[3]) if len(sys.argv) > 3 and sys.argv[3].isdigit() else 3
+        recent = get_recent_progress(sys.argv[2], sessions)
+        output = {
+            "status": "success" if recent is not None else "error",
+            "topic_slug": sys.argv[2],
+            "sessions": sessions,
+            "progress": recent
+        }
+        cli_output.emit(output)
+        sys.exit(0 if recent is not None else 1)
+
+    duration = None
+    if "--minutes" in sys.argv[:-1]:
+        position = sys.argv.index("--minutes")
+        try:
+            duration = float(sys.argv[position + 1])
+        except ValueError:
+            print("❌ --minutes expects a number")
+            sys.exit(1)
+        del sys.argv[position:position + 2]
+
     if len(sys.argv) < 3:
-        print("Usage: python3 log_progress.py <topic_slug> <content> [concepts...]")
+        print("Usage: python3 log_progress.py <topic_slug> <content> [concepts...] [--minutes N]")
+        print("       python3 log_progress.py --recent <topic_slug> [sessions]")
         print("\nExample: python3 log_progress.py react-hooks 'Learned useState and useEffect' 'useState' 'useEffect'")
         sys.exit(1)
 
@@ -122,4 +318,4 @@ if __name__ == "__main__":
     content = sys.argv[2]
     concepts = sys.argv[3:] if len(sys.argv) > 3 else None
 
-    log_progress(topic, content, concepts)
+    log_progress(topic, content, concepts, duration_min=duration)
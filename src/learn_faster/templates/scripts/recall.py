@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Predicted recall of concepts, for choosing quiz targets.
+
+Each concept's memory stability (days until recall drops to 90%) is estimated
+from its history: every review and correct quiz answer multiplies it by
+STABILITY_GROWTH, every wrong answer by LAPSE_FACTOR. Recall then decays with
+the time since the concept was last reviewed or quizzed, following the same
+power forgetting curve as the FSRS scheduler. A quizzed concept's recall is
+also scaled down by its recent wrong answers (the quiz EWMA accuracy), so a
+concept just answered wrongly doesn't look fresh.
+
+Quizzes go to the concepts with the lowest predicted recall, spread across
+syllabus phases so one weak phase doesn't take every quiz.
+"""
+
+import re
+import heapq
+from datetime import datetime
+
+import schedulers
+
+
+INITIAL_STABILITY_DAYS = 1.0
+STABILITY_GROWTH = 2.0
+LAPSE_FACTOR = 0.6
+MAX_STABILITY_DAYS = 3650.0
+
+# Share of predicted recall lost at a recent quiz accuracy (EWMA) of zero
+QUIZ_PENALTY = 0.5
+
+# Candidates considered per quiz target when spreading targets across phases
+DIVERSITY_POOL = 4
+
+_DECAY = schedulers.FSRSScheduler.DECAY
+_FACTOR = schedulers.FSRSScheduler.FACTOR
+
+
+def _days_since(timestamps, now: datetime):
+    latest = max((t for t in timestamps if t), default=None)
+    if latest is None:
+        return 0.0
+    return max(0.0, (now - datetime.fromisoformat(latest)).total_seconds() / 86400)
+
+
+def stability(entry: dict) -> float:
+    """Estimated memory stability of a concept, in days."""
+    quiz_count = entry.get("quiz_count", 0)
+    correct = entry.get("quiz_correct_count", 0)
+    days = (INITIAL_STABILITY_DAYS * STABILITY_GROWTH ** (entry.get("review_count", 0) + correct)
+            * LAPSE_FACTOR ** (quiz_count - correct))
+    return min(MAX_STABILITY_DAYS, max(0.1, days))
+
+
+def predicted_recall(concepts: list, now: datetime = None) -> list:
+    """
+    Predict the current recall probability of many concepts in one pass.
+
+    Args:
+        concepts: Concept entries with review_count, quiz_count,
+            quiz_correct_count, quiz_ewma_accuracy, learned_date,
+            last_reviewed and last_quizzed
+        now: Time to predict for (default: now)
+
+    Returns:
+        Recall probabilities between 0 and 1, in the order of `concepts`
+    """
+    now = now or datetime.now()
+    recalls = []
+    for entry in concepts:
+        elapsed = _days_since((entry.get("learned_date"), entry.get("last_reviewed"), entry.get("last_quizzed")), now)
+        predicted = (1 + _FACTOR * elapsed / stability(entry)) ** _DECAY
+        ewma = entry.get("quiz_ewma_accuracy")
+        if ewma is not None:
+            predicted *= 1 - QUIZ_PENALTY * (1 - ewma)
+        recalls.append(predicted)
+    return recalls
+
+
+def syllabus_phases(syllabus: dict, concepts: list) -> dict:
+    """
+    Find the syllabus phase each concept is listed under.
+
+    A concept belongs to the first phase with an item that names it as a
+    whole word ("Set" does not match "Settings"). All names are matched in
+    one pass over the items; where several names start at the same place,
+    the longest wins.
+
+    Args:
+        syllabus: Parsed syllabus tree (see syllabus.load_tree), or None
+        concepts: Concept names
+
+    Returns:
+        Mapping of concept name to phase title, for concepts that were found
+    """
+    if not syllabus or not concepts:
+        return {}
+    remaining = {concept.casefold(): concept for concept in concepts}
+    alternatives = "|".join(re.escape(key) for key in sorted(remaining, key=len, reverse=True))
+    # Zero-width, so names overlapping an earlier match are still found
+    pattern = re.compile(rf"(?<!\w)(?=({alternatives})(?!\w))")
+
+    phases = {}
+    for phase in syllabus["phases"]:
+        for item in phase["items"]:
+            for match in pattern.finditer(item["text"].casefold()):
+                concept = remaining.pop(match.group(1), None)
+                if concept is not None:
+                    phases[concept] = phase["title"]
+            if not remaining:
+                return phases
+    return phases
+
+
+def choose_targets(concepts: list, limit: int = 3, phases: dict = None, now: datetime = None) -> list:
+    """
+    Pick quiz targets by lowest predicted recall, one per phase where possible.
+
+    Args:
+        concepts: Concept entries (see `predicted_recall`)
+        limit: Number of targets
+        phases: Mapping of concept name to syllabus phase
+        now: Time to predict for (default: now)
+
+    Returns:
+        Chosen entries with "predicted_recall" and "phase" added, weakest first
+    """
+    phases = phases or {}
+    recalls = predicted_recall(concepts, now)
+    stabilities = [stability(entry) for entry in concepts]
+    # Ties (e.g. concepts learned today) go to the least stable memory
+    weakest = heapq.nsmallest(limit * DIVERSITY_POOL, range(len(concepts)),
+                              key=lambda i: (recalls[i], stabilities[i], concepts[i]["concept"]))
+    pool = [
+        {**concepts[i], "predicted_recall": round(recalls[i], 4), "phase": phases.get(concepts[i]["concept"])}
+        for i in weakest
+    ]
+
+    chosen, seen_phases = [], set()
+    for entry in pool:
+        if len(chosen) < limit and (entry["phase"] is None or entry["phase"] not in seen_phases):
+            chosen.append(entry)
+            seen_phases.add(entry["phase"])
+    # Fewer phases than targets: fill up with the weakest remaining concepts
+    chosen_ids = {id(entry) for entry in chosen}
+    for entry in pool:
+        if len(chosen) < limit and id(entry) not in chosen_ids:
+            chosen.append(entry)
+    chosen.sort(key=lambda entry: entry["predicted_recall"])
+    return chosen
@@ -3,15 +3,126 @@
 Calculate and manage spaced repetition review schedule based on FASTER framework.
 """
 
+import sys
 import json
+import bisect
 import subprocess
 import platform
-from datetime import datetime, timedelta
+from collections import Counter
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
+import catalog
+import cli_output
+import concept_index
+import concept_names
+import learning_daemon
+import learning_db
+import schedulers
+import storage
 
-# Spaced repetition intervals (in days)
-REVIEW_INTERVALS = [1, 3, 7, 14, 30, 60, 90]
+
+# Default spaced repetition intervals (in days) of the ladder scheduler
+REVIEW_INTERVALS = schedulers.LadderScheduler.DEFAULT_PARAMS["intervals"]
+
+# Sidecar index of review items sorted by next review time. One JSON array per
+# line: [next_review_timestamp, concept, review_count]. Due checks read it from
+# the top and stop at the first item that is not yet due.
+DUE_INDEX_FILE = "review_schedule.idx"
+
+# Per-topic schedule mtime and next due time from the last `status --all` scan,
+# stored in the base directory so unchanged topics with nothing due are skipped.
+STATUS_CACHE_FILE = "status_cache.json"
+
+
+def _due_entry(item: dict) -> list:
+    """Build a due-index entry for a review item."""
+    return [datetime.fromisoformat(item["next_review"]).timestamp(), item["concept"], item["review_count"]]
+
+
+def _due_index_is_fresh(index_path: Path, schedule_path: Path) -> bool:
+    """Check the index exists and was written after the schedule."""
+    try:
+        return index_path.stat().st_mtime_ns >= schedule_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+
+
+def write_due_index(topic_dir: Path, entries: list) -> None:
+    """Write sorted due-index entries to the sidecar file."""
+    storage.save_ndjson(topic_dir / DUE_INDEX_FILE, entries)
+
+
+def rebuild_due_index(topic_dir: Path, schedule: dict) -> list:
+    """
+    Rebuild the due index from a loaded schedule.
+
+    Args:
+        topic_dir: Topic directory holding the schedule
+        schedule: Parsed review_schedule.json contents
+
+    Returns:
+        Sorted list of due-index entries
+    """
+    entries = sorted((_due_entry(item) for item in schedule["reviews"]), key=lambda e: e[0])
+    write_due_index(topic_dir, entries)
+    return entries
+
+
+def update_due_index(topic_dir: Path, schedule: dict, changes: list, index_fresh: bool = True) -> None:
+    """
+    Move updated review items to their new positions in the due index.
+
+    Args:
+        topic_dir: Topic directory holding the schedule
+        schedule: Parsed schedule, already containing the updated items
+        changes: List of (item, previous_entry) pairs for items that were added
+            (previous_entry None) or rescheduled
+        index_fresh: Whether the index matched the schedule before the update;
+            a stale or missing index is rebuilt instead
+    """
+    if not index_fresh:
+        rebuild_due_index(topic_dir, schedule)
+        return
+
+    entries = storage.load_ndjson(topic_dir / DUE_INDEX_FILE)
+
+    for item, previous_entry in changes:
+        if previous_entry is not None:
+            pos = bisect.bisect_left(entries, previous_entry[0], key=lambda e: e[0])
+            while pos < len(entries) and entries[pos][0] == previous_entry[0]:
+                if entries[pos][1] == previous_entry[1]:
+                    del entries[pos]
+                    break
+                pos += 1
+            else:
+                rebuild_due_index(topic_dir, schedule)
+                return
+
+        bisect.insort(entries, _due_entry(item), key=lambda e: e[0])
+
+    write_due_index(topic_dir, entries)
+
+
+def update_catalog(base_dir: str, topic_slug: str, schedule: dict, activity: bool = True) -> None:
+    """
+    Refresh a topic's concept count and next due review in the topic catalog.
+
+    Args:
+        base_dir: Base directory for learning data
+        topic_slug: Slug of the topic
+        schedule: Parsed schedule, as just saved
+        activity: Whether the change was the learner's (added or reviewed
+            concepts) and so counts as the topic's latest activity
+    """
+    fields = {
+        "concept_count": len(schedule["reviews"]),
+        "next_due": min((item["next_review"] for item in schedule["reviews"]), default=None)
+    }
+    if activity:
+        catalog.touch(base_dir, topic_slug, **fields)
+    else:
+        catalog.update(base_dir, topic_slug, fields)
 
 
 def add_macos_reminder(concept: str, topic_slug: str, review_date: datetime) -> bool:
@@ -26,19 +137,36 @@ def add_macos_reminder(concept: str, topic_slug: str, review_date: datetime) ->
     Returns:
         True if reminder was added successfully, False otherwise
     """
+    return add_macos_reminders([(concept, review_date)], topic_slug)
+
+
+def add_macos_reminders(reminders: list, topic_slug: str) -> bool:
+    """
+    Add several reminders to macOS Reminders app with a single AppleScript run (macOS only).
+
+    Args:
+        reminders: List of (concept, review_date) pairs
+        topic_slug: Topic slug for reference
+
+    Returns:
+        True if reminders were added successfully, False otherwise
+    """
     # Only run on macOS
-    if platform.system() != "Darwin":
+    if platform.system() != "Darwin" or not reminders:
         return False
 
     try:
         # Format date for AppleScript (e.g., "December 15, 2024 at 9:00:00 AM")
-        reminder_date = review_date.strftime("%B %d, %Y at %I:%M:%S %p")
+        make_reminders = "\n".join(
+            f'''                make new reminder with properties {{name:"Review: {concept} ({topic_slug})", due date:date "{review_date.strftime("%B %d, %Y at %I:%M:%S %p")}", body:"Time to review '{concept}' from your {topic_slug} learning. Run /review in Claude Code."}}'''
+            for concept, review_date in reminders
+        )
 
-        # Create AppleScript to add reminder
+        # Create AppleScript to add reminders
         applescript = f'''
         tell application "Reminders"
             tell list "Learn FASTER"
-                make new reminder with properties {{name:"Review: {concept} ({topic_slug})", due date:date "{reminder_date}", body:"Time to review '{concept}' from your {topic_slug} learning. Run /review in Claude Code."}}
+{make_reminders}
             end tell
         end tell
         '''
@@ -62,7 +190,7 @@ def add_macos_reminder(concept: str, topic_slug: str, review_date: datetime) ->
             '''
             subprocess.run(["osascript", "-e", create_list_script], check=True, capture_output=True)
 
-            # Try adding reminder again
+            # Try adding reminders again
             subprocess.run(["osascript", "-e", applescript], check=True, capture_output=True)
             return True
         except:
@@ -71,73 +199,443 @@ def add_macos_reminder(concept: str, topic_slug: str, review_date: datetime) ->
         return False
 
 
-def add_review_item(topic_slug: str, concept: str, base_dir: str = ".learning"):
+def load_config(base_dir: str = ".learning") -> dict:
+    """Load .learning/config.json, or an empty config if it doesn't exist."""
+    return storage.load_json(Path(base_dir) / "config.json", {})
+
+
+class LoadBalancer:
     """
-    Add a concept to the review schedule.
+    Spread new review dates within a tolerance window to flatten daily peaks.
+
+    Enabled with "load_balancing" in config.json, either `true` or an object
+    with "tolerance" (fraction of the interval, default 0.15) and
+    "window_days" (minimum spread in days, default 1). Each rescheduled item
+    is moved to the least-loaded day within the window, preferring the
+    originally planned day on ties.
+    """
+
+    def __init__(self, next_reviews, now: datetime, tolerance: float = 0.15, window_days: int = 1):
+        self.today = now.date()
+        self.tolerance = tolerance
+        self.window_days = window_days
+        self.counts = Counter(self._day(next_review) for next_review in next_reviews)
+
+    @classmethod
+    def from_config(cls, config: dict, load_next_reviews, now: datetime):
+        """
+        Build a balancer, or return None when load balancing is disabled.
+
+        Args:
+            config: Parsed config.json contents
+            load_next_reviews: Callable returning the next_review strings of
+                the topic's existing items; only called when enabled
+            now: Scheduling time
+        """
+        settings = config.get("load_balancing")
+        if not settings:
+            return None
+        return cls(load_next_reviews(), now, **(settings if isinstance(settings, dict) else {}))
+
+    def _day(self, next_review: str) -> int:
+        return (date.fromisoformat(next_review[:10]) - self.today).days
+
+    def place(self, item: dict, interval: int, now: datetime, previous_next_review: str = None) -> int:
+        """
+        Move an item's next review to the least-loaded day near `interval`.
+
+        Args:
+            item: Review item whose next_review was just set to now + interval
+            interval: Planned interval in days
+            now: Scheduling time
+            previous_next_review: The item's next_review before rescheduling, if it was counted
+
+        Returns:
+            Balanced interval in days
+        """
+        if previous_next_review is not None:
+            self.counts[self._day(previous_next_review)] -= 1
+
+        spread = max(self.window_days, round(interval * self.tolerance))
+        candidates = range(max(1, interval - spread), interval + spread + 1)
+        offset = (now.date() - self.today).days
+        best = min(candidates, key=lambda days: (self.counts[offset + days], abs(days - interval)))
+
+        self.counts[offset + best] += 1
+        item["next_review"] = (now + timedelta(days=best)).isoformat()
+        return best
+
+
+def _concept_index(schedule: dict, rebuild: bool = False) -> dict:
+    """
+    Return the schedule's concept-key to list-position map.
+
+    The map is stored in review_schedule.json as "concept_index" so lookups
+    don't scan or lower-case every review item. It is rebuilt when missing.
+    """
+    index = schedule.get("concept_index")
+    if index is None or rebuild:
+        index = {}
+        for pos, item in enumerate(schedule["reviews"]):
+            index.setdefault(concept_names.concept_key(item["concept"]), pos)
+        schedule["concept_index"] = index
+    return index
+
+
+def find_review_item(schedule: dict, concept: str):
+    """
+    Look up a review item by normalized concept name in O(1).
+
+    Args:
+        schedule: Parsed review_schedule.json contents
+        concept: Concept name in any case or spacing
+
+    Returns:
+        The review item, or None if not found
+    """
+    key = concept_names.concept_key(concept)
+    reviews = schedule["reviews"]
+    index = _concept_index(schedule)
+    pos = index.get(key)
+
+    # The file may have been edited by hand; verify the hit and rebuild on mismatch
+    if pos is not None and pos < len(reviews) and concept_names.concept_key(reviews[pos]["concept"]) == key:
+        return reviews[pos]
+    if pos is not None or len(index) != len(reviews):
+        pos = _concept_index(schedule, rebuild=True).get(key)
+        return reviews[pos] if pos is not None else None
+    return None
+
+
+def _find_named_review(find, registry: concept_names.ConceptRegistry, concept: str, prefix: bool = False) -> tuple:
+    """
+    Look up the review item a command names.
+
+    The item scheduled under exactly this name wins, so another concept's
+    alias or a longer name starting with it never takes it over. Only when
+    it misses is the name resolved through the registry: name or alias,
+    then (with `prefix`) an unambiguous name prefix.
+
+    Args:
+        find: Function looking up a review by normalized name, returning None on a miss
+        registry: The topic's concept name registry
+        concept: Name as given by the user
+        prefix: Also accept the start of a concept name
+
+    Returns:
+        Tuple of (find's result or None, canonical concept name, names of the
+        concepts an ambiguous prefix matched)
+    """
+    found = find(concept)
+    if found is not None:
+        return found, concept, []
+    if prefix:
+        slug, candidates = registry.lookup(concept)
+    else:
+        slug, candidates = registry.resolve(concept), []
+    if slug is None:
+        return None, concept, candidates
+    name = registry.name(slug)
+    return find(name), name, []
+
+
+def _new_concept_documents(registry: concept_names.ConceptRegistry, items: list) -> list:
+    """Build concept documents for review items whose concept has none yet, registering their slugs."""
+    documents = []
+    for item in items:
+        if registry.resolve(item["concept"]) is None:
+            slug = registry.new_slug(item["concept"])
+            registry.register(slug, item["concept"])
+            documents.append(concept_index.new_concept(item["concept"], item["learned_date"], slug))
+    return documents
+
+
+def _count_concept_reviews(topic_dir: Path, registry: concept_names.ConceptRegistry, items: list) -> None:
+    """Mirror review counts into the reviewed concepts' documents, where they have one."""
+    documents = []
+    for item in items:
+        slug = registry.resolve(item["concept"])
+        data = storage.load_json(topic_dir / concept_index.CONCEPTS_DIR / f"{slug}.json") if slug else None
+        if data is not None:
+            data["review_count"] = data.get("review_count", 0) + 1
+            data["last_reviewed"] = item["last_reviewed"]
+            documents.append(data)
+    concept_index.save_concepts(topic_dir, documents)
+
+
+def add_review_items(topic_slug: str, concepts: list, base_dir: str = ".learning"):
+    """
+    Add concepts to the review schedule in one load/save cycle.
+
+    Adding is idempotent: concepts already in the schedule (by normalized
+    name or alias) are left as they are, review progress and scheduler state
+    included. Concepts without a concept document get one, for quizzes.
 
     Args:
         topic_slug: Slug of the topic
-        concept: Name of the concept to review
+        concepts: Names of the concepts to review
+        base_dir: Base directory for learning data
+
+    Returns:
+        Tuple of ([(review item, whether it was already tracked), ...], days
+        until the first review, whether macOS reminders were added), or None
+        if the topic does not exist
+    """
+    topic_dir = Path(base_dir) / topic_slug
+    schedule_path = topic_dir / "review_schedule.json"
+    store = learning_db.open_store(base_dir)
+
+    if store is not None:
+        topic_exists = learning_db.get_topic(store, topic_slug) is not None
+    else:
+        topic_exists = schedule_path.exists()
+
+    if not topic_exists:
+        return None
+
+    config = load_config(base_dir)
+    now = datetime.now()
+    first_interval = schedulers.get_scheduler(config).first_interval()
+    next_review_datetime = now + timedelta(days=first_interval)
+
+    balancer = None
+
+    def new_item(concept: str) -> dict:
+        item = {
+            "concept": concept,
+            "learned_date": now.isoformat(),
+            "review_count": 0,
+            "next_review": next_review_datetime.isoformat(),
+            "last_reviewed": None
+        }
+        if balancer is not None:
+            balancer.place(item, first_interval, now)
+        return item
+
+    results = []
+    if store is not None:
+        balancer = LoadBalancer.from_config(config, lambda: learning_db.next_review_dates(store, topic_slug), now)
+        with learning_db.transaction(store):
+            registry = learning_db.concept_registry(store, topic_slug)
+            for concept in concepts:
+                found, concept, _ = _find_named_review(
+                    lambda name: learning_db.find_review(store, topic_slug, name), registry, concept
+                )
+                if found is not None:
+                    results.append((found[1], True))
+                else:
+                    item = new_item(concept)
+                    learning_db.add_review(store, topic_slug, item)
+                    results.append((item, False))
+            learning_db.add_concepts(store, topic_slug, _new_concept_documents(registry, [item for item, _ in results]))
+        store.close()
+    else:
+        with storage.locked(topic_dir):
+            schedule = storage.load_json(schedule_path)
+            index_fresh = _due_index_is_fresh(topic_dir / DUE_INDEX_FILE, schedule_path)
+            registry = concept_index.registry(topic_dir)
+            balancer = LoadBalancer.from_config(config, lambda: [i["next_review"] for i in schedule["reviews"]], now)
+
+            changes = []
+            for concept in concepts:
+                item, concept, _ = _find_named_review(lambda name: find_review_item(schedule, name), registry, concept)
+                if item is not None:
+                    results.append((item, True))
+                else:
+                    item = new_item(concept)
+                    # Read the map after the lookup: find_review_item may have rebuilt it
+                    _concept_index(schedule)[concept_names.concept_key(concept)] = len(schedule["reviews"])
+                    schedule["reviews"].append(item)
+                    changes.append((item, None))
+                    results.append((item, False))
+
+            if changes:
+                storage.save_json(schedule_path, schedule)
+                update_due_index(topic_dir, schedule, changes, index_fresh)
+                update_catalog(base_dir, topic_slug, schedule)
+
+            # Give new concepts a concept document so quizzes can target them
+            concept_index.save_concepts(topic_dir, _new_concept_documents(registry, [item for item, _ in results]))
+
+    # Set reminder time to 9 AM on review date
+    reminder_added = False
+    if config.get("macos_reminders_enabled", False):
+        reminder_added = add_macos_reminders([
+            (item["concept"], datetime.fromisoformat(item["next_review"]).replace(hour=9, minute=0, second=0))
+            for item, tracked in results if not tracked
+        ], topic_slug)
+
+    return results, first_interval, reminder_added
+
+
+def review_items(topic_slug: str, concepts: list, base_dir: str = ".learning", grades: list = None):
+    """
+    Mark concepts as reviewed in one load/save cycle.
+
+    A concept scheduled under exactly the given name is reviewed; other
+    names are resolved through the topic's concept registry (aliases, then
+    unambiguous name prefixes, see `_find_named_review`).
+
+    Args:
+        topic_slug: Slug of the topic
+        concepts: Names of the concepts reviewed
         base_dir: Base directory for learning data
+        grades: Recall grade (1-4) per concept; defaults to "good"
+
+    Returns:
+        List of (concept, review item or None if not found, interval in days,
+        names an ambiguous prefix matched) tuples
     """
     topic_dir = Path(base_dir) / topic_slug
     schedule_path = topic_dir / "review_schedule.json"
-    metadata_path = topic_dir / "metadata.json"
+    store = learning_db.open_store(base_dir)
+    config = load_config(base_dir)
+    scheduler = schedulers.get_scheduler(config)
+    grades = grades or [schedulers.DEFAULT_GRADE] * len(concepts)
+    now = datetime.now()
+    results = []
+
+    def review(item: dict, grade: int) -> int:
+        previous_next_review = item["next_review"]
+        interval = scheduler.review(item, grade, now)
+        if balancer is not None:
+            interval = balancer.place(item, interval, now, previous_next_review)
+        return interval
+
+    if store is not None:
+        balancer = LoadBalancer.from_config(config, lambda: learning_db.next_review_dates(store, topic_slug), now)
+        with learning_db.transaction(store):
+            registry = learning_db.concept_registry(store, topic_slug)
+            for concept, grade in zip(concepts, grades):
+                found, _, candidates = _find_named_review(
+                    lambda name: learning_db.find_review(store, topic_slug, name), registry, concept, prefix=True
+                )
+                if found is None:
+                    results.append((concept, None, None, candidates))
+                    continue
+                row_id, item = found
+                next_interval = review(item, grade)
+                learning_db.update_review(store, row_id, item)
+                slug = registry.resolve(item["concept"])
+                if slug is not None:
+                    learning_db.record_concept_review(store, topic_slug, slug, item["last_reviewed"])
+                results.append((concept, item, next_interval, []))
+        store.close()
+        return results
 
     if not schedule_path.exists():
+        return [(concept, None, None, []) for concept in concepts]
+
+    with storage.locked(topic_dir):
+        schedule = storage.load_json(schedule_path)
+        index_fresh = _due_index_is_fresh(topic_dir / DUE_INDEX_FILE, schedule_path)
+        balancer = LoadBalancer.from_config(config, lambda: [i["next_review"] for i in schedule["reviews"]], now)
+        registry = concept_index.registry(topic_dir)
+
+        # Find and update the review items
+        changes = []
+        for concept, grade in zip(concepts, grades):
+            item, _, candidates = _find_named_review(
+                lambda name: find_review_item(schedule, name), registry, concept, prefix=True
+            )
+            if item is None:
+                results.append((concept, None, None, candidates))
+                continue
+            previous_entry = _due_entry(item)
+            next_interval = review(item, grade)
+            changes.append((item, previous_entry))
+            results.append((concept, item, next_interval, []))
+
+        if changes:
+            storage.save_json(schedule_path, schedule)
+            update_due_index(topic_dir, schedule, changes, index_fresh)
+            update_catalog(base_dir, topic_slug, schedule)
+            _count_concept_reviews(topic_dir, registry, [item for item, _ in changes])
+
+    return results
+
+
+def add_review_item(topic_slug: str, concept: str, base_dir: str = ".learning"):
+    """
+    Add a concept to the review schedule.
+
+    Args:
+        topic_slug: Slug of the topic
+        concept: Name of the concept to review
+        base_dir: Base directory for learning data
+    """
+    added = add_review_items(topic_slug, [concept], base_dir)
+
+    if added is None:
         print(f"❌ Topic '{topic_slug}' not found.")
         return False
 
-    with open(schedule_path, "r") as f:
-        schedule = json.load(f)
+    results, first_interval, reminder_added = added
+    item, already_tracked = results[0]
+    next_review_date = datetime.fromisoformat(item["next_review"]).strftime("%Y-%m-%d")
 
-    # Add new review item
-    learned_date = datetime.now().isoformat()
-    next_review_datetime = datetime.now() + timedelta(days=REVIEW_INTERVALS[0])
-    review_item = {
+    # Output structured JSON for LLM parsing
+    output = {
+        "status": "success",
         "concept": concept,
-        "learned_date": learned_date,
-        "review_count": 0,
-        "next_review": next_review_datetime.isoformat(),
-        "last_reviewed": None
+        "already_tracked": already_tracked,
+        "next_review_days": first_interval,
+        "next_review_date": next_review_date,
+        "macos_reminder_added": reminder_added,
+        "llm_directive": "Concept added to review schedule. Use `AskUserQuestion` to ask what they want to do next: continue learning, practice",
+        "suggested_response": (f"🔁 '{concept}' is already tracked; its next review stays on {next_review_date}." if already_tracked else
+                               f"✅ Added '{concept}' to review schedule. First review in {first_interval} day(s).") +
+                              (f" 📅 macOS Reminder set for {next_review_date} at 9:00 AM." if reminder_added else "")
     }
 
-    schedule["reviews"].append(review_item)
+    cli_output.emit(output)
+    return True
 
-    with open(schedule_path, "w") as f:
-        json.dump(schedule, f, indent=2)
 
-    next_review_date = next_review_datetime.strftime("%Y-%m-%d")
+def add_review_items_batch(topic_slug: str, concepts: list, base_dir: str = ".learning"):
+    """
+    Add several concepts to the review schedule with one aggregated JSON result.
 
-    # Check if macOS reminders are enabled in config
-    reminder_added = False
-    config_path = Path(base_dir) / "config.json"
-    if config_path.exists():
-        with open(config_path, "r") as f:
-            config = json.load(f)
+    Args:
+        topic_slug: Slug of the topic
+        concepts: Names of the concepts to review
+        base_dir: Base directory for learning data
+    """
+    added = add_review_items(topic_slug, concepts, base_dir)
 
-        if config.get("macos_reminders_enabled", False):
-            # Set reminder time to 9 AM on review date
-            reminder_datetime = next_review_datetime.replace(hour=9, minute=0, second=0)
-            reminder_added = add_macos_reminder(concept, topic_slug, reminder_datetime)
+    if added is None:
+        print(f"❌ Topic '{topic_slug}' not found.")
+        return False
+
+    results, first_interval, reminder_added = added
+    new_items = [item for item, tracked in results if not tracked]
+    already_tracked = [item["concept"] for item, tracked in results if tracked]
+    added_count = len(new_items)
+    next_review_date = datetime.fromisoformat(new_items[0]["next_review"]).strftime("%Y-%m-%d") if new_items else None
 
     # Output structured JSON for LLM parsing
     output = {
         "status": "success",
-        "concept": concept,
-        "next_review_days": REVIEW_INTERVALS[0],
+        "added_count": added_count,
+        "already_tracked_count": len(already_tracked),
+        "concepts": [item["concept"] for item, _ in results],
+        "already_tracked": already_tracked,
+        "next_review_dates": {item["concept"]: item["next_review"][:10] for item, _ in results},
+        "next_review_days": first_interval,
         "next_review_date": next_review_date,
         "macos_reminder_added": reminder_added,
-        "llm_directive": "Concept added to review schedule. Use `AskUserQuestion` to ask what they want to do next: continue learning, practice",
-        "suggested_response": f"✅ Added '{concept}' to review schedule. First review in {REVIEW_INTERVALS[0]} day(s)." +
-                            (f" 📅 macOS Reminder set for {next_review_date} at 9:00 AM." if reminder_added else "")
+        "llm_directive": "Concepts added to review schedule. Use `AskUserQuestion` to ask what they want to do next: continue learning, practice",
+        "suggested_response": f"✅ Added {added_count} concept(s) to review schedule." +
+                            (f" First review in {first_interval} day(s)." if added_count else "") +
+                            (f" {len(already_tracked)} already tracked." if already_tracked else "") +
+                            (f" 📅 macOS Reminders set for {next_review_date} at 9:00 AM." if reminder_added else "")
     }
 
-    print(json.dumps(output, indent=2))
+    cli_output.emit(output)
     return True
 
 
-def mark_reviewed(topic_slug: str, concept: str, base_dir: str = ".learning"):
+def mark_reviewed(topic_slug: str, concept: str, base_dir: str = ".learning", grade: int = schedulers.DEFAULT_GRADE):
     """
     Mark a concept as reviewed and calculate next review date.
 
@@ -145,42 +643,40 @@ def mark_reviewed(topic_slug: str, concept: str, base_dir: str = ".learning"):
         topic_slug: Slug of the topic
         concept: Name of the concept reviewed
         base_dir: Base directory for learning data
+        grade: Recall grade (1 = again, 2 = hard, 3 = good, 4 = easy)
     """
-    topic_dir = Path(base_dir) / topic_slug
-    schedule_path = topic_dir / "review_schedule.json"
-
-    with open(schedule_path, "r") as f:
-        schedule = json.load(f)
-
-    # Find and update the review item
-    for item in schedule["reviews"]:
-        if item["concept"].lower() == concept.lower():
-            item["review_count"] += 1
-            item["last_reviewed"] = datetime.now().isoformat()
-
-            # Calculate next review interval
-            next_interval_idx = min(item["review_count"], len(REVIEW_INTERVALS) - 1)
-            next_interval = REVIEW_INTERVALS[next_interval_idx]
-            item["next_review"] = (datetime.now() + timedelta(days=next_interval)).isoformat()
+    _, item, next_interval, candidates = review_items(topic_slug, [concept], base_dir, [grade])[0]
 
-            with open(schedule_path, "w") as f:
-                json.dump(schedule, f, indent=2)
+    if item is not None:
+        # The name may have been an alias or prefix; report the concept it resolved to
+        concept = item["concept"]
+        next_review_date = datetime.fromisoformat(item["next_review"]).strftime("%Y-%m-%d")
 
-            next_review_date = (datetime.now() + timedelta(days=next_interval)).strftime("%Y-%m-%d")
+        # Output structured JSON for LLM parsing
+        output = {
+            "status": "success",
+            "concept": concept,
+            "grade": grade,
+            "review_count": item['review_count'],
+            "next_review_days": next_interval,
+            "next_review_date": next_review_date,
+            "llm_directive": "Acknowledge review completion. Show next review date.",
+            "suggested_response": (f"🔁 '{concept}' needs more practice." if grade == schedulers.GRADES["again"] else
+                                   f"✅ Great explanation of '{concept}'!") +
+                                  f" Review #{item['review_count']} complete. Next review in {next_interval} days ({next_review_date})."
+        }
 
-            # Output structured JSON for LLM parsing
-            output = {
-                "status": "success",
-                "concept": concept,
-                "review_count": item['review_count'],
-                "next_review_days": next_interval,
-                "next_review_date": next_review_date,
-                "llm_directive": "Acknowledge review completion. Show next review date.",
-                "suggested_response": f"✅ Great explanation of '{concept}'! Review #{item['review_count']} complete. Next review in {next_interval} days ({next_review_date})."
-            }
+        cli_output.emit(output)
+        return True
 
-            print(json.dumps(output, indent=2))
-            return True
+    if candidates:
+        cli_output.emit({
+            "status": "error",
+            "error": f"'{concept}' matches several concepts",
+            "candidates": candidates,
+            "llm_directive": "Ask the user which of the candidate concepts they reviewed, then mark it by its full name."
+        })
+        return False
 
     # Concept not found
     output = {
@@ -188,44 +684,346 @@ def mark_reviewed(topic_slug: str, concept: str, base_dir: str = ".learning"):
         "error": f"Concept '{concept}' not found in review schedule",
         "llm_directive": "Inform user the concept wasn't found. Check spelling or list available concepts."
     }
-    print(json.dumps(output, indent=2))
+    cli_output.emit(output)
     return False
 
 
+def mark_reviewed_batch(topic_slug: str, concepts: list, base_dir: str = ".learning", grades: list = None):
+    """
+    Mark several concepts as reviewed with one aggregated JSON result.
+
+    Args:
+        topic_slug: Slug of the topic
+        concepts: Names of the concepts reviewed
+        base_dir: Base directory for learning data
+        grades: Recall grade (1-4) per concept; defaults to "good"
+    """
+    grades = grades or [schedulers.DEFAULT_GRADE] * len(concepts)
+    results = review_items(topic_slug, concepts, base_dir, grades)
+    reviewed = [{
+        "concept": item["concept"],
+        "grade": grade,
+        "review_count": item["review_count"],
+        "next_review_days": next_interval,
+        "next_review_date": datetime.fromisoformat(item["next_review"]).strftime("%Y-%m-%d")
+    } for (concept, item, next_interval, _), grade in zip(results, grades) if item is not None]
+    not_found = [concept for concept, item, _, candidates in results if item is None and not candidates]
+    ambiguous = {concept: candidates for concept, item, _, candidates in results if item is None and candidates}
+
+    # Output structured JSON for LLM parsing
+    output = {
+        "status": "success" if not (not_found or ambiguous) else ("partial" if reviewed else "error"),
+        "reviewed_count": len(reviewed),
+        "reviewed": reviewed,
+        "not_found": not_found,
+        "ambiguous": ambiguous,
+        "llm_directive": "Acknowledge review completion. Show next review dates." +
+                         (" Inform user which concepts weren't found; check spelling or list available concepts." if not_found else "") +
+                         (" Some names match several concepts: ask which one was meant and mark it by its full name." if ambiguous else ""),
+        "suggested_response": f"✅ Reviewed {len(reviewed)} concept(s)!" + "".join(
+            f"\n- {r['concept']}: next review in {r['next_review_days']} days ({r['next_review_date']})" for r in reviewed
+        )
+    }
+
+    cli_output.emit(output)
+    return not (not_found or ambiguous)
+
+
+def read_concept_list(args: list) -> list:
+    """
+    Read concepts from arguments, or from stdin as a JSON array or NDJSON.
+
+    Stdin entries may be strings or objects with a "concept" field and an
+    optional "grade" field.
+
+    Returns:
+        List of (concept, grade or None) pairs
+    """
+    if args:
+        return [(concept, None) for concept in args]
+
+    data = sys.stdin.read().strip()
+    if not data:
+        return []
+
+    try:
+        parsed = json.loads(data)
+    except ValueError:
+        parsed = [json.loads(line) for line in data.splitlines() if line.strip()]
+    if not isinstance(parsed, list):
+        parsed = [parsed]
+
+    return [(entry["concept"], entry.get("grade")) if isinstance(entry, dict) else (str(entry), None) for entry in parsed]
+
+
+def _load_review_items(topic_slug: str = None, base_dir: str = ".learning") -> list:
+    """Load every review item of a topic, or of all topics when topic_slug is None."""
+    store = learning_db.open_store(base_dir)
+    if store is not None:
+        items = [item for _, _, item in learning_db.all_reviews(store, topic_slug)]
+        store.close()
+        return items
+
+    learning_dir = Path(base_dir)
+    if not learning_dir.exists():
+        return []
+    topic_dirs = [learning_dir / topic_slug] if topic_slug else sorted(learning_dir.iterdir())
+    items = []
+    for topic_dir in topic_dirs:
+        schedule_path = topic_dir / "review_schedule.json"
+        if schedule_path.is_file():
+            items.extend(storage.load_json(schedule_path)["reviews"])
+    return items
+
+
+def forecast_reviews(topic_slug: str = None, days: int = 30, base_dir: str = ".learning") -> list:
+    """
+    Project how many reviews will fall on each of the next `days` days.
+
+    Every item is assumed to be reviewed on the day it becomes due with a
+    "good" grade and is then rescheduled by the configured algorithm, until
+    its next review falls beyond the horizon. Overdue items count toward today.
+
+    Args:
+        topic_slug: Slug of the topic, or None for every topic
+        days: Forecast horizon in days
+        base_dir: Base directory for learning data
+
+    Returns:
+        List of review counts, one per day starting today
+    """
+    scheduler = schedulers.get_scheduler(load_config(base_dir))
+    return scheduler.forecast(_load_review_items(topic_slug, base_dir), datetime.now(), days)
+
+
+def show_forecast(topic_slug: str = None, days: int = 30, base_dir: str = ".learning"):
+    """
+    Display the projected review workload of the next `days` days.
+
+    Args:
+        topic_slug: Slug of the topic, or None for every topic
+        days: Forecast horizon in days
+        base_dir: Base directory for learning data
+    """
+    counts = forecast_reviews(topic_slug, days, base_dir)
+    today = date.today()
+    peak = max(range(days), key=lambda day: counts[day])
+    output = {
+        "status": "success",
+        "algorithm": load_config(base_dir).get("review_algorithm", schedulers.DEFAULT_ALGORITHM),
+        "days": days,
+        "total_reviews": sum(counts),
+        "peak": {"date": (today + timedelta(days=peak)).isoformat(), "count": counts[peak]},
+        "daily": [{"date": (today + timedelta(days=day)).isoformat(), "count": count} for day, count in enumerate(counts)],
+        "llm_directive": "Summarize the upcoming review workload for the user. Mention the busiest day."
+    }
+    cli_output.emit(output)
+
+
+def replan(topic_slug: str = None, base_dir: str = ".learning") -> dict:
+    """
+    Recompute next review dates with the configured algorithm and parameters.
+
+    Args:
+        topic_slug: Slug of the topic, or None for every topic
+        base_dir: Base directory for learning data
+
+    Returns:
+        Dict with the number of items planned and changed
+    """
+    scheduler = schedulers.get_scheduler(load_config(base_dir))
+    store = learning_db.open_store(base_dir)
+
+    if store is not None:
+        rows = learning_db.all_reviews(store, topic_slug)
+        items = [item for _, _, item in rows]
+        before = [item["next_review"] for item in items]
+        changed = scheduler.plan(items)
+        with learning_db.transaction(store):
+            for (row_id, _, item), previous in zip(rows, before):
+                if item["next_review"] != previous:
+                    learning_db.update_review(store, row_id, item)
+        store.close()
+        return {"items": len(items), "changed": changed}
+
+    learning_dir = Path(base_dir)
+    topic_dirs = [learning_dir / topic_slug] if topic_slug else sorted(learning_dir.iterdir())
+    total = changed = 0
+
+    for topic_dir in topic_dirs:
+        schedule_path = topic_dir / "review_schedule.json"
+        if not schedule_path.is_file():
+            continue
+        with storage.locked(topic_dir):
+            schedule = storage.load_json(schedule_path)
+
+            topic_changed = scheduler.plan(schedule["reviews"])
+            total += len(schedule["reviews"])
+            changed += topic_changed
+            if topic_changed:
+                storage.save_json(schedule_path, schedule)
+                rebuild_due_index(topic_dir, schedule)
+                update_catalog(base_dir, topic_dir.name, schedule, activity=False)
+
+    return {"items": total, "changed": changed}
+
+
+def _iter_due_index(topic_dir: Path, schedule_path: Path):
+    """
+    Yield due-index entries in next-review order.
+
+    Streams the sidecar index when it is up to date, otherwise rebuilds it
+    from the schedule first.
+    """
+    index_path = topic_dir / DUE_INDEX_FILE
+    if _due_index_is_fresh(index_path, schedule_path):
+        with open(index_path, "r") as f:
+            for line in f:
+                yield json.loads(line)
+        return
+
+    with storage.locked(topic_dir):
+        # Another process may have refreshed the index while we waited
+        if _due_index_is_fresh(index_path, schedule_path):
+            entries = storage.load_ndjson(index_path)
+        else:
+            entries = rebuild_due_index(topic_dir, storage.load_json(schedule_path))
+    yield from entries
+
+
 def get_due_reviews(topic_slug: str, base_dir: str = ".learning"):
     """
     Get list of concepts due for review.
 
+    Reads the due index in next-review order and stops at the first concept
+    that is not yet due, so the cost depends on the number of due items
+    rather than the size of the schedule.
+
     Args:
         topic_slug: Slug of the topic
         base_dir: Base directory for learning data
 
     Returns:
-        List of concepts due for review
+        List of concepts due for review, most overdue first
     """
+    store = learning_db.open_store(base_dir)
+    if store is not None:
+        now = datetime.now()
+        due_reviews = [{
+            "concept": item["concept"],
+            "days_overdue": (now - datetime.fromisoformat(item["next_review"])).days,
+            "review_count": item["review_count"]
+        } for _, item in learning_db.due_reviews(store, topic_slug, now)]
+        store.close()
+        return due_reviews
+
     topic_dir = Path(base_dir) / topic_slug
     schedule_path = topic_dir / "review_schedule.json"
 
     if not schedule_path.exists():
         return []
 
-    with open(schedule_path, "r") as f:
-        schedule = json.load(f)
+    due_reviews, _ = _scan_due_index(topic_dir, schedule_path, datetime.now())
+    return [item for _, item in due_reviews]
 
-    now = datetime.now()
+
+def _scan_due_index(topic_dir: Path, schedule_path: Path, now: datetime):
+    """
+    Collect due items from a topic's due index.
+
+    Returns:
+        Tuple of ([(next_review_timestamp, review), ...] for due items,
+        timestamp of the next item that is not yet due or None)
+    """
+    now_ts = now.timestamp()
     due_reviews = []
 
-    for item in schedule["reviews"]:
-        next_review = datetime.fromisoformat(item["next_review"])
-        if next_review <= now:
-            days_overdue = (now - next_review).days
+    for next_review_ts, concept, review_count in _iter_due_index(topic_dir, schedule_path):
+        if next_review_ts > now_ts:
+            return due_reviews, next_review_ts
+        days_overdue = (now - datetime.fromtimestamp(next_review_ts)).days
+        due_reviews.append((next_review_ts, {
+            "concept": concept,
+            "days_overdue": days_overdue,
+            "review_count": review_count
+        }))
+
+    return due_reviews, None
+
+
+def get_all_due_reviews(base_dir: str = ".learning"):
+    """
+    Get concepts due for review across every topic in one pass.
+
+    Topics whose schedule has not changed since the last scan and whose next
+    review was still in the future at that time are skipped without being
+    opened, using the status cache in the base directory.
+
+    Args:
+        base_dir: Base directory for learning data
+
+    Returns:
+        Tuple of (due reviews with their topic, most overdue first;
+        dict of due counts per topic)
+    """
+    now = datetime.now()
+
+    store = learning_db.open_store(base_dir)
+    if store is not None:
+        counts = {slug: 0 for slug, _ in learning_db.list_topics(store)}
+        due_reviews = []
+        for topic, item in learning_db.due_reviews(store, None, now):
+            counts[topic] = counts.get(topic, 0) + 1
             due_reviews.append({
+                "topic": topic,
                 "concept": item["concept"],
-                "days_overdue": days_overdue,
+                "days_overdue": (now - datetime.fromisoformat(item["next_review"])).days,
                 "review_count": item["review_count"]
             })
+        store.close()
+        return due_reviews, counts
 
-    return due_reviews
+    learning_dir = Path(base_dir)
+    if not learning_dir.exists():
+        return [], {}
+
+    cache_path = learning_dir / STATUS_CACHE_FILE
+    try:
+        cache = storage.load_json(cache_path, {})
+    except (OSError, ValueError):
+        cache = {}
+
+    now_ts = now.timestamp()
+    new_cache = {}
+    counts = {}
+    merged = []
+
+    for topic_dir in sorted(learning_dir.iterdir()):
+        schedule_path = topic_dir / "review_schedule.json"
+        try:
+            mtime_ns = schedule_path.stat().st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+
+        slug = topic_dir.name
+        cached = cache.get(slug)
+        if cached and cached["mtime_ns"] == mtime_ns and (cached["next_due"] is None or cached["next_due"] > now_ts):
+            new_cache[slug] = cached
+            counts[slug] = 0
+            continue
+
+        due, next_due = _scan_due_index(topic_dir, schedule_path, now)
+        if due:
+            next_due = due[0][0]
+        new_cache[slug] = {"mtime_ns": mtime_ns, "next_due": next_due}
+        counts[slug] = len(due)
+        merged.extend((ts, {"topic": slug, **item}) for ts, item in due)
+
+    if new_cache != cache:
+        storage.save_json(cache_path, new_cache, indent=None)
+
+    merged.sort(key=lambda entry: entry[0])
+    return [item for _, item in merged], counts
 
 
 def show_review_status(topic_slug: str, base_dir: str = ".learning"):
@@ -246,43 +1044,130 @@ def show_review_status(topic_slug: str, base_dir: str = ".learning"):
             "llm_directive": "No reviews needed. Proceed with new learning or ask user what they'd like to learn.",
             "suggested_response": "✅ No reviews due! Ready to learn something new?"
         }
-        print(json.dumps(output, indent=2))
+        cli_output.emit(output)
         return
 
-    # Build suggested prompt for LLM
+    # Build suggested prompt for LLM from one page of the due list
+    output = {"status": "reviews_due", "due_count": len(due)}
+    shown, next_cursor, offset = cli_output.paged(output, "reviews", due)
     review_list = "\n".join([
         f"{i+1}. {item['concept']}" + (f" ({item['days_overdue']} days overdue)" if item['days_overdue'] > 0 else " (due today)")
-        for i, item in enumerate(due)
+        for i, item in enumerate(shown, offset)
     ])
+    if next_cursor is not None:
+        review_list += f"\n... and {len(due) - next_cursor} more"
 
-    output = {
-        "status": "reviews_due",
-        "due_count": len(due),
-        "reviews": due,
+    output.update({
         "llm_directive": "STOP. Conduct review session BEFORE new learning. Ask user to explain each concept. Mark as reviewed after using 'review_scheduler.py review' command.",
         "suggested_prompt": f"📚 You have {len(due)} concept(s) due for review! Let's review them before learning new material:\n\n{review_list}\n\nCan you explain '{due[0]['concept']}' in your own words?"
-    }
+    })
+
+    cli_output.emit(output)
+
+
+def show_all_review_status(base_dir: str = ".learning"):
+    """
+    Display review status across all topics with JSON output for LLM parsing.
+
+    Args:
+        base_dir: Base directory for learning data
+    """
+    due, counts = get_all_due_reviews(base_dir)
+
+    if not due:
+        output = {
+            "status": "no_reviews_due",
+            "due_count": 0,
+            "topics": counts,
+            "reviews": [],
+            "llm_directive": "No reviews needed in any topic. Proceed with new learning or ask user what they'd like to learn.",
+            "suggested_response": "✅ No reviews due! Ready to learn something new?"
+        }
+        cli_output.emit(output)
+        return
 
-    print(json.dumps(output, indent=2))
+    # Build suggested prompt for LLM from one page of the due list
+    output = {"status": "reviews_due", "due_count": len(due)}
+    shown, next_cursor, offset = cli_output.paged(output, "reviews", due)
+    review_list = "\n".join([
+        f"{i+1}. {item['concept']} [{item['topic']}]" + (f" ({item['days_overdue']} days overdue)" if item['days_overdue'] > 0 else " (due today)")
+        for i, item in enumerate(shown, offset)
+    ])
+    if next_cursor is not None:
+        review_list += f"\n... and {len(due) - next_cursor} more"
+
+    output.update({
+        "topics": counts,
+        "llm_directive": "STOP. Conduct review session BEFORE new learning. Ask user to explain each concept. Mark as reviewed with 'review_scheduler.py review <topic> <concept>' using each item's topic.",
+        "suggested_prompt": f"📚 You have {len(due)} concept(s) due for review! Let's review them before learning new material:\n\n{review_list}\n\nCan you explain '{due[0]['concept']}' in your own words?"
+    })
+
+    cli_output.emit(output)
 
 
 if __name__ == "__main__":
     import sys
 
+    learning_daemon.forward(__file__)
+    cli_output.configure()
+
     if len(sys.argv) < 2:
         print("Usage:")
         print("  Add concept:    python3 review_scheduler.py add <topic_slug> <concept>")
-        print("  Mark reviewed:  python3 review_scheduler.py review <topic_slug> <concept>")
+        print("  Add several:    python3 review_scheduler.py add-many <topic_slug> [concepts...]  (or JSON/NDJSON on stdin)")
+        print("  Mark reviewed:  python3 review_scheduler.py review <topic_slug> <concept> [again|hard|good|easy]")
+        print("  Review several: python3 review_scheduler.py review-many <topic_slug> [--grade G] [concepts...]  (or JSON/NDJSON on stdin)")
+        print("  Re-plan dates:  python3 review_scheduler.py replan [topic_slug|--all]")
+        print("  Forecast load:  python3 review_scheduler.py forecast [topic_slug|--all] [days]")
         print("  Show status:    python3 review_scheduler.py status <topic_slug>")
+        print("  All topics:     python3 review_scheduler.py status --all")
         sys.exit(1)
 
     command = sys.argv[1]
 
-    if command == "add" and len(sys.argv) >= 4:
-        add_review_item(sys.argv[2], sys.argv[3])
-    elif command == "review" and len(sys.argv) >= 4:
-        mark_reviewed(sys.argv[2], sys.argv[3])
-    elif command == "status" and len(sys.argv) >= 3:
-        show_review_status(sys.argv[2])
-    else:
-        print("❌ Invalid command or missing arguments")
+    try:
+        if command == "add" and len(sys.argv) >= 4:
+            add_review_item(sys.argv[2], sys.argv[3])
+        elif command == "add-many" and len(sys.argv) >= 3:
+            add_review_items_batch(sys.argv[2], [concept for concept, _ in read_concept_list(sys.argv[3:])])
+        elif command == "review" and len(sys.argv) >= 4:
+            mark_reviewed(sys.argv[2], sys.argv[3], grade=schedulers.parse_grade(sys.argv[4] if len(sys.argv) > 4 else None))
+        elif command == "review-many" and len(sys.argv) >= 3:
+            args = sys.argv[3:]
+            default_grade = None
+            if args[:1] == ["--grade"] and len(args) >= 2:
+                default_grade, args = args[1], args[2:]
+            entries = read_concept_list(args)
+            mark_reviewed_batch(sys.argv[2], [concept for concept, _ in entries],
+                                grades=[schedulers.parse_grade(grade or default_grade) for _, grade in entries])
+        elif command == "forecast":
+            # forecast [topic_slug|--all] [days], by position: a topic slug may be all digits
+            topic = sys.argv[2] if len(sys.argv) >= 3 and sys.argv[2] != "--all" else None
+            days = 30
+            if len(sys.argv) >= 4:
+                if not sys.argv[3].isdigit():
+                    raise ValueError(f"Invalid number of days '{sys.argv[3]}'.")
+                days = max(1, int(sys.argv[3]))
+            show_forecast(topic, days)
+        elif command == "replan":
+            started = datetime.now()
+            topic = sys.argv[2] if len(sys.argv) >= 3 and sys.argv[2] != "--all" else None
+            result = replan(topic)
+            output = {
+                "status": "success",
+                "algorithm": load_config().get("review_algorithm", schedulers.DEFAULT_ALGORITHM),
+                **result,
+                "elapsed_ms": round((datetime.now() - started).total_seconds() * 1000, 1),
+                "llm_directive": "Review schedule re-planned. Inform user how many review dates changed."
+            }
+            cli_output.emit(output)
+        elif command == "status" and len(sys.argv) >= 3 and sys.argv[2] == "--all":
+            show_all_review_status()
+        elif command == "status" and len(sys.argv) >= 3:
+            show_review_status(sys.argv[2])
+        else:
+            print("❌ Invalid command or missing arguments")
+    except ValueError as e:
+        # Invalid grade or malformed JSON input
+        cli_output.emit({"status": "error", "error": str(e)})
+        sys.exit(1)
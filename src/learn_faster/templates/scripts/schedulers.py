@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Pluggable spaced repetition algorithms for the review scheduler.
+
+Each scheduler updates a review item after a graded review and can re-plan
+an item's next review from its stored state alone. Select one in
+.learning/config.json:
+
+    "review_algorithm": "ladder" | "sm2" | "fsrs",
+    "scheduler_params": {...}
+
+Grades use a four-point scale: 1 = again, 2 = hard, 3 = good, 4 = easy.
+"""
+
+import math
+from collections import Counter
+from datetime import datetime, timedelta
+
+
+DEFAULT_ALGORITHM = "ladder"
+
+GRADES = {"again": 1, "hard": 2, "good": 3, "easy": 4}
+DEFAULT_GRADE = GRADES["good"]
+
+
+def parse_grade(value) -> int:
+    """
+    Parse a grade given as a name ("good") or number (1-4).
+
+    Raises:
+        ValueError: If the grade is not recognized
+    """
+    if value is None:
+        return DEFAULT_GRADE
+    text = str(value).strip().lower()
+    if text in GRADES:
+        return GRADES[text]
+    if text in ("1", "2", "3", "4"):
+        return int(text)
+    raise ValueError(f"Invalid grade '{value}'. Use again, hard, good, easy or 1-4.")
+
+
+def _anchor(item: dict) -> datetime:
+    """Time the current interval is measured from: the last review, else the learned date."""
+    return datetime.fromisoformat(item.get("last_reviewed") or item["learned_date"])
+
+
+class Scheduler:
+    """Base class for review scheduling algorithms."""
+
+    name = ""
+    DEFAULT_PARAMS = {}
+    # Item fields the algorithm needs to re-plan an item without a new review
+    STATE_KEYS = ()
+    # Every item field besides dates and review_count that `review` reads or writes
+    STATE_FIELDS = ()
+
+    def __init__(self, params: dict = None):
+        self.params = {**self.DEFAULT_PARAMS, **(params or {})}
+
+    def first_interval(self) -> int:
+        """Days until the first review of a newly added concept."""
+        return 1
+
+    def review(self, item: dict, grade: int, now: datetime) -> int:
+        """
+        Record a graded review on an item and set its next review.
+
+        Args:
+            item: Review item, updated in place
+            grade: Recall grade (1-4)
+            now: Time of the review
+
+        Returns:
+            Interval in days until the next review
+        """
+        item["review_count"] += 1
+        interval = self._review_state(item, grade, now)
+        item["last_reviewed"] = now.isoformat()
+        item["next_review"] = (now + timedelta(days=interval)).isoformat()
+        return interval
+
+    def _review_state(self, item: dict, grade: int, now: datetime) -> int:
+        raise NotImplementedError
+
+    def intervals(self, items: list) -> list:
+        """Compute the current interval in days for each item from its stored state."""
+        raise NotImplementedError
+
+    def plan(self, items: list) -> int:
+        """
+        Recompute next_review for every item from its stored state.
+
+        Used after switching algorithms or changing parameters. Items that were
+        never reviewed, or have no state for this algorithm yet, keep their
+        current date.
+
+        Returns:
+            Number of items whose next review changed
+        """
+        reviewed = [
+            item for item in items
+            if item["review_count"] > 0 and item.get("last_reviewed") and all(key in item for key in self.STATE_KEYS)
+        ]
+        changed = 0
+        for item, interval in zip(reviewed, self.intervals(reviewed)):
+            next_review = (_anchor(item) + timedelta(days=interval)).isoformat()
+            if next_review != item["next_review"]:
+                item["next_review"] = next_review
+                changed += 1
+        return changed
+
+    def _signature(self, item: dict) -> tuple:
+        """Hashable snapshot of the item fields that decide its next interval."""
+        return tuple((key, item[key]) for key in ("review_count",) + self.STATE_FIELDS if key in item)
+
+    def forecast(self, items: list, now: datetime, days: int) -> list:
+        """
+        Simulate the review workload of the next `days` days.
+
+        Each item is reviewed with a "good" grade on the day it falls due and
+        rescheduled until it leaves the horizon. Items that share a due day,
+        scheduling state and elapsed interval form one cohort that is simulated
+        once and weighted by its size, so the cost tracks the number of
+        distinct states rather than the number of items.
+
+        Args:
+            items: Review items (not modified)
+            now: Start of the forecast; overdue items count toward today
+            days: Forecast horizon in days
+
+        Returns:
+            List of review counts, one per day starting today
+        """
+        today = now.date()
+        counts = [0] * days
+        cohorts = Counter()
+
+        for item in items:
+            due = max(now, datetime.fromisoformat(item["next_review"]))
+            day = (due.date() - today).days
+            if day < days:
+                elapsed = (due.date() - _anchor(item).date()).days
+                cohorts[(day, elapsed, self._signature(item))] += 1
+
+        while cohorts:
+            next_cohorts = Counter()
+            for (day, elapsed, signature), count in cohorts.items():
+                counts[day] += count
+                review_time = now + timedelta(days=day)
+                last_reviewed = (review_time - timedelta(days=elapsed)).isoformat()
+                item = {**dict(signature), "learned_date": last_reviewed, "last_reviewed": last_reviewed,
+                        "next_review": review_time.isoformat()}
+                interval = self.review(item, DEFAULT_GRADE, review_time)
+                if day + interval < days:
+                    next_cohorts[(day + interval, interval, self._signature(item))] += count
+            cohorts = next_cohorts
+
+        return counts
+
+
+class LadderScheduler(Scheduler):
+    """Fixed interval ladder indexed by review count; the grade is ignored."""
+
+    name = "ladder"
+    DEFAULT_PARAMS = {"intervals": [1, 3, 7, 14, 30, 60, 90]}
+
+    def first_interval(self) -> int:
+        return self.params["intervals"][0]
+
+    def _review_state(self, item: dict, grade: int, now: datetime) -> int:
+        return self.intervals([item])[0]
+
+    def intervals(self, items: list) -> list:
+        ladder = self.params["intervals"]
+        last = len(ladder) - 1
+        return [ladder[min(item["review_count"], last)] for item in items]
+
+
+class SM2Scheduler(Scheduler):
+    """SuperMemo-2: per-item ease factor, intervals multiplied by ease on success."""
+
+    name = "sm2"
+    DEFAULT_PARAMS = {"initial_ease": 2.5, "minimum_ease": 1.3, "interval_modifier": 1.0}
+    STATE_KEYS = ("ease", "interval_days")
+    STATE_FIELDS = ("ease", "repetitions", "interval_days")
+
+    # Four-point grades mapped onto SM-2's 0-5 quality scale
+    QUALITY = {1: 1, 2: 3, 3: 4, 4: 5}
+
+    def _review_state(self, item: dict, grade: int, now: datetime) -> int:
+        quality = self.QUALITY[grade]
+        ease = item.get("ease", self.params["initial_ease"])
+        repetitions = item.get("repetitions", item["review_count"] - 1)
+        previous = item.get("interval_days") or max(1, (now - _anchor(item)).days)
+
+        if quality < 3:
+            repetitions = 0
+            interval = 1
+        else:
+            if repetitions == 0:
+                interval = 1
+            elif repetitions == 1:
+                interval = 6
+            else:
+                interval = max(1, round(previous * ease))
+            repetitions += 1
+
+        ease += 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02)
+        item["ease"] = round(max(self.params["minimum_ease"], ease), 4)
+        item["repetitions"] = repetitions
+        item["interval_days"] = interval
+        return self.intervals([item])[0]
+
+    def intervals(self, items: list) -> list:
+        modifier = self.params["interval_modifier"]
+        return [max(1, round(item["interval_days"] * modifier)) for item in items]
+
+
+class FSRSScheduler(Scheduler):
+    """
+    Free Spaced Repetition Scheduler (FSRS-4.5) with default weights.
+
+    Tracks memory stability (days until recall probability drops to 90%) and
+    difficulty (1-10) per item, and schedules the next review when predicted
+    recall reaches `desired_retention`.
+    """
+
+    name = "fsrs"
+    DEFAULT_PARAMS = {
+        "weights": [0.4872, 1.4003, 3.7145, 13.8206, 5.1618, 1.2298, 0.8975, 0.031, 1.6474,
+                    0.1367, 1.0461, 2.1072, 0.0793, 0.3246, 1.587, 0.2272, 2.8755],
+        "desired_retention": 0.9,
+        "maximum_interval": 36500
+    }
+
+    STATE_KEYS = ("stability",)
+    STATE_FIELDS = ("stability", "difficulty")
+
+    DECAY = -0.5
+    FACTOR = 19 / 81
+
+    def retrievability(self, elapsed_days: float, stability: float) -> float:
+        """Predicted probability of recall after `elapsed_days` at the given stability."""
+        return (1 + self.FACTOR * elapsed_days / stability) ** self.DECAY
+
+    def _initial_difficulty(self, grade: int) -> float:
+        w = self.params["weights"]
+        return min(10.0, max(1.0, w[4] - (grade - 3) * w[5]))
+
+    def _review_state(self, item: dict, grade: int, now: datetime) -> int:
+        w = self.params["weights"]
+        stability = item.get("stability")
+        difficulty = item.get("difficulty")
+
+        if stability is None and item["review_count"] == 1:
+            # First review ever
+            stability = w[grade - 1]
+            difficulty = self._initial_difficulty(grade)
+        else:
+            if stability is None:
+                # Item scheduled by another algorithm: its current interval was
+                # planned for roughly 90% recall, which is the FSRS definition of stability
+                scheduled = datetime.fromisoformat(item["next_review"]) - _anchor(item)
+                stability = max(0.1, scheduled.total_seconds() / 86400)
+                difficulty = self._initial_difficulty(DEFAULT_GRADE)
+
+            elapsed = max(0.0, (now - _anchor(item)).total_seconds() / 86400)
+            recall = self.retrievability(elapsed, stability)
+
+            difficulty = difficulty - w[6] * (grade - 3)
+            difficulty = w[7] * self._initial_difficulty(DEFAULT_GRADE) + (1 - w[7]) * difficulty
+            difficulty = min(10.0, max(1.0, difficulty))
+
+            if grade == 1:
+                stability = (w[11] * difficulty ** -w[12] * ((stability + 1) ** w[13] - 1)
+                             * math.exp(w[14] * (1 - recall)))
+            else:
+                bonus = w[15] if grade == 2 else w[16] if grade == 4 else 1.0
+                stability = stability * (1 + math.exp(w[8]) * (11 - difficulty) * stability ** -w[9]
+                                         * (math.exp(w[10] * (1 - recall)) - 1) * bonus)
+
+        item["stability"] = round(stability, 4)
+        item["difficulty"] = round(difficulty, 4)
+        return self.intervals([item])[0]
+
+    def intervals(self, items: list) -> list:
+        # Interval at which retrievability falls to desired retention
+        scale = (self.params["desired_retention"] ** (1 / self.DECAY) - 1) / self.FACTOR
+        maximum = self.params["maximum_interval"]
+        return [min(maximum, max(1, round(item["stability"] * scale))) for item in items]
+
+
+SCHEDULERS = {scheduler.name: scheduler for scheduler in (LadderScheduler, SM2Scheduler, FSRSScheduler)}
+
+
+def get_scheduler(config: dict = None) -> Scheduler:
+    """
+    Build the scheduler selected in config.json.
+
+    Args:
+        config: Parsed .learning/config.json contents
+
+    Returns:
+        Scheduler instance (ladder when unset)
+
+    Raises:
+        ValueError: If the configured algorithm is unknown
+    """
+    config = config or {}
+    name = config.get("review_algorithm", DEFAULT_ALGORITHM)
+    if name not in SCHEDULERS:
+        raise ValueError(f"Unknown review algorithm '{name}'. Choose from: {', '.join(SCHEDULERS)}")
+    return SCHEDULERS[name](config.get("scheduler_params"))
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Append-only journal of learning sessions.
+
+log_progress.py writes one JSON line per session to
+.learning/<topic>/sessions.ndjson alongside the free-form progress.md:
+
+    {"v": 1, "session": 12, "ts": "...", "content_sha256": "...",
+     "concepts": ["..."], "duration_min": 45}
+
+Each record is appended with a single O_APPEND write. When the active
+journal grows past JOURNAL_ROLL_BYTES it is compacted into a gzip segment
+(sessions-000001.ndjson.gz, ...) and a fresh journal is started. Replay
+streams the segments in order and then the active journal, so stats never
+need to parse markdown.
+"""
+
+import os
+import gzip
+import json
+import hashlib
+from datetime import datetime
+from pathlib import Path
+
+import cli_output
+import learning_daemon
+import storage
+
+
+JOURNAL_FILE = "sessions.ndjson"
+SEGMENT_PATTERN = "sessions-*.ndjson.gz"
+JOURNAL_VERSION = 1
+
+# Active journal size that triggers compaction into a segment
+JOURNAL_ROLL_BYTES = 1024 * 1024
+
+
+def content_hash(content: str) -> str:
+    """SHA-256 of a session's progress text."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def make_record(session: int, content: str, concepts: list = None, duration_min: float = None,
+                timestamp: datetime = None) -> dict:
+    """Build a journal record for a session."""
+    return {
+        "v": JOURNAL_VERSION,
+        "session": session,
+        "ts": (timestamp or datetime.now()).isoformat(),
+        "content_sha256": content_hash(content),
+        "concepts": list(concepts or []),
+        "duration_min": duration_min
+    }
+
+
+def _write(journal_path: Path, record: dict) -> None:
+    """Append one record to the active journal in a single O_APPEND write."""
+    line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+    fd = os.open(journal_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line)
+    finally:
+        os.close(fd)
+
+
+def append(topic_dir: Path, record: dict) -> None:
+    """
+    Append a record to the topic's journal in one O_APPEND write.
+
+    Compacts the journal into a new segment first when it has grown past
+    JOURNAL_ROLL_BYTES. The first record of a topic is preceded by the
+    sessions logged in progress.md before the journal existed (see backfill).
+    Callers that may run concurrently should hold the topic lock.
+    """
+    journal_path = Path(topic_dir) / JOURNAL_FILE
+    try:
+        if journal_path.stat().st_size >= JOURNAL_ROLL_BYTES:
+            compact(topic_dir)
+    except FileNotFoundError:
+        if not segments(topic_dir):
+            backfill(topic_dir, before=record["session"])
+
+    _write(journal_path, record)
+
+
+def _parse_lines(lines):
+    """Yield valid records, skipping blank or torn lines (e.g. from a crash mid-write)."""
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(record, dict) and "session" in record:
+            yield record
+
+
+def segments(topic_dir: Path) -> list:
+    """Compacted segments of a topic's journal, oldest first."""
+    return sorted(Path(topic_dir).glob(SEGMENT_PATTERN))
+
+
+def replay(topic_dir: Path, since: str = None):
+    """
+    Stream every journal record in the order it was written.
+
+    Args:
+        topic_dir: Topic directory
+        since: Only yield records with a timestamp at or after this ISO date/time
+
+    Yields:
+        Journal records
+    """
+    sources = [(gzip.open, path) for path in segments(topic_dir)]
+    journal_path = Path(topic_dir) / JOURNAL_FILE
+    if journal_path.exists():
+        sources.append((open, journal_path))
+
+    for opener, path in sources:
+        with opener(path, "rt", encoding="utf-8") as f:
+            for record in _parse_lines(f):
+                if since is None or record["ts"] >= since:
+                    yield record
+
+
+def compact(topic_dir: Path) -> dict:
+    """
+    Roll the active journal into a new gzip segment.
+
+    Only valid records are kept. The segment is written atomically before the
+    journal is truncated, so a crash at any point loses nothing. Callers that
+    may run concurrently should hold the topic lock.
+
+    Returns:
+        Summary with the segment name and the number of records compacted
+    """
+    topic_dir = Path(topic_dir)
+    journal_path = topic_dir / JOURNAL_FILE
+    if not journal_path.exists():
+        return {"segment": None, "records": 0}
+
+    with open(journal_path, "r", encoding="utf-8") as f:
+        records = list(_parse_lines(f))
+    if not records:
+        journal_path.unlink()
+        return {"segment": None, "records": 0}
+
+    existing = segments(topic_dir)
+    number = int(existing[-1].name.split("-")[1].split(".")[0]) + 1 if existing else 1
+    segment_path = topic_dir / f"sessions-{number:06d}.ndjson.gz"
+    tmp_path = segment_path.with_name(f".{segment_path.name}.tmp")
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+        f.writelines(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+    with open(tmp_path, "rb") as f:
+        os.fsync(f.fileno())
+    os.replace(tmp_path, segment_path)
+    journal_path.unlink()
+
+    return {"segment": segment_path.name, "records": len(records)}
+
+
+def backfill(topic_dir: Path, before: int = None) -> int:
+    """
+    Create journal records from progress.md for sessions logged before the journal existed.
+
+    Sessions already in the journal are skipped, so running it again only
+    adds what is missing. Durations are unknown for these sessions and
+    recorded as null.
+
+    Args:
+        topic_dir: Topic directory
+        before: Only import sessions numbered below this one
+
+    Returns:
+        Number of records written
+    """
+    topic_dir = Path(topic_dir)
+    progress_path = topic_dir / "progress.md"
+    if not progress_path.exists():
+        return 0
+    journal_path = topic_dir / JOURNAL_FILE
+    journaled = {record["session"] for record in replay(topic_dir)}
+
+    def flush_session():
+        if session is None or session in journaled or (before is not None and session >= before):
+            return 0
+        body = "".join(lines)
+        content, _, concept_block = body.partition("**Concepts learned:**")
+        concepts = [line[2:].strip() for line in concept_block.splitlines() if line.startswith("- ")]
+        _write(journal_path, make_record(session, content.strip("\n"), concepts, timestamp=timestamp))
+        journaled.add(session)
+        return 1
+
+    written = 0
+    session = timestamp = None
+    lines = []
+    with open(progress_path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.startswith("### Session"):
+                written += flush_session()
+                number, _, when = line[len("### Session"):].strip().partition(" - ")
+                session = int(number) if number.isdigit() else None
+                try:
+                    timestamp = datetime.strptime(when.strip(), "%Y-%m-%d %H:%M")
+                except ValueError:
+                    timestamp = None
+                lines = []
+            elif session is not None:
+                lines.append(line)
+    written += flush_session()
+    return written
+
+
+def journal_stats(topic_dir: Path, since: str = None) -> dict:
+    """
+    Summarize sessions by streaming the journal.
+
+    Args:
+        topic_dir: Topic directory
+        since: Only count sessions at or after this ISO date/time
+
+    Returns:
+        Session count, total minutes, distinct concepts, first/last session time,
+        active days and the longest streak of consecutive days
+    """
+    sessions = 0
+    minutes = 0.0
+    concepts = set()
+    first = last = None
+    days = set()
+
+    for record in replay(topic_dir, since):
+        sessions += 1
+        minutes += record.get("duration_min") or 0
+        concepts.update(record.get("concepts", []))
+        # Records imported by a later backfill may follow newer ones
+        first = min(first or record["ts"], record["ts"])
+        last = max(last or record["ts"], record["ts"])
+        days.add(record["ts"][:10])
+
+    ordinals = sorted(datetime.strptime(day, "%Y-%m-%d").toordinal() for day in days)
+    longest = current = 0
+    for i, ordinal in enumerate(ordinals):
+        current = current + 1 if i and ordinal == ordinals[i - 1] + 1 else 1
+        longest = max(longest, current)
+
+    return {
+        "sessions": sessions,
+        "total_minutes": round(minutes, 1),
+        "concepts": len(concepts),
+        "first_session": first,
+        "last_session": last,
+        "active_days": len(days),
+        "longest_streak_days": longest
+    }
+
+
+if __name__ == "__main__":
+    import sys
+
+    learning_daemon.forward(__file__)
+    cli_output.configure()
+
+    if len(sys.argv) < 3:
+        print("Usage:")
+        print("  Session stats:   python3 session_journal.py stats <topic_slug> [since]")
+        print("  Replay records:  python3 session_journal.py replay <topic_slug> [since]")
+        print("  Compact journal: python3 session_journal.py compact <topic_slug>")
+        print("  Import history:  python3 session_journal.py backfill <topic_slug>")
+        sys.exit(1)
+
+    command = sys.argv[1]
+    topic_dir = Path(".learning") / sys.argv[2]
+    since = sys.argv[3] if len(sys.argv) > 3 else None
+
+    if not topic_dir.is_dir():
+        cli_output.emit({"status": "error", "error": f"Topic '{sys.argv[2]}' not found"})
+        sys.exit(1)
+
+    if command == "stats":
+        output = {
+            "status": "success",
+            "topic_slug": sys.argv[2],
+            **journal_stats(topic_dir, since),
+            "llm_directive": "Summarize the learner's consistency: sessions, time spent and streaks."
+        }
+        cli_output.emit(output)
+    elif command == "replay":
+        # One record per line, so the journal can be piped into other tools
+        for record in replay(topic_dir, since):
+            print(json.dumps(record, ensure_ascii=False))
+    elif command == "compact":
+        with storage.locked(topic_dir):
+            result = compact(topic_dir)
+        cli_output.emit({"status": "success", **result})
+    elif command == "backfill":
+        with storage.locked(topic_dir):
+            written = backfill(topic_dir)
+        cli_output.emit({"status": "success", "records": written})
+    else:
+        print("❌ Invalid command or missing arguments")
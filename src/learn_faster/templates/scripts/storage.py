@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Shared file access for the learning scripts.
+
+Every script reads and writes its JSON state through this module. Writes go
+to a temporary file that is fsynced and then renamed over the target, so a
+crash never leaves a truncated file behind, and read-modify-write sequences
+hold an advisory lock on the topic directory (see locked()) so concurrent
+agents don't lose each other's updates.
+
+Inside the learning daemon (see learning_daemon.py) the cache is enabled:
+parsed files stay in memory for as long as they are unchanged on disk, and
+writes are held back so repeated saves of a file are serialized once. They
+are flushed in order when the outermost locked() block exits, before the
+lock is released, and at the end of every command, before its response is
+sent.
+"""
+
+import os
+import json
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:
+    # No advisory locks on this platform; writes are still atomic
+    fcntl = None
+
+
+LOCK_FILE = ".lock"
+
+
+# path -> [data, (mtime_ns, size) or None while a write is pending], None when caching is off
+_cache = None
+
+# path -> (data, serialize, indent) waiting to be written, in write order
+_pending = {}
+
+# lock file path -> [fd, depth] for locks held by this process
+_held_locks = {}
+
+
+@contextmanager
+def locked(directory):
+    """
+    Hold an exclusive advisory lock on a directory's data.
+
+    Wrap every load-modify-save sequence on files in the directory. The lock
+    is re-entrant within a process and released when the block exits, after
+    writes deferred by the cache have been flushed, so other processes never
+    read data older than what this one acted on.
+
+    Args:
+        directory: Directory whose files are being updated (e.g. a topic directory)
+    """
+    lock_path = str(Path(directory).resolve() / LOCK_FILE)
+    held = _held_locks.get(lock_path)
+    if held is not None:
+        held[1] += 1
+        try:
+            yield
+        finally:
+            held[1] -= 1
+        return
+
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        _held_locks[lock_path] = [fd, 1]
+        try:
+            yield
+            flush()
+        finally:
+            del _held_locks[lock_path]
+    finally:
+        # Closing the descriptor releases the lock
+        os.close(fd)
+
+
+def write_atomic(path, text: str) -> None:
+    """
+    Replace a file's contents without ever exposing a partial write.
+
+    Writes to a temporary file in the same directory, fsyncs it and renames
+    it over the target, so readers see either the old or the new contents.
+    """
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        if path.exists():
+            # Keep the permissions of the file being replaced
+            os.chmod(tmp_path, path.stat().st_mode & 0o777)
+        else:
+            os.chmod(tmp_path, 0o666 & ~_umask())
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def _umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+def enable_cache() -> None:
+    """Keep parsed files in memory and defer writes until flush() (or the end of a locked() block)."""
+    global _cache
+    if _cache is None:
+        _cache = {}
+
+
+def _stamp(path: Path):
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _dump_json(data, indent):
+    return json.dumps(data, indent=indent)
+
+
+def _dump_ndjson(rows, indent=None):
+    return "".join(json.dumps(row) + "\n" for row in rows)
+
+
+def _parse_ndjson(text: str) -> list:
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+def _load(path, parse, default):
+    path = Path(path)
+    if _cache is None:
+        if not path.exists():
+            return default
+        with open(path, "r") as f:
+            return parse(f.read())
+
+    key = str(path.resolve())
+    entry = _cache.get(key)
+    if key in _pending:
+        return entry[0]
+    try:
+        stamp = _stamp(path)
+    except FileNotFoundError:
+        _cache.pop(key, None)
+        return default
+    if entry is not None and entry[1] == stamp:
+        return entry[0]
+
+    with open(path, "r") as f:
+        data = parse(f.read())
+    _cache[key] = [data, stamp]
+    return data
+
+
+def _save(path, data, serialize, indent) -> None:
+    path = Path(path)
+    if _cache is None:
+        write_atomic(path, serialize(data, indent))
+        return
+
+    key = str(path.resolve())
+    _cache[key] = [data, None]
+    _pending.pop(key, None)
+    _pending[key] = (data, serialize, indent)
+
+
+def load_json(path, default=None):
+    """
+    Load a JSON file.
+
+    Args:
+        path: File to read
+        default: Value returned when the file does not exist
+
+    Returns:
+        Parsed contents, or default
+    """
+    return _load(path, json.loads, default)
+
+
+def save_json(path, data, indent: int = 2) -> None:
+    """
+    Write data to a JSON file.
+
+    Args:
+        path: File to write
+        data: JSON-serializable data
+        indent: Indentation, or None for compact output
+    """
+    _save(path, data, _dump_json, indent)
+
+
+def load_ndjson(path, default=None):
+    """Load a file with one JSON value per line as a list."""
+    return _load(path, _parse_ndjson, default)
+
+
+def save_ndjson(path, rows: list) -> None:
+    """Write a list as one JSON value per line."""
+    _save(path, rows, _dump_ndjson, None)
+
+
+def flush() -> None:
+    """Write all deferred files to disk in the order they were saved."""
+    while _pending:
+        key = next(iter(_pending))
+        data, serialize, indent = _pending.pop(key)
+        path = Path(key)
+        write_atomic(path, serialize(data, indent))
+        if _cache is not None and key in _cache:
+            _cache[key][1] = _stamp(path)
+
+
+def invalidate() -> None:
+    """Drop deferred writes and cached data, e.g. after a command failed midway."""
+    _pending.clear()
+    if _cache is not None:
+        _cache.clear()
@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+Parsed syllabus tree with incremental progress tracking.
+
+A topic's syllabus.md lists its learning path as checkboxes under phase
+headings:
+
+    ### Phase 1: Foundations
+    - [x] Concept 1.1 - Description
+    - [ ] 🔨 Project: [Hands-on project name]
+
+<topic>/syllabus_index.json caches the parsed tree, keyed on the syllabus
+file's SHA-256 (and its size and mtime, so an unchanged file is recognized
+without reading it):
+
+    {"v": 1, "sha256": "...", "size": 2048, "mtime_ns": ...,
+     "phases": [{"title": "Phase 1: Foundations", "done": 1, "total": 2, "items": [
+        {"id": "1.1", "text": "Concept 1.1 - Description", "kind": "concept",
+         "done": true, "line": 20, "offset": 517}]}],
+     "checklists": [{"title": "Success Criteria", "done": 0, "total": 3, "items": [...]}],
+     "done": 1, "total": 2}
+
+Checkboxes outside phases (e.g. Success Criteria) form checklists, which are
+reported but not part of the learning path. `complete` rewrites the single
+byte inside the item's checkbox at its recorded offset and updates the
+cached counts, so the syllabus is only parsed again after it was edited
+some other way.
+"""
+
+import re
+import hashlib
+from pathlib import Path
+
+import catalog
+import cli_output
+import learning_daemon
+import learning_db
+import storage
+
+
+INDEX_FILE = "syllabus_index.json"
+INDEX_VERSION = 1
+SYLLABUS_FILE = "syllabus.md"
+
+HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+PHASE_HEADING = re.compile(r"^#{1,6}\s+(.*\bphase\b.*?)\s*#*\s*$", re.IGNORECASE)
+CHECKBOX = re.compile(r"^(\s*[-*+]\s+\[)([ xX])(\]\s+)(.*?)\s*$")
+FENCE = re.compile(r"^\s*(```|~~~)")
+PROJECT = re.compile(r"🔨|^\**project\b", re.IGNORECASE)
+
+
+def parse(data: bytes) -> dict:
+    """
+    Parse syllabus markdown into phases and checklists of checkbox items.
+
+    Args:
+        data: Contents of syllabus.md
+
+    Returns:
+        Tree with "phases", "checklists" and learning-path "done"/"total"
+        counts (see the module docstring)
+    """
+    phases, checklists = [], []
+    phase = phase_level = None
+    section = None
+    fenced = False
+    offset = 0
+    for number, raw in enumerate(data.splitlines(keepends=True), start=1):
+        line = raw.decode("utf-8", errors="replace")
+        line_offset = offset
+        offset += len(raw)
+
+        if FENCE.match(line):
+            fenced = not fenced
+            continue
+        if fenced:
+            continue
+
+        heading = HEADING.match(line)
+        if heading:
+            level = len(heading.group(1))
+            if PHASE_HEADING.match(line):
+                phase, phase_level = {"title": heading.group(2), "items": []}, level
+                phases.append(phase)
+            elif phase is not None and level <= phase_level:
+                # A heading at the phase's level or above ends the learning path section
+                phase = None
+            section = None if phase is not None else heading.group(2)
+            continue
+
+        box = CHECKBOX.match(line)
+        if not box:
+            continue
+        text = box.group(4)
+        item = {
+            "text": text,
+            "kind": "project" if PROJECT.search(text) else "concept",
+            "done": box.group(2) != " ",
+            "line": number,
+            "offset": line_offset + len(box.group(1).encode("utf-8"))
+        }
+        if phase is not None:
+            item["id"] = f"{len(phases)}.{len(phase['items']) + 1}"
+            phase["items"].append(item)
+        else:
+            if not checklists or checklists[-1]["title"] != section:
+                checklists.append({"title": section, "items": []})
+            item["id"] = f"c{len(checklists)}.{len(checklists[-1]['items']) + 1}"
+            checklists[-1]["items"].append(item)
+
+    for group in phases + checklists:
+        group["done"] = sum(1 for item in group["items"] if item["done"])
+        group["total"] = len(group["items"])
+    return {
+        "phases": phases,
+        "checklists": checklists,
+        "done": sum(phase["done"] for phase in phases),
+        "total": sum(phase["total"] for phase in phases)
+    }
+
+
+def _index(syllabus_path: Path, data: bytes, tree: dict) -> dict:
+    stat = syllabus_path.stat()
+    return {"v": INDEX_VERSION, "sha256": hashlib.sha256(data).hexdigest(),
+            "size": stat.st_size, "mtime_ns": stat.st_mtime_ns, **tree}
+
+
+def load_tree(topic_dir: Path):
+    """
+    Return a topic's syllabus tree, from the index when the syllabus is unchanged.
+
+    The syllabus is only read when its size or mtime differ from the index,
+    and only parsed again when its hash differs too.
+
+    Returns:
+        Index with the tree (see the module docstring), or None if the topic
+        has no syllabus
+    """
+    syllabus_path = Path(topic_dir) / SYLLABUS_FILE
+    index_path = Path(topic_dir) / INDEX_FILE
+    try:
+        stat = syllabus_path.stat()
+    except FileNotFoundError:
+        return None
+
+    index = storage.load_json(index_path)
+    if isinstance(index, dict) and index.get("v") == INDEX_VERSION \
+            and index["size"] == stat.st_size and index["mtime_ns"] == stat.st_mtime_ns:
+        return index
+
+    with storage.locked(topic_dir):
+        data = syllabus_path.read_bytes()
+        if isinstance(index, dict) and index.get("v") == INDEX_VERSION \
+                and index["sha256"] == hashlib.sha256(data).hexdigest():
+            # Touched but not changed: keep the tree, remember the new stat
+            index = {**index, **_index(syllabus_path, data, {})}
+        else:
+            index = _index(syllabus_path, data, parse(data))
+        storage.save_json(index_path, index, indent=None)
+    return index
+
+
+def _items(index: dict):
+    for group in index["phases"] + index["checklists"]:
+        for item in group["items"]:
+            yield group, item
+
+
+def find_item(index: dict, query: str):
+    """
+    Find a syllabus item by id ("1.2", "c1.1"), text, or unambiguous text prefix or fragment.
+
+    Returns:
+        Tuple of ((group, item) or None, list of ambiguous matches' texts)
+    """
+    items = list(_items(index))
+    for group, item in items:
+        if item["id"] == query:
+            return (group, item), []
+
+    key = query.strip().casefold()
+    for test in (lambda text: text == key, lambda text: text.startswith(key), lambda text: key in text):
+        matches = [(group, item) for group, item in items if test(item["text"].casefold())]
+        if len(matches) == 1:
+            return matches[0], []
+        if matches:
+            return None, [item["text"] for _, item in matches]
+    return None, []
+
+
+def set_done(topic_dir: Path, query: str, done: bool = True) -> dict:
+    """
+    Check (or uncheck) one syllabus item, editing only its checkbox in place.
+
+    Args:
+        topic_dir: Topic directory holding syllabus.md
+        query: Item id, text, or unambiguous text prefix or fragment
+        done: Whether to check the item (False unchecks it)
+
+    Returns:
+        Dict with "status" ("success", "unchanged", "not_found", "ambiguous"
+        or "no_syllabus") and, when found, "item", "phase" and the index
+    """
+    topic_dir = Path(topic_dir)
+    syllabus_path = topic_dir / SYLLABUS_FILE
+    with storage.locked(topic_dir):
+        index = load_tree(topic_dir)
+        if index is None:
+            return {"status": "no_syllabus"}
+        found, candidates = find_item(index, query)
+        if found is None:
+            return {"status": "ambiguous" if candidates else "not_found", "candidates": candidates}
+        group, item = found
+        result = {"item": item, "phase": group["title"], "index": index}
+        if item["done"] == done:
+            return {"status": "unchanged", **result}
+
+        data = bytearray(syllabus_path.read_bytes())
+        if data[item["offset"] - 1:item["offset"] + 2].lower() not in (b"[ ]", b"[x]"):
+            # The file changed under the index's stat: parse it again before editing
+            index = _index(syllabus_path, bytes(data), parse(bytes(data)))
+            storage.save_json(topic_dir / INDEX_FILE, index, indent=None)
+            return set_done(topic_dir, query, done)
+
+        mark = b"x" if done else b" "
+        data[item["offset"]:item["offset"] + 1] = mark
+        with open(syllabus_path, "r+b") as f:
+            f.seek(item["offset"])
+            f.write(mark)
+
+        step = 1 if done else -1
+        item["done"] = done
+        group["done"] += step
+        if not item["id"].startswith("c"):
+            index["done"] += step
+        index.update(_index(syllabus_path, bytes(data), {}))
+        storage.save_json(topic_dir / INDEX_FILE, index, indent=None)
+    return {"status": "success", **result}
+
+
+def next_items(index: dict, count: int = 1) -> list:
+    """The first `count` unchecked learning-path items, in syllabus order, with their phase."""
+    upcoming = []
+    for phase in index["phases"]:
+        if phase["done"] == phase["total"]:
+            continue
+        for item in phase["items"]:
+            if not item["done"]:
+                upcoming.append({**_public(item), "phase": phase["title"]})
+                if len(upcoming) == count:
+                    return upcoming
+    return upcoming
+
+
+def current_phase(index: dict):
+    """Title of the first phase with unchecked items, or None when the learning path is complete."""
+    return next((phase["title"] for phase in index["phases"] if phase["done"] < phase["total"]), None)
+
+
+def progress(index: dict) -> dict:
+    """Completion counts of the learning path, per phase and per checklist."""
+    def counts(group: dict) -> dict:
+        return {"title": group["title"], "done": group["done"], "total": group["total"]}
+
+    projects = [item for phase in index["phases"] for item in phase["items"] if item["kind"] == "project"]
+    return {
+        "done": index["done"],
+        "total": index["total"],
+        "percent": round(index["done"] / index["total"] * 100, 1) if index["total"] else 0.0,
+        "current_phase": current_phase(index),
+        "projects_done": sum(1 for item in projects if item["done"]),
+        "projects_total": len(projects),
+        "phases": [counts(phase) for phase in index["phases"]],
+        "checklists": [counts(checklist) for checklist in index["checklists"]]
+    }
+
+
+def _public(item: dict) -> dict:
+    return {key: item[key] for key in ("id", "text", "kind", "done")}
+
+
+def _touch_catalog(base_dir: str, topic_slug: str) -> None:
+    # The SQLite backend summarizes topics from its tables, not catalog.json
+    if not learning_db.is_enabled(base_dir):
+        catalog.touch(base_dir, topic_slug)
+
+
+def _topic_dir(topic_slug: str, base_dir: str):
+    topic_dir = Path(base_dir) / topic_slug
+    if (topic_dir / SYLLABUS_FILE).is_file():
+        return topic_dir
+    cli_output.emit({
+        "status": "error",
+        "error": f"No syllabus for topic '{topic_slug}'",
+        "llm_directive": "Inform user the topic or its syllabus was not found. Suggest listing topics or generating the syllabus."
+    })
+    return None
+
+
+if __name__ == "__main__":
+    import sys
+
+    learning_daemon.forward(__file__)
+    cli_output.configure()
+
+    if len(sys.argv) < 3:
+        print("Usage:")
+        print("  Next items:     python3 syllabus.py next <topic_slug> [count]")
+        print("  Complete item:  python3 syllabus.py complete <topic_slug> <item id or text> [--undo]")
+        print("  Progress:       python3 syllabus.py progress <topic_slug>")
+        sys.exit(1)
+
+    command, topic_slug = sys.argv[1], sys.argv[2]
+    base_dir = ".learning"
+
+    if command == "next":
+        topic_dir = _topic_dir(topic_slug, base_dir)
+        if topic_dir is None:
+            sys.exit(1)
+        index = load_tree(topic_dir)
+        upcoming = next_items(index, int(sys.argv[3]) if len(sys.argv) > 3 else 1)
+        if upcoming:
+            item = upcoming[0]
+            cli_output.emit({
+                "status": "success",
+                "next": upcoming,
+                "done": index["done"],
+                "total": index["total"],
+                "llm_directive": f"Teach '{item['text']}' ({item['phase']}) next."
+                                 + (" It is a hands-on project: guide the user through building it." if item["kind"] == "project" else "")
+                                 + f" When the user has learned it, run 'python3 .learning/scripts/syllabus.py complete {topic_slug} {item['id']}'.",
+                "suggested_response": f"Next up: {item['text']} ({item['phase']})"
+            })
+        else:
+            cli_output.emit({
+                "status": "complete",
+                "next": [],
+                "done": index["done"],
+                "total": index["total"],
+                "llm_directive": "Every learning-path item is checked. Congratulate the user, review the Success Criteria and suggest a comprehensive project or exam.",
+                "suggested_response": "🏆 You've completed every item in the syllabus!"
+            })
+
+    elif command == "complete" and len(sys.argv) >= 4:
+        topic_dir = _topic_dir(topic_slug, base_dir)
+        if topic_dir is None:
+            sys.exit(1)
+        query = " ".join(arg for arg in sys.argv[3:] if arg != "--undo")
+        result = set_done(topic_dir, query, done="--undo" not in sys.argv[3:])
+        if result["status"] in ("not_found", "ambiguous"):
+            cli_output.emit({
+                "status": "error",
+                "error": f"Item '{query}' " + ("matches several items" if result["candidates"] else "not found"),
+                "candidates": result["candidates"],
+                "llm_directive": "Ask the user which item they meant, or run 'syllabus.py next' to get item ids."
+            })
+            sys.exit(1)
+        if result["status"] == "success":
+            _touch_catalog(base_dir, topic_slug)
+        index = result["index"]
+        upcoming = next_items(index)
+        cli_output.emit({
+            "status": result["status"],
+            "item": {**_public(result["item"]), "phase": result["phase"]},
+            "progress": {"done": index["done"], "total": index["total"]},
+            "next": upcoming,
+            "llm_directive": (f"Item marked. Continue with '{upcoming[0]['text']}' next." if upcoming
+                              else "Learning path complete: congratulate the user and review the Success Criteria."),
+            "suggested_response": f"✅ {result['item']['text']} ({index['done']}/{index['total']} items done)"
+        })
+
+    elif command == "progress":
+        topic_dir = _topic_dir(topic_slug, base_dir)
+        if topic_dir is None:
+            sys.exit(1)
+        report = progress(load_tree(topic_dir))
+        cli_output.emit({
+            "status": "success",
+            **report,
+            "llm_directive": "Use these counts for the syllabus part of the progress report; don't re-count checkboxes in syllabus.md.",
+            "suggested_response": f"Syllabus: {report['percent']}% ({report['done']}/{report['total']} items)"
+                                  + (f" | Phase: {report['current_phase']}" if report["current_phase"] else "")
+        })
+
+    else:
+        print("❌ Invalid command or missing arguments")
@@ -0,0 +1,77 @@
+"""
+Shared fixtures for the learning script tests.
+
+The scripts in src/learn_faster/templates/scripts are copied into projects
+and import each other as top-level modules, so the tests put that directory
+on sys.path and import them the same way. The CLI package is imported from
+src (pytest's pythonpath in pyproject.toml).
+"""
+
+import os
+import sys
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "src" / "learn_faster" / "templates" / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import cli_output  # noqa: E402
+import storage  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def isolated_scripts(monkeypatch):
+    """Give every test compact output, default paging and an empty storage cache."""
+    monkeypatch.setattr(cli_output, "_options", dict(cli_output._options, compact=True, fields=None,
+                                                     limit=cli_output.DEFAULT_LIMIT, cursor={}))
+    monkeypatch.setattr(storage, "_cache", None)
+    monkeypatch.setattr(storage, "_pending", {})
+    monkeypatch.setenv("LEARN_FASTER_OUTPUT", "compact")
+    monkeypatch.delenv("LEARN_FASTER_FIELDS", raising=False)
+    monkeypatch.delenv("LEARN_FASTER_LIMIT", raising=False)
+
+
+@pytest.fixture
+def base_dir(tmp_path, monkeypatch):
+    """An empty project: the working directory is tmp_path and .learning is returned."""
+    monkeypatch.chdir(tmp_path)
+    learning_dir = tmp_path / ".learning"
+    learning_dir.mkdir()
+    return learning_dir
+
+
+@pytest.fixture
+def make_topic(base_dir, capsys):
+    """Create a topic with init_learning and return its directory."""
+    import init_learning
+
+    def make(name: str = "Algo Topic") -> Path:
+        topic_dir = Path(init_learning.init_learning_topic(name, str(base_dir)))
+        capsys.readouterr()
+        return topic_dir
+
+    return make
+
+
+def read_output(capsys) -> dict:
+    """Parse the last JSON document a script printed."""
+    lines = [line for line in capsys.readouterr().out.splitlines() if line.strip()]
+    return json.loads(lines[-1])
+
+
+def set_next_reviews(topic_dir, offsets: dict) -> None:
+    """Move review items' next review by day offsets from now, as a hand edit would."""
+    schedule_path = topic_dir / "review_schedule.json"
+    schedule = json.loads(schedule_path.read_text())
+    for item in schedule["reviews"]:
+        if item["concept"] in offsets:
+            item["next_review"] = (datetime.now() + timedelta(days=offsets[item["concept"]])).isoformat()
+    schedule_path.write_text(json.dumps(schedule))
+    # Make sure the index looks older than the edit, however coarse the clock
+    index_path = topic_dir / "review_schedule.idx"
+    if index_path.exists():
+        stat = schedule_path.stat()
+        os.utime(index_path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10 ** 9))
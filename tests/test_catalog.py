@@ -0,0 +1,92 @@
+"""The materialized topic catalog (catalog.json)."""
+
+import os
+import json
+import shutil
+
+import pytest
+
+import catalog
+import generate_syllabus
+import storage
+
+
+def _lock_held(directory) -> bool:
+    return str(directory.resolve() / storage.LOCK_FILE) in storage._held_locks
+
+
+def test_list_drops_deleted_topics(base_dir, make_topic):
+    make_topic("Algo Topic")
+    make_topic("Other Topic")
+    assert sorted(catalog.load(str(base_dir))) == ["algo-topic", "other-topic"]
+
+    shutil.rmtree(base_dir / "other-topic")
+    assert [topic["topic"] for topic in generate_syllabus.list_topics(str(base_dir))] == ["Algo Topic"]
+    saved = json.loads((base_dir / catalog.CATALOG_FILE).read_text())
+    assert list(saved["topics"]) == ["algo-topic"]
+
+
+def test_info_of_deleted_topic(base_dir, make_topic):
+    topic_dir = make_topic()
+    shutil.rmtree(topic_dir)
+    assert generate_syllabus.get_topic_info("algo-topic", str(base_dir)) is None
+    assert catalog.load(str(base_dir)) == {}
+
+
+def test_rebuild_scans_under_the_lock(base_dir, make_topic, monkeypatch):
+    make_topic()
+    scanned = []
+    scan_topic = catalog.scan_topic
+
+    def checked_scan(topic_dir):
+        scanned.append(_lock_held(base_dir))
+        return scan_topic(topic_dir)
+
+    monkeypatch.setattr(catalog, "scan_topic", checked_scan)
+    assert list(catalog.rebuild(str(base_dir))) == ["algo-topic"]
+    assert scanned and all(scanned)
+
+
+def test_missing_catalog_is_rebuilt(base_dir, make_topic):
+    make_topic()
+    (base_dir / catalog.CATALOG_FILE).unlink()
+    entry = catalog.load(str(base_dir))["algo-topic"]
+    assert entry["topic"] == "Algo Topic"
+    assert entry["concept_count"] == 0
+
+
+def _edit_metadata(topic_dir, **fields):
+    path = topic_dir / "metadata.json"
+    metadata = json.loads(path.read_text())
+    metadata.update(fields)
+    path.write_text(json.dumps(metadata))
+    stat = path.stat()
+    # Make sure the edit shows up even on file systems with coarse timestamps
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_hand_edited_metadata_is_picked_up(base_dir, make_topic):
+    topic_dir = make_topic()
+    assert generate_syllabus.get_topic_info("algo-topic", str(base_dir))["sessions"] == 0
+
+    _edit_metadata(topic_dir, total_sessions=7, status="completed")
+    info = generate_syllabus.get_topic_info("algo-topic", str(base_dir))
+    assert info["sessions"] == 7 and info["status"] == "completed"
+    assert [topic["sessions"] for topic in generate_syllabus.list_topics(str(base_dir))] == [7]
+    saved = json.loads((base_dir / catalog.CATALOG_FILE).read_text())["topics"]["algo-topic"]
+    assert saved["metadata_mtime_ns"] == (topic_dir / "metadata.json").stat().st_mtime_ns
+
+
+def test_unchanged_topics_are_not_scanned(base_dir, make_topic, monkeypatch):
+    make_topic()
+    catalog.load(str(base_dir))
+    monkeypatch.setattr(catalog, "scan_topic", lambda topic_dir: pytest.fail(f"scanned {topic_dir}"))
+    assert list(catalog.load(str(base_dir))) == ["algo-topic"]
+
+
+def test_update_after_a_hand_edit_keeps_the_edit(base_dir, make_topic):
+    topic_dir = make_topic()
+    catalog.load(str(base_dir))
+    _edit_metadata(topic_dir, total_sessions=4)
+    catalog.touch(str(base_dir), "algo-topic")
+    assert catalog.load(str(base_dir))["algo-topic"]["sessions"] == 4
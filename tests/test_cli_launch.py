@@ -0,0 +1,111 @@
+"""Launching the coach and the files the CLI writes into .learning."""
+
+import os
+import sys
+import json
+import errno
+import subprocess
+
+import pytest
+
+from learn_faster.cli import main
+
+
+@pytest.fixture
+def launched(base_dir, monkeypatch):
+    """Run launch_coach with subprocess.run recorded instead of started."""
+    commands = []
+    monkeypatch.setattr(subprocess, "run", lambda cmd, check=False: commands.append(cmd))
+    monkeypatch.delenv(main.PROMPT_VIA_ENV, raising=False)
+    return commands
+
+
+def test_prompt_is_passed_inline_by_default(launched, base_dir):
+    main.launch_coach(auto_review=True)
+    cmd = launched[-1]
+    assert cmd[:2] == ["claude", "--system-prompt"]
+    assert cmd[2] == (base_dir / main.PROMPT_CACHE_FILE).read_text(encoding="utf-8")
+    assert cmd[3:] == ["/review"]
+
+
+def test_prompt_file_is_opt_in(launched, base_dir, monkeypatch):
+    monkeypatch.setenv(main.PROMPT_VIA_ENV, "file")
+    main.launch_coach()
+    assert launched[-1] == ["claude", "--system-prompt-file", str(base_dir.resolve() / main.PROMPT_CACHE_FILE)]
+
+
+def _large_prompt(base_dir, monkeypatch) -> int:
+    """Make the compiled prompt larger than ARG_MAX; returns its size."""
+    size = max(os.sysconf("SC_ARG_MAX"), main.MAX_ARG_BYTES) + 1024
+    prompt_path = base_dir / main.PROMPT_CACHE_FILE
+    prompt_path.write_text("x" * size, encoding="utf-8")
+    monkeypatch.setattr(main, "compile_system_prompt", lambda mode: prompt_path.resolve())
+    return size
+
+
+def test_prompt_larger_than_arg_max_goes_by_file(launched, base_dir, monkeypatch):
+    _large_prompt(base_dir, monkeypatch)
+    main.launch_coach(auto_review=True)
+    assert launched[-1] == ["claude", "--system-prompt-file", str(base_dir.resolve() / main.PROMPT_CACHE_FILE),
+                            "/review"]
+
+
+def test_argument_list_too_long_falls_back_to_the_file(base_dir, monkeypatch):
+    commands = []
+
+    def run(cmd, check=False):
+        commands.append(cmd)
+        if cmd[1] == "--system-prompt":
+            raise OSError(errno.E2BIG, "Argument list too long")
+
+    monkeypatch.setattr(subprocess, "run", run)
+    monkeypatch.setenv(main.PROMPT_VIA_ENV, "inline")
+    main.launch_coach()
+    assert [cmd[1] for cmd in commands] == ["--system-prompt", "--system-prompt-file"]
+
+
+def test_launch_with_a_prompt_larger_than_arg_max(base_dir, monkeypatch):
+    size = _large_prompt(base_dir, monkeypatch)
+    bin_dir = base_dir.parent / "bin"
+    bin_dir.mkdir()
+    fake_claude = bin_dir / "claude"
+    fake_claude.write_text(
+        f"#!{sys.executable}\n"
+        "import sys, json, pathlib\n"
+        "args = sys.argv[1:]\n"
+        "prompt = pathlib.Path(args[1]).read_text() if args[0] == '--system-prompt-file' else args[1]\n"
+        "pathlib.Path('launched.json').write_text(json.dumps({'flag': args[0], 'size': len(prompt)}))\n"
+    )
+    fake_claude.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.delenv(main.PROMPT_VIA_ENV, raising=False)
+
+    main.launch_coach()
+    launched = json.loads((base_dir.parent / "launched.json").read_text())
+    assert launched == {"flag": "--system-prompt-file", "size": size}
+
+
+def test_prompt_cache_is_written_atomically(launched, base_dir, monkeypatch):
+    written = []
+    write_atomic = main.write_atomic
+    monkeypatch.setattr(main, "write_atomic", lambda path, text: (written.append(path.name), write_atomic(path, text)))
+
+    main.launch_coach()
+    assert sorted(written) == [main.PROMPT_CACHE_META, main.PROMPT_CACHE_FILE]
+    assert json.loads((base_dir / main.PROMPT_CACHE_META).read_text())["mode"] == "balanced"
+    assert not list(base_dir.glob(".*.tmp"))
+
+    # Unchanged template: nothing is rewritten
+    written.clear()
+    main.launch_coach()
+    assert written == []
+
+
+def test_write_atomic_keeps_permissions(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text("{}")
+    path.chmod(0o600)
+    main.write_atomic(path, '{"a": 1}')
+    assert json.loads(path.read_text()) == {"a": 1}
+    assert path.stat().st_mode & 0o777 == 0o600
+    assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
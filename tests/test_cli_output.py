@@ -0,0 +1,73 @@
+"""Output options: projection and paging of read listings."""
+
+import json
+from datetime import datetime, timedelta
+
+import cli_output
+import review_scheduler
+from conftest import read_output
+
+
+def test_only_requested_lists_are_paged(capsys):
+    cli_output.emit({"status": "success", "reviews": list(range(60)), "written": list(range(60))},
+                    paginate="reviews")
+    output = read_output(capsys)
+    assert output["reviews"] == list(range(50))
+    assert output["reviews_total"] == 60
+    assert output["reviews_next_cursor"] == "reviews:50"
+    assert output["written"] == list(range(60))
+    assert "next_cursor" not in output
+
+
+def test_each_paged_list_has_its_own_cursor(capsys):
+    argv = ["script.py", "--cursor", "b:50", "--limit=50"]
+    cli_output.configure(argv)
+    assert argv == ["script.py"]
+    cli_output.emit({"a": list(range(60)), "b": list(range(60))}, paginate=("a", "b"))
+    output = read_output(capsys)
+    assert output["a"] == list(range(50)) and output["a_next_cursor"] == "a:50"
+    assert output["b"] == list(range(50, 60)) and output["b_next_cursor"] is None
+
+
+def test_plain_cursor_applies_to_every_list(capsys):
+    cli_output.configure(["script.py", "--cursor", "10", "--limit", "5"])
+    cli_output.emit({"a": list(range(20))}, paginate="a")
+    assert read_output(capsys)["a"] == [10, 11, 12, 13, 14]
+
+
+def test_fields_keep_paging_metadata(capsys):
+    cli_output.configure(["script.py", "--fields", "reviews"])
+    cli_output.emit({"status": "success", "reviews": list(range(60))}, paginate="reviews")
+    assert set(read_output(capsys)) == {"reviews", "reviews_total", "reviews_next_cursor"}
+
+
+def test_write_results_are_never_cut(base_dir, make_topic, capsys):
+    make_topic()
+    concepts = [f"Concept {n}" for n in range(60)]
+    assert review_scheduler.add_review_items_batch("algo-topic", concepts, str(base_dir))
+    output = read_output(capsys)
+    assert output["added_count"] == 60
+    assert len(output["concepts"]) == 60
+    assert not any(key.endswith("next_cursor") for key in output)
+
+
+def test_due_reviews_page_through(base_dir, make_topic, capsys):
+    topic_dir = make_topic()
+    review_scheduler.add_review_items("algo-topic", [f"Concept {n}" for n in range(60)], str(base_dir))
+    schedule_path = topic_dir / "review_schedule.json"
+    schedule = json.loads(schedule_path.read_text())
+    for n, item in enumerate(schedule["reviews"]):
+        item["next_review"] = (datetime.now() - timedelta(days=1, minutes=n)).isoformat()
+    schedule_path.write_text(json.dumps(schedule))
+    (topic_dir / review_scheduler.DUE_INDEX_FILE).unlink()
+
+    review_scheduler.show_review_status("algo-topic", str(base_dir))
+    first = read_output(capsys)
+    assert first["due_count"] == 60 and len(first["reviews"]) == 50
+
+    cli_output.configure(["script.py", "--cursor", first["reviews_next_cursor"]])
+    review_scheduler.show_review_status("algo-topic", str(base_dir))
+    second = read_output(capsys)
+    assert len(second["reviews"]) == 10 and second["reviews_next_cursor"] is None
+    seen = {item["concept"] for item in first["reviews"] + second["reviews"]}
+    assert len(seen) == 60
@@ -0,0 +1,94 @@
+"""Name resolution of the review scheduler and the concept quiz."""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+import concept_names
+import concept_quiz
+import learning_db
+import review_scheduler
+from conftest import read_output
+
+
+def _add_legacy_item(topic_dir, concept: str) -> None:
+    """Append an overdue review item without a concept document, as older versions wrote them."""
+    schedule_path = topic_dir / "review_schedule.json"
+    schedule = json.loads(schedule_path.read_text())
+    schedule["reviews"].append({
+        "concept": concept,
+        "learned_date": (datetime.now() - timedelta(days=10)).isoformat(),
+        "review_count": 0,
+        "next_review": (datetime.now() - timedelta(days=2)).isoformat(),
+        "last_reviewed": None
+    })
+    schedule.pop("concept_index", None)
+    schedule_path.write_text(json.dumps(schedule))
+
+
+def _reviews(base_dir, slug: str) -> dict:
+    return {item["concept"]: item for item in review_scheduler._load_review_items(slug, str(base_dir))}
+
+
+def test_registry_prefers_names_over_aliases():
+    registry = concept_names.ConceptRegistry({"graph": "Graph", "graph-theory": "Graph theory"},
+                                             {"graph": "graph-theory"})
+    assert registry.resolve("graph") == "graph"
+    registry.add_alias("Graph", "graph-theory")
+    assert registry.resolve("Graph") == "graph"
+
+
+def test_registry_lookup_reports_ambiguous_prefixes():
+    registry = concept_names.ConceptRegistry({"graph-theory": "Graph theory", "graph-coloring": "Graph coloring"})
+    assert registry.lookup("graph t") == ("graph-theory", [])
+    slug, candidates = registry.lookup("gra")
+    assert slug is None
+    assert sorted(candidates) == ["Graph coloring", "Graph theory"]
+
+
+@pytest.mark.parametrize("sqlite", [False, True])
+def test_exact_schedule_item_wins_over_prefix(base_dir, make_topic, capsys, sqlite):
+    topic_dir = make_topic()
+    review_scheduler.add_review_items("algo-topic", ["Graph theory"], str(base_dir))
+    _add_legacy_item(topic_dir, "Graph")
+    if sqlite:
+        learning_db.migrate(str(base_dir))
+
+    (_, item, _, candidates), = review_scheduler.review_items("algo-topic", ["Graph"], str(base_dir))
+
+    assert item["concept"] == "Graph" and candidates == []
+    reviews = _reviews(base_dir, "algo-topic")
+    assert reviews["Graph"]["review_count"] == 1
+    assert reviews["Graph theory"]["review_count"] == 0
+
+
+@pytest.mark.parametrize("sqlite", [False, True])
+def test_ambiguous_prefix_is_reported(base_dir, make_topic, capsys, sqlite):
+    make_topic()
+    review_scheduler.add_review_items("algo-topic", ["Graph theory", "Graph coloring"], str(base_dir))
+    if sqlite:
+        learning_db.migrate(str(base_dir))
+
+    assert review_scheduler.mark_reviewed("algo-topic", "Gra", str(base_dir)) is False
+    output = read_output(capsys)
+    assert sorted(output["candidates"]) == ["Graph coloring", "Graph theory"]
+    assert all(item["review_count"] == 0 for item in _reviews(base_dir, "algo-topic").values())
+
+    assert review_scheduler.mark_reviewed("algo-topic", "Graph th", str(base_dir)) is True
+    assert read_output(capsys)["concept"] == "Graph theory"
+
+
+def test_quiz_record_resolves_names_before_prefixes(base_dir, make_topic, capsys):
+    make_topic()
+    review_scheduler.add_review_items("algo-topic", ["Set", "Settings", "Sets of sets"], str(base_dir))
+
+    assert concept_quiz.record_quiz_attempt("algo-topic", "set", True, str(base_dir)) is True
+    assert read_output(capsys)["concept"] == "Set"
+
+    assert concept_quiz.record_quiz_attempt("algo-topic", "Set", True, str(base_dir)) is True
+    assert concept_quiz.record_quiz_attempt("algo-topic", "Sett", True, str(base_dir)) is True
+    assert read_output(capsys)["concept"] == "Settings"
+
+    assert concept_quiz.record_quiz_attempt("algo-topic", "Se", False, str(base_dir)) is False
+    assert "matches several concepts" in capsys.readouterr().out
@@ -0,0 +1,107 @@
+"""The learning daemon's in-process command runner."""
+
+import os
+import sys
+import json
+import signal
+import subprocess
+
+import pytest
+
+import learning_daemon
+import storage
+from conftest import SCRIPTS_DIR
+
+
+def _run(base_dir, *argv):
+    return learning_daemon.run_command({"script": "catalog.py", "argv": list(argv), "cwd": str(base_dir.parent),
+                                        "env": {"LEARN_FASTER_OUTPUT": "compact"}})
+
+
+def test_command_writes_are_on_disk_before_the_response(base_dir, make_topic, monkeypatch):
+    make_topic()
+    (base_dir / "catalog.json").unlink()
+    monkeypatch.setattr(storage, "_cache", {})
+
+    response = _run(base_dir, "rebuild")
+
+    assert response["exit_code"] == 0
+    assert json.loads(response["stdout"])["topics"] == ["algo-topic"]
+    assert (base_dir / "catalog.json").exists()
+    assert storage._pending == {}
+
+
+def test_failed_write_is_reported_to_the_client(base_dir, make_topic, monkeypatch):
+    make_topic()
+    monkeypatch.setattr(storage, "_cache", {})
+
+    def fail(path, text):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(storage, "write_atomic", fail)
+    response = _run(base_dir, "rebuild")
+
+    assert response["exit_code"] == 1
+    assert "No space left on device" in response["stdout"] + response["stderr"]
+    assert storage._pending == {}
+
+
+def test_changed_sibling_modules_are_reimported(tmp_path, monkeypatch):
+    module_path = tmp_path / "sibling_module.py"
+    module_path.write_text("VALUE = 1\n")
+    monkeypatch.setattr(learning_daemon, "SCRIPTS_DIR", tmp_path.resolve())
+    monkeypatch.setattr(learning_daemon, "_module_mtimes", {})
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    import sibling_module
+    assert learning_daemon._sync_modules() is False
+
+    module_path.write_text("VALUE = 2\n")
+    stat = module_path.stat()
+    os.utime(module_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert learning_daemon._sync_modules() is True
+    assert "sibling_module" not in sys.modules
+
+    import sibling_module as reloaded
+    assert reloaded.VALUE == 2 and reloaded is not sibling_module
+
+
+def test_sigterm_during_a_command_lets_it_finish(tmp_path, monkeypatch):
+    (tmp_path / "stopping.py").write_text(
+        "import os, signal\nos.kill(os.getpid(), signal.SIGTERM)\nprint('finished')\n"
+    )
+    monkeypatch.setattr(learning_daemon, "SCRIPTS_DIR", tmp_path.resolve())
+    monkeypatch.setattr(learning_daemon, "_busy", True)
+    monkeypatch.setattr(learning_daemon, "_stop_requested", False)
+    previous = signal.signal(signal.SIGTERM, learning_daemon._on_sigterm)
+    try:
+        response = learning_daemon.run_command({"script": "stopping.py", "argv": [], "cwd": str(tmp_path)})
+    finally:
+        signal.signal(signal.SIGTERM, previous)
+
+    assert response == {"stdout": "finished\n", "stderr": "", "exit_code": 0}
+    assert learning_daemon._stop_requested is True
+
+
+def test_sigterm_while_idle_stops_at_once(monkeypatch):
+    monkeypatch.setattr(learning_daemon, "_busy", False)
+    monkeypatch.setattr(learning_daemon, "_stop_requested", False)
+    with pytest.raises(SystemExit):
+        learning_daemon._on_sigterm(signal.SIGTERM, None)
+
+
+def test_sigterm_stops_a_serving_daemon(base_dir, make_topic):
+    make_topic()
+    daemon = subprocess.Popen([sys.executable, str(SCRIPTS_DIR / "learning_daemon.py"), "serve"],
+                              cwd=base_dir.parent, stdout=subprocess.PIPE, text=True)
+    try:
+        assert json.loads(daemon.stdout.readline())["status"] == "serving"
+        response = learning_daemon._request({"script": "catalog.py", "argv": ["rebuild"], "cwd": str(base_dir.parent),
+                                             "env": {"LEARN_FASTER_OUTPUT": "compact"}}, str(base_dir))
+        assert response["exit_code"] == 0
+        daemon.send_signal(signal.SIGTERM)
+        assert daemon.wait(timeout=10) == 0
+    finally:
+        daemon.kill()
+        daemon.stdout.close()
+    assert not (base_dir / learning_daemon.SOCKET_FILE).exists()
@@ -0,0 +1,112 @@
+"""The due-review index (review_schedule.idx) behind `status`."""
+
+import io
+import json
+import contextlib
+import multiprocessing
+from datetime import datetime
+
+import review_scheduler
+import storage
+from conftest import set_next_reviews
+
+
+def _index(topic_dir) -> list:
+    return storage.load_ndjson(topic_dir / review_scheduler.DUE_INDEX_FILE)
+
+
+def _assert_index_matches_schedule(topic_dir) -> None:
+    schedule = json.loads((topic_dir / "review_schedule.json").read_text())
+    entries = _index(topic_dir)
+    assert [entry[0] for entry in entries] == sorted(entry[0] for entry in entries)
+    assert sorted(map(tuple, entries)) == sorted(tuple(review_scheduler._due_entry(item))
+                                                 for item in schedule["reviews"])
+
+
+def test_adds_keep_the_index_sorted(make_topic, capsys):
+    topic_dir = make_topic()
+    review_scheduler.add_review_items("algo-topic", ["Heap", "Trie"])
+    review_scheduler.add_review_items("algo-topic", ["Graph", "Heap"])
+    capsys.readouterr()
+    _assert_index_matches_schedule(topic_dir)
+    assert len(_index(topic_dir)) == 3
+
+
+def test_due_reviews_most_overdue_first(make_topic, capsys):
+    topic_dir = make_topic()
+    review_scheduler.add_review_items("algo-topic", ["Heap", "Trie", "Graph", "Stack"])
+    capsys.readouterr()
+    set_next_reviews(topic_dir, {"Heap": -1, "Trie": -5, "Graph": -3})
+
+    due = review_scheduler.get_due_reviews("algo-topic")
+    assert [item["concept"] for item in due] == ["Trie", "Graph", "Heap"]
+    assert [item["days_overdue"] for item in due] == [5, 3, 1]
+    # The stale index was rebuilt from the schedule
+    _assert_index_matches_schedule(topic_dir)
+
+
+def test_scan_stops_at_the_first_item_not_due(make_topic, capsys, monkeypatch):
+    topic_dir = make_topic()
+    review_scheduler.add_review_items("algo-topic", ["Heap", "Trie", "Graph"])
+    capsys.readouterr()
+    set_next_reviews(topic_dir, {"Heap": -2})
+    review_scheduler.get_due_reviews("algo-topic")
+
+    read = []
+    iter_due_index = review_scheduler._iter_due_index
+
+    def counting(*args):
+        for entry in iter_due_index(*args):
+            read.append(entry[1])
+            yield entry
+
+    monkeypatch.setattr(review_scheduler, "_iter_due_index", counting)
+    due, next_due = review_scheduler._scan_due_index(topic_dir, topic_dir / "review_schedule.json", datetime.now())
+    assert [item["concept"] for _, item in due] == ["Heap"]
+    assert len(read) == 2
+    assert next_due == _index(topic_dir)[1][0]
+
+
+def test_mark_reviewed_moves_the_item(make_topic, capsys):
+    topic_dir = make_topic()
+    review_scheduler.add_review_items("algo-topic", ["Heap", "Trie"])
+    capsys.readouterr()
+    set_next_reviews(topic_dir, {"Heap": -2, "Trie": -1})
+    assert len(review_scheduler.get_due_reviews("algo-topic")) == 2
+
+    review_scheduler.mark_reviewed("algo-topic", "Heap")
+    capsys.readouterr()
+    assert [item["concept"] for item in review_scheduler.get_due_reviews("algo-topic")] == ["Trie"]
+    _assert_index_matches_schedule(topic_dir)
+
+
+def test_missing_index_is_rebuilt(make_topic, capsys):
+    topic_dir = make_topic()
+    review_scheduler.add_review_items("algo-topic", ["Heap"])
+    capsys.readouterr()
+    set_next_reviews(topic_dir, {"Heap": -1})
+    (topic_dir / review_scheduler.DUE_INDEX_FILE).unlink()
+
+    assert [item["concept"] for item in review_scheduler.get_due_reviews("algo-topic")] == ["Heap"]
+    _assert_index_matches_schedule(topic_dir)
+
+
+def _add_concepts(base_dir: str, prefix: str) -> None:
+    with contextlib.redirect_stdout(io.StringIO()):
+        for number in range(10):
+            review_scheduler.add_review_items("algo-topic", [f"{prefix} {number}"], base_dir)
+
+
+def test_concurrent_adds_keep_every_concept(make_topic, base_dir):
+    topic_dir = make_topic()
+    ctx = multiprocessing.get_context("fork")
+    workers = [ctx.Process(target=_add_concepts, args=(str(base_dir), f"Worker {n}")) for n in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert all(worker.exitcode == 0 for worker in workers)
+
+    schedule = json.loads((topic_dir / "review_schedule.json").read_text())
+    assert len(schedule["reviews"]) == 40
+    _assert_index_matches_schedule(topic_dir)
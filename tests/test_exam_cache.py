@@ -0,0 +1,114 @@
+"""The exam render cache and batch rendering."""
+
+import json
+
+import pytest
+
+import generate_exam_pdf
+from conftest import read_output
+
+
+EXAM = """# Practice Exam
+
+## Question 1
+What is a heap?
+
+## Answer Key
+1. A tree with the heap property.
+"""
+
+
+@pytest.fixture
+def exams(tmp_path):
+    """A directory with two exam papers."""
+    directory = tmp_path / "exams"
+    directory.mkdir()
+    for name in ("exam-a", "exam-b"):
+        (directory / f"{name}.md").write_text(EXAM.replace("Practice Exam", name), encoding="utf-8")
+    return directory
+
+
+def _batch(exams, **kwargs) -> dict:
+    return generate_exam_pdf.batch(str(exams), **{"jobs": 1, "fmt": "html", **kwargs})
+
+
+def _names(paths: list) -> list:
+    return sorted(path.rsplit("/", 1)[-1] for path in paths)
+
+
+def test_unchanged_exams_are_skipped(exams):
+    first = _batch(exams)
+    assert first["counts"] == {"total": 2, "rendered": 2, "skipped": 0, "failed": 0}
+    assert _names(first["rendered"]) == ["exam-a.html", "exam-b.html"]
+    cache = json.loads((exams / generate_exam_pdf.CACHE_FILE).read_text())
+    assert sorted(cache["files"]) == ["exam-a.md:html", "exam-b.md:html"]
+
+    second = _batch(exams)
+    assert second["rendered"] == [] and _names(second["skipped"]) == ["exam-a.md", "exam-b.md"]
+
+
+def test_changed_content_is_rendered_again(exams):
+    _batch(exams)
+    (exams / "exam-b.md").write_text(EXAM + "\n## Question 2\nWhat is a trie?\n", encoding="utf-8")
+
+    result = _batch(exams)
+    assert _names(result["rendered"]) == ["exam-b.html"]
+    assert "What is a trie?" in (exams / "exam-b.html").read_text()
+
+
+def test_renderer_version_change_renders_everything(exams, monkeypatch):
+    _batch(exams)
+    monkeypatch.setattr(generate_exam_pdf, "RENDERER_VERSION", generate_exam_pdf.RENDERER_VERSION + 1)
+    assert _batch(exams)["counts"]["rendered"] == 2
+    assert _batch(exams)["counts"]["skipped"] == 2
+
+
+def test_answers_mode_is_part_of_the_cache_key(exams):
+    _batch(exams)
+    result = _batch(exams, answers="separate")
+    assert _names(result["rendered"]) == ["exam-a-ANSWERS.html", "exam-a.html", "exam-b-ANSWERS.html", "exam-b.html"]
+    assert _batch(exams, answers="separate")["counts"]["skipped"] == 2
+    assert _batch(exams, answers="omit")["counts"]["rendered"] == 2
+
+
+def test_deleted_or_replaced_output_is_rendered_again(exams):
+    _batch(exams, answers="separate")
+    (exams / "exam-a-ANSWERS.html").unlink()
+    (exams / "exam-b.html").write_text("<p>edited</p>")
+
+    result = _batch(exams, answers="separate")
+    assert result["counts"]["rendered"] == 2
+    assert (exams / "exam-a-ANSWERS.html").exists()
+    assert "Question 1" in (exams / "exam-b.html").read_text()
+
+
+def test_force_renders_cached_exams(exams):
+    _batch(exams)
+    assert _batch(exams, force=True)["counts"] == {"total": 2, "rendered": 2, "skipped": 0, "failed": 0}
+
+
+def test_deleted_exams_are_dropped_from_the_cache(exams):
+    _batch(exams)
+    (exams / "exam-a.md").unlink()
+    _batch(exams)
+    cache = json.loads((exams / generate_exam_pdf.CACHE_FILE).read_text())
+    assert list(cache["files"]) == ["exam-b.md:html"]
+
+
+def test_process_pool_renders_pdfs(exams):
+    pytest.importorskip("reportlab")
+    result = generate_exam_pdf.batch(str(exams), jobs=2, fmt="pdf")
+    assert result["status"] == "success" and result["jobs"] == 2
+    assert _names(result["rendered"]) == ["exam-a.pdf", "exam-b.pdf"]
+    assert (exams / "exam-a.pdf").read_bytes().startswith(b"%PDF")
+    assert generate_exam_pdf.batch(str(exams), jobs=2, fmt="pdf")["counts"]["skipped"] == 2
+
+
+def test_single_file_uses_the_cache(exams, capsys):
+    path = str(exams / "exam-a.md")
+    assert generate_exam_pdf.generate_pdf(path, fmt="html")
+    assert read_output(capsys)["cached"] is False
+    assert generate_exam_pdf.generate_pdf(path, fmt="html")
+    assert read_output(capsys)["cached"] is True
+    assert generate_exam_pdf.generate_pdf(path, fmt="html", force=True)
+    assert read_output(capsys)["cached"] is False
@@ -0,0 +1,115 @@
+"""Golden outputs of the exam markdown tokenizer and its HTML renderer."""
+
+import exam_markdown
+
+
+def _html(text: str) -> str:
+    return "".join(exam_markdown.html_chunks(exam_markdown.parse(text)))
+
+
+def test_headings():
+    assert exam_markdown.parse("# Exam\n### Part *B* ###\n####### Not a heading") == [
+        {"type": "heading", "level": 1, "inlines": [("text", "Exam")]},
+        {"type": "heading", "level": 3, "inlines": [("text", "Part "), ("em", [("text", "B")])]},
+        {"type": "paragraph", "inlines": [("text", "####### Not a heading")]},
+    ]
+    assert _html("## Section 1") == "<h2>Section 1</h2>\n"
+
+
+def test_nested_lists():
+    text = "3. First\n   continued\n  - [x] Done\n  - [ ] Open\n    1. Deep\n4. Second\n"
+    assert exam_markdown.parse(text) == [{
+        "type": "list", "ordered": True, "start": 3, "items": [
+            {"depth": 0, "ordered": True, "checked": None,
+             "inlines": [("text", "First"), ("break",), ("text", "continued")]},
+            {"depth": 1, "ordered": False, "checked": True, "inlines": [("text", "Done")]},
+            {"depth": 1, "ordered": False, "checked": False, "inlines": [("text", "Open")]},
+            {"depth": 2, "ordered": True, "checked": None, "inlines": [("text", "Deep")]},
+            {"depth": 0, "ordered": True, "checked": None, "inlines": [("text", "Second")]},
+        ]
+    }]
+    assert _html(text) == (
+        '<ol start="3">\n<li>First<br>\ncontinued\n'
+        '<ul>\n<li><span class="checkbox">☑</span> Done</li>\n'
+        '<li><span class="checkbox">☐</span> Open\n'
+        '<ol>\n<li>Deep</li></ol></li></ul></li>\n'
+        '<li>Second</li>\n</ol>\n'
+    )
+
+
+def test_fenced_code_keeps_its_text():
+    text = "```python\ndef f(x):\n    return x * 2  # **not bold**\n```\n~~~\n<b>\n~~~"
+    assert exam_markdown.parse(text) == [
+        {"type": "code", "lang": "python", "text": "def f(x):\n    return x * 2  # **not bold**"},
+        {"type": "code", "lang": "", "text": "<b>"},
+    ]
+    assert _html(text) == (
+        '<pre><code class="language-python">def f(x):\n    return x * 2  # **not bold**</code></pre>\n'
+        "<pre><code>&lt;b&gt;</code></pre>\n"
+    )
+
+
+def test_unclosed_fence_runs_to_the_end():
+    assert exam_markdown.parse("```\nx = 1\n\ny = 2") == [{"type": "code", "lang": "", "text": "x = 1\n\ny = 2"}]
+
+
+def test_aligned_table_with_escaped_pipes():
+    text = "| Op | Meaning | Cost |\n|:---|:---:|---:|\n| `a \\| b` | either | **O(1)** |\n| x |\n"
+    assert exam_markdown.parse(text) == [{
+        "type": "table",
+        "align": ["left", "center", "right"],
+        "header": [[("text", "Op")], [("text", "Meaning")], [("text", "Cost")]],
+        "rows": [
+            [[("code", "a | b")], [("text", "either")], [("strong", [("text", "O(1)")])]],
+            [[("text", "x")], [], []],
+        ]
+    }]
+    assert _html(text) == (
+        "<table>\n<thead><tr>"
+        '<th style="text-align: left">Op</th><th style="text-align: center">Meaning</th>'
+        '<th style="text-align: right">Cost</th></tr></thead>\n<tbody>\n'
+        '<tr><td style="text-align: left"><code>a | b</code></td><td style="text-align: center">either</td>'
+        '<td style="text-align: right"><strong>O(1)</strong></td></tr>\n'
+        '<tr><td style="text-align: left">x</td><td style="text-align: center"></td>'
+        '<td style="text-align: right"></td></tr>\n'
+        "</tbody>\n</table>\n"
+    )
+
+
+def test_inline_nesting():
+    assert exam_markdown.parse_inline("**bold *and em* with `co*de`** __u__ _e_ snake_case \\*lit\\*") == [
+        ("strong", [("text", "bold "), ("em", [("text", "and em")]), ("text", " with "), ("code", "co*de")]),
+        ("text", " "), ("strong", [("text", "u")]),
+        ("text", " "), ("em", [("text", "e")]),
+        ("text", " snake_case *lit*"),
+    ]
+    assert exam_markdown.parse_inline("Name: ________ [see **notes**](notes.md)") == [
+        ("text", "Name: "), ("blank", 8), ("text", " "),
+        ("link", [("text", "see "), ("strong", [("text", "notes")])], "notes.md"),
+    ]
+    assert _html("A <b> & **[x](a.md)**\nnext") == (
+        '<p>A &lt;b&gt; &amp; <strong><a href="a.md">x</a></strong><br>\nnext</p>\n'
+    )
+
+
+def test_link_urls_with_balanced_parentheses():
+    assert exam_markdown.parse_inline("[heap](https://en.wikipedia.org/wiki/Heap_(data_structure)).") == [
+        ("link", [("text", "heap")], "https://en.wikipedia.org/wiki/Heap_(data_structure)"), ("text", "."),
+    ]
+    assert exam_markdown.parse_inline("(see [a](b))") == [("text", "(see "), ("link", [("text", "a")], "b"),
+                                                          ("text", ")")]
+    # The whole URL is recognized, so no stray ")" is left, and it is neutralized
+    assert _html("[x](javascript:alert(1))") == '<p><a href="#">x</a></p>\n'
+
+
+def test_quote_rule_and_answer_lines():
+    text = "> Read carefully\n> twice\n\n---\n\n____\n"
+    assert exam_markdown.parse(text) == [
+        {"type": "quote", "inlines": [("text", "Read carefully"), ("break",), ("text", "twice")]},
+        {"type": "rule"},
+        {"type": "paragraph", "inlines": [("blank", 4)]},
+    ]
+    assert _html(text) == (
+        "<blockquote><p>Read carefully<br>\ntwice</p></blockquote>\n<hr>\n"
+        '<p><span class="blank-line">_________________</span></p>\n'
+    )
@@ -0,0 +1,115 @@
+"""Exam output formats and answer key handling."""
+
+import os
+import sys
+import json
+import subprocess
+
+import pytest
+
+import generate_exam_pdf
+from conftest import SCRIPTS_DIR, read_output
+
+
+EXAM = """# Midterm
+
+## Question 1
+What is a heap? ____
+
+## Answer Key
+1. A tree with the heap property.
+
+## Marking Scheme
+- 2 marks for the property
+"""
+
+
+@pytest.fixture
+def exam(tmp_path):
+    path = tmp_path / "midterm.md"
+    path.write_text(EXAM, encoding="utf-8")
+    return path
+
+
+def _run(*args, cwd, env=None):
+    return subprocess.run([sys.executable, str(SCRIPTS_DIR / "generate_exam_pdf.py"), *args], cwd=cwd,
+                          capture_output=True, text=True, env={**os.environ, "LEARN_FASTER_OUTPUT": "compact", **(env or {})})
+
+
+def test_html_format_never_imports_reportlab(exam, tmp_path):
+    # A reportlab that fails on import: the HTML path must not touch it, even though it looks installed
+    poisoned = tmp_path / "poisoned"
+    (poisoned / "reportlab").mkdir(parents=True)
+    (poisoned / "reportlab" / "__init__.py").write_text("raise RuntimeError('reportlab was imported')\n")
+
+    for args in ((exam.name, "--format", "html"), ("batch", ".", "--format", "html", "--force")):
+        result = _run(*args, cwd=tmp_path, env={"PYTHONPATH": str(poisoned)})
+        assert result.returncode == 0, result.stderr
+        assert "reportlab was imported" not in result.stderr
+    assert json.loads(result.stdout)["format"] == "html"
+    html = (tmp_path / "midterm.html").read_text()
+    assert html.startswith("<!DOCTYPE html>") and html.rstrip().endswith("</html>")
+
+
+def test_auto_format_falls_back_to_html(exam, monkeypatch, capsys):
+    monkeypatch.setattr(generate_exam_pdf, "reportlab_available", lambda: False)
+    assert generate_exam_pdf.generate_pdf(str(exam))
+    output = read_output(capsys)
+    assert output["format"] == "html" and "reportlab" in output["note"]
+    assert exam.with_suffix(".html").exists()
+
+
+def test_pdf_format_without_reportlab_is_an_error(exam, monkeypatch, capsys):
+    monkeypatch.setattr(generate_exam_pdf, "reportlab_available", lambda: False)
+    assert not generate_exam_pdf.generate_pdf(str(exam), fmt="pdf")
+    assert read_output(capsys)["status"] == "error"
+    assert not exam.with_suffix(".pdf").exists()
+
+
+def test_answers_included_after_a_page_break(exam):
+    generate_exam_pdf.write_html(exam, exam.with_suffix(".html"))
+    html = exam.with_suffix(".html").read_text()
+    assert html.index("Question 1") < html.index('<div class="page-break"></div>') < html.index("Answer Key")
+    assert "Marking Scheme" in html
+
+
+def test_answers_separate(exam, capsys):
+    assert generate_exam_pdf.generate_pdf(str(exam), fmt="html", answers="separate")
+    output = read_output(capsys)
+    answers_path = exam.with_name("midterm-ANSWERS.html")
+    assert output["answers_path"] == str(answers_path)
+
+    paper = exam.with_suffix(".html").read_text()
+    key = answers_path.read_text()
+    assert "Question 1" in paper and "Answer Key" not in paper and "Marking Scheme" not in paper
+    assert "<title>midterm - Answer Key</title>" in key
+    assert "Answer Key" in key and "Marking Scheme" in key and "Question 1" not in key
+    assert 'class="page-break"' not in paper + key
+
+
+def test_answers_omit(exam, capsys):
+    assert generate_exam_pdf.generate_pdf(str(exam), fmt="html", answers="omit")
+    assert "answers_path" not in read_output(capsys)
+    html = exam.with_suffix(".html").read_text()
+    assert "Question 1" in html and "Answer Key" not in html and "2 marks" not in html
+    assert not exam.with_name("midterm-ANSWERS.html").exists()
+
+
+def test_answer_heading_as_title_is_not_an_answer_key(tmp_path):
+    path = tmp_path / "answers.md"
+    path.write_text("# Answers to Chapter 3\n\n## Question 1\nExplain.\n", encoding="utf-8")
+    assert generate_exam_pdf.write_html(path, path.with_suffix(".html"), answers="omit") == [path.with_suffix(".html")]
+    assert "Explain." in path.with_suffix(".html").read_text()
+
+
+def test_answers_separate_pdf(exam):
+    pytest.importorskip("reportlab")
+    outputs = generate_exam_pdf.render(exam, "pdf", answers="separate")
+    assert [path.name for path in outputs] == ["midterm.pdf", "midterm-ANSWERS.pdf"]
+    assert all(path.read_bytes().startswith(b"%PDF") for path in outputs)
+
+
+def test_invalid_answers_option(exam, tmp_path):
+    result = _run(exam.name, "--answers", "hidden", cwd=tmp_path)
+    assert result.returncode == 1
+    assert "--answers needs one of: include, separate, omit" in result.stdout
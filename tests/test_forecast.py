@@ -0,0 +1,138 @@
+"""Review workload forecast and load balancing (review_scheduler.py)."""
+
+import json
+import subprocess
+import sys
+from collections import Counter
+from datetime import datetime, timedelta
+
+import pytest
+
+import review_scheduler
+import schedulers
+from conftest import SCRIPTS_DIR, read_output
+
+
+NOW = datetime(2025, 3, 1, 12)
+
+
+def _item(concept: str, due_in_days: float, review_count: int = 0, **state) -> dict:
+    learned = NOW - timedelta(days=1)
+    return {"concept": concept, "learned_date": learned.isoformat(), "review_count": review_count,
+            "next_review": (NOW + timedelta(days=due_in_days)).isoformat(),
+            "last_reviewed": learned.isoformat() if review_count else None, **state}
+
+
+def _forecast_one_by_one(scheduler, items: list, days: int) -> list:
+    """Reference forecast: every item simulated on its own."""
+    counts = [0] * days
+    for item in items:
+        counts = [a + b for a, b in zip(counts, scheduler.forecast([item], NOW, days))]
+    return counts
+
+
+def test_ladder_forecast_follows_the_ladder():
+    items = [_item(f"c{n}", -2) for n in range(3)] + [_item("later", 5, review_count=2)]
+    counts = schedulers.LadderScheduler().forecast(items, NOW, 30)
+    # Overdue items count toward today, then come back after 3, 7 and 14 days
+    assert {day: count for day, count in enumerate(counts) if count} == {0: 3, 3: 3, 5: 1, 10: 3, 19: 1, 24: 3}
+
+
+@pytest.mark.parametrize("algorithm", ["ladder", "sm2", "fsrs"])
+def test_cohorts_match_simulating_every_item(algorithm):
+    scheduler = schedulers.get_scheduler({"review_algorithm": algorithm})
+    items = []
+    for n in range(60):
+        item = _item(f"c{n}", n % 7 - 2)
+        if n % 3:
+            scheduler.review(item, 1 + n % 4, NOW - timedelta(days=1))
+            item["next_review"] = (NOW + timedelta(days=n % 5)).isoformat()
+        items.append(item)
+
+    counts = scheduler.forecast(items, NOW, 45)
+    assert counts == _forecast_one_by_one(scheduler, items, 45)
+    assert counts[0] >= sum(1 for item in items if item["next_review"] <= NOW.isoformat())
+
+
+def test_forecast_leaves_items_untouched():
+    items = [_item("a", 0), _item("b", 3, review_count=1)]
+    before = json.dumps(items)
+    schedulers.SM2Scheduler().forecast(items, NOW, 10)
+    assert json.dumps(items) == before
+
+
+def test_show_forecast(make_topic, capsys):
+    make_topic()
+    review_scheduler.add_review_items("algo-topic", ["Heap", "Trie"])
+    capsys.readouterr()
+    review_scheduler.show_forecast("algo-topic", 10)
+    output = read_output(capsys)
+    assert output["days"] == 10 and len(output["daily"]) == 10
+    assert output["daily"][1]["count"] == 2
+    assert output["peak"] == {"date": output["daily"][1]["date"], "count": 2}
+    assert output["total_reviews"] == 4  # day 1, then day 1 + 3
+
+
+def _run_cli(base_dir, *args) -> dict:
+    result = subprocess.run([sys.executable, str(SCRIPTS_DIR / "review_scheduler.py"), *args],
+                            cwd=base_dir.parent, capture_output=True, text=True,
+                            env={"LEARN_FASTER_OUTPUT": "compact", "PATH": ""})
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def test_forecast_cli_takes_a_numeric_topic_slug(base_dir, make_topic, capsys):
+    make_topic("2024")
+    make_topic("Other")
+    review_scheduler.add_review_items("2024", ["Heap"])
+    review_scheduler.add_review_items("other", ["Trie", "Graph"])
+    capsys.readouterr()
+
+    # Reviews on days 1, 4, 11 and 25 of the ladder
+    assert _run_cli(base_dir, "forecast", "2024")["total_reviews"] == 4
+    assert _run_cli(base_dir, "forecast", "2024", "3")["daily"][1]["count"] == 1
+    assert _run_cli(base_dir, "forecast", "--all", "3")["daily"][1]["count"] == 3
+    assert _run_cli(base_dir, "forecast")["days"] == 30
+    assert _run_cli(base_dir, "forecast", "2024", "soon")["status"] == "error"
+
+
+def test_balancer_prefers_the_planned_day_on_ties():
+    balancer = review_scheduler.LoadBalancer([], NOW)
+    item = {}
+    assert balancer.place(item, 7, NOW) == 7
+    assert item["next_review"] == (NOW + timedelta(days=7)).isoformat()
+
+
+def test_balancer_moves_to_the_least_loaded_day_in_the_window():
+    existing = [(NOW + timedelta(days=day)).isoformat() for day in (6, 7, 7, 8, 8, 8)]
+    balancer = review_scheduler.LoadBalancer(existing, NOW)
+    # 15% of 7 days rounds to 1, so days 6-8 are candidates
+    assert [balancer.place({}, 7, NOW) for _ in range(3)] == [6, 7, 6]
+    # A wider minimum window reaches further
+    assert review_scheduler.LoadBalancer(existing, NOW, window_days=2).place({}, 7, NOW) == 5
+
+
+def test_balancer_tolerance_scales_with_the_interval():
+    existing = [(NOW + timedelta(days=day)).isoformat() for day in range(36, 45) for _ in range(3)]
+    balancer = review_scheduler.LoadBalancer(existing, NOW, tolerance=0.1)
+    # 10% of 40 days: days 36-44 are all busy, so the planned day wins
+    assert balancer.place({}, 40, NOW) == 40
+    assert review_scheduler.LoadBalancer(existing, NOW, tolerance=0.2).place({}, 40, NOW) == 35
+
+
+def test_balancer_never_schedules_today_and_releases_the_old_day():
+    balancer = review_scheduler.LoadBalancer([(NOW + timedelta(days=1)).isoformat()], NOW)
+    assert balancer.place({}, 1, NOW) == 2
+    item = {"next_review": (NOW + timedelta(days=1)).isoformat()}
+    # Moving the only item off day 1 frees it again
+    assert balancer.place(item, 1, NOW, previous_next_review=item["next_review"]) == 1
+
+
+def test_balanced_adds_spread_over_the_window(base_dir, make_topic, capsys):
+    make_topic()
+    (base_dir / "config.json").write_text(json.dumps({"load_balancing": {"window_days": 1}}))
+    review_scheduler.add_review_items("algo-topic", [f"Concept {n}" for n in range(10)])
+    capsys.readouterr()
+    today = datetime.now().date()
+    days = Counter((datetime.fromisoformat(item["next_review"]).date() - today).days
+                   for item in review_scheduler._load_review_items("algo-topic", str(base_dir)))
+    assert days == {1: 5, 2: 5}
@@ -0,0 +1,120 @@
+"""The SQLite backend: script paths in SQLite mode and opening the database."""
+
+import json
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+import concept_quiz
+import learning_db
+import review_scheduler
+from conftest import read_output
+
+
+@pytest.fixture
+def sqlite_topic(base_dir, make_topic):
+    """A topic created with the SQLite backend enabled."""
+    (base_dir / "config.json").write_text(json.dumps({"storage": "sqlite"}))
+    topic_dir = make_topic()
+    yield topic_dir
+    assert not (topic_dir / "review_schedule.json").exists()
+
+
+def _query(base_dir, sql: str, *args) -> list:
+    conn = learning_db.connect(str(base_dir))
+    try:
+        return [dict(row) for row in conn.execute(sql, args)]
+    finally:
+        conn.close()
+
+
+def test_topic_is_created_in_the_database(base_dir, sqlite_topic):
+    rows = _query(base_dir, "SELECT slug, metadata FROM topics")
+    assert [row["slug"] for row in rows] == ["algo-topic"]
+    assert json.loads(rows[0]["metadata"])["topic"] == "Algo Topic"
+
+
+def test_add_and_review(base_dir, sqlite_topic, capsys):
+    review_scheduler.add_review_items("algo-topic", ["Heaps", "Tries"])
+    review_scheduler.add_review_item("algo-topic", "heaps")
+    assert read_output(capsys)["already_tracked"] is True
+
+    reviews = _query(base_dir, "SELECT concept, review_count FROM reviews WHERE topic = ? ORDER BY id", "algo-topic")
+    assert reviews == [{"concept": "Heaps", "review_count": 0}, {"concept": "Tries", "review_count": 0}]
+
+    assert review_scheduler.mark_reviewed("algo-topic", "Heaps")
+    capsys.readouterr()
+    review = _query(base_dir, "SELECT * FROM reviews WHERE concept = 'Heaps'")[0]
+    assert review["review_count"] == 1
+    assert review["next_review"] > (datetime.now() + timedelta(days=1)).isoformat()
+    concept = _query(base_dir, "SELECT review_count, last_reviewed FROM concepts WHERE slug = 'heaps'")[0]
+    assert concept["review_count"] == 1 and concept["last_reviewed"] == review["last_reviewed"]
+
+
+def test_status_lists_due_reviews(base_dir, sqlite_topic, capsys):
+    review_scheduler.add_review_items("algo-topic", ["Heaps", "Tries"])
+    capsys.readouterr()
+    review_scheduler.show_review_status("algo-topic")
+    assert read_output(capsys)["status"] == "no_reviews_due"
+
+    yesterday = (datetime.now() - timedelta(days=1)).isoformat()
+    conn = learning_db.connect(str(base_dir))
+    conn.execute("UPDATE reviews SET next_review = ? WHERE concept = 'Tries'", (yesterday,))
+    conn.close()
+    review_scheduler.show_review_status("algo-topic")
+    output = read_output(capsys)
+    assert output["status"] == "reviews_due" and output["due_count"] == 1
+    assert [review["concept"] for review in output["reviews"]] == ["Tries"]
+
+
+def test_quiz_attempts_are_recorded(base_dir, sqlite_topic, capsys):
+    review_scheduler.add_review_items("algo-topic", ["Heaps"])
+    for correct in (True, False, True):
+        assert concept_quiz.record_quiz_attempt("algo-topic", "Heaps", correct)
+    output = read_output(capsys)
+    assert (output["quiz_count"], output["accuracy"], output["streak"]) == (3, 66.7, 1)
+
+    history = _query(base_dir, "SELECT correct FROM quiz_history WHERE concept_slug = 'heaps' ORDER BY id")
+    assert [row["correct"] for row in history] == [1, 0, 1]
+    conn = learning_db.connect(str(base_dir))
+    candidate = learning_db.quiz_candidates(conn, "algo-topic")[0]
+    conn.close()
+    assert candidate["quiz_accuracy"] == pytest.approx(2 / 3)
+    assert candidate["last_quizzed"] is not None
+
+
+def test_up_to_date_database_is_opened_without_the_schema_script(base_dir, monkeypatch):
+    learning_db.connect(str(base_dir)).close()
+
+    def fail(conn):
+        raise AssertionError("schema upgraded again")
+
+    monkeypatch.setattr(learning_db, "_upgrade", fail)
+    conn = learning_db.connect(str(base_dir))
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == learning_db.SCHEMA_VERSION
+    conn.close()
+
+
+def test_upgrade_from_version_one(base_dir):
+    conn = sqlite3.connect(base_dir / learning_db.DB_FILE)
+    conn.executescript("""
+        CREATE TABLE reviews (id INTEGER PRIMARY KEY, topic TEXT NOT NULL, concept TEXT NOT NULL,
+            concept_key TEXT NOT NULL, learned_date TEXT, review_count INTEGER NOT NULL DEFAULT 0,
+            next_review TEXT NOT NULL, last_reviewed TEXT);
+        CREATE TABLE concepts (topic TEXT NOT NULL, slug TEXT NOT NULL, concept TEXT NOT NULL,
+            review_count INTEGER NOT NULL DEFAULT 0, learned_date TEXT, last_reviewed TEXT,
+            quiz_count INTEGER NOT NULL DEFAULT 0, quiz_correct_count INTEGER NOT NULL DEFAULT 0,
+            data TEXT NOT NULL DEFAULT '{}', PRIMARY KEY (topic, slug));
+        CREATE INDEX concepts_least_reviewed ON concepts (topic, review_count, learned_date);
+        INSERT INTO reviews (topic, concept, concept_key, next_review) VALUES ('t', 'ＨＥＡＰＳ', 'ＨＥＡＰＳ', '2024-01-01');
+        PRAGMA user_version = 1;
+    """)
+    conn.close()
+
+    conn = learning_db.connect(str(base_dir))
+    indexes = {row["name"] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    review = conn.execute("SELECT concept_key, state FROM reviews").fetchone()
+    conn.close()
+    assert "concepts_least_reviewed" not in indexes and "concepts_quiz_priority" in indexes
+    assert (review["concept_key"], review["state"]) == ("heaps", "{}")
@@ -0,0 +1,50 @@
+"""Migrating topics from the JSON files to the SQLite backend."""
+
+import json
+
+import concept_index
+import concept_quiz
+import learning_db
+import review_scheduler
+from conftest import set_next_reviews
+
+
+def _json_topic(make_topic, capsys):
+    topic_dir = make_topic()
+    review_scheduler.add_review_items("algo-topic", ["Heap", "Trie", "Graph"])
+    concept_quiz.record_quiz_attempt("algo-topic", "Heap", True)
+    concept_quiz.record_quiz_attempt("algo-topic", "Heap", False)
+    concept_index.add_alias(topic_dir, "priority queue", "heap")
+    capsys.readouterr()
+    set_next_reviews(topic_dir, {"Trie": -3, "Heap": -1})
+    return topic_dir
+
+
+def test_migrate_imports_topics_and_enables_sqlite(base_dir, make_topic, capsys):
+    _json_topic(make_topic, capsys)
+    due_before = review_scheduler.get_due_reviews("algo-topic")
+
+    summary = learning_db.migrate(str(base_dir))
+    assert summary == {"topics": ["algo-topic"], "skipped": [], "reviews": 3, "concepts": 3, "quiz_attempts": 2}
+    assert json.loads((base_dir / "config.json").read_text())["storage"] == "sqlite"
+    assert learning_db.is_enabled(str(base_dir))
+
+    assert review_scheduler.get_due_reviews("algo-topic") == due_before
+    conn = learning_db.connect(str(base_dir))
+    heap = learning_db.get_concept(conn, "algo-topic", "heap")
+    registry = learning_db.concept_registry(conn, "algo-topic")
+    conn.close()
+    assert (heap["quiz_count"], heap["quiz_correct_count"]) == (2, 1)
+    assert registry.resolve("Priority Queue") == "heap"
+
+
+def test_migrate_skips_topics_already_imported(base_dir, make_topic, capsys):
+    _json_topic(make_topic, capsys)
+    learning_db.migrate(str(base_dir))
+    summary = learning_db.migrate(str(base_dir))
+    assert summary["topics"] == [] and summary["skipped"] == ["algo-topic"]
+
+    conn = learning_db.connect(str(base_dir))
+    assert conn.execute("SELECT COUNT(*) FROM reviews").fetchone()[0] == 3
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == learning_db.SCHEMA_VERSION
+    conn.close()
@@ -0,0 +1,144 @@
+"""progress.md tail reads and the progress.idx session index."""
+
+import io
+import re
+import contextlib
+import multiprocessing
+
+import pytest
+
+import learning_db
+import log_progress
+
+
+def _log(topic_dir, sessions: int, body_size: int = 100) -> None:
+    for number in range(sessions):
+        log_progress.log_progress(topic_dir.name, f"Session body {number} " + "x" * body_size,
+                                  base_dir=str(topic_dir.parent))
+
+
+def _sessions(topic_dir) -> list:
+    """Every session entry of progress.md, found without the index or the tail reader."""
+    text = (topic_dir / "progress.md").read_text(encoding="utf-8")
+    return ["### Session" + part.rstrip("\n") for part in text.split("\n### Session")[1:]]
+
+
+def _joined(entries: list) -> str:
+    """Consecutive entries as they appear in progress.md."""
+    return "\n\n\n".join(entries)
+
+
+def _recent(topic_dir, count: int) -> str:
+    return log_progress.get_recent_progress(topic_dir.name, count, base_dir=str(topic_dir.parent))
+
+
+def _range(topic_dir, first: int, last: int = None) -> str:
+    return log_progress.get_progress_sessions(topic_dir.name, first, last, base_dir=str(topic_dir.parent))
+
+
+def test_index_records_session_offsets(make_topic, capsys):
+    topic_dir = make_topic()
+    _log(topic_dir, 3)
+    capsys.readouterr()
+
+    data = (topic_dir / "progress.md").read_bytes()
+    raw = (topic_dir / log_progress.SESSION_INDEX_FILE).read_bytes()
+    records = list(log_progress.SESSION_RECORD.iter_unpack(raw))
+    assert log_progress.SESSION_RECORD.format == "<QQQ"
+    assert len(raw) == 3 * 24
+    assert [session for session, _, _ in records] == [1, 2, 3]
+    assert records[-1][2] == len(data)
+    for (session, start, end), entry in zip(records, _sessions(topic_dir)):
+        assert data[start:end].decode("utf-8").strip("\n") == entry
+        assert data[start:].startswith(f"### Session {session} ".encode())
+
+
+def test_tail_read_across_block_boundaries(make_topic, capsys):
+    topic_dir = make_topic()
+    # About 2.5 sessions per block, so wanted headers sit in several blocks
+    _log(topic_dir, 12, body_size=log_progress.TAIL_BLOCK_SIZE // 3)
+    capsys.readouterr()
+    (topic_dir / log_progress.SESSION_INDEX_FILE).unlink()
+    entries = _sessions(topic_dir)
+
+    for count in (1, 2, 3, 7, 12):
+        assert _recent(topic_dir, count) == _joined(entries[-count:])
+    assert _recent(topic_dir, 50) == _joined(entries)
+
+
+def test_tail_read_with_header_straddling_a_block(make_topic, monkeypatch):
+    topic_dir = make_topic()
+    block = 64
+    monkeypatch.setattr(log_progress, "TAIL_BLOCK_SIZE", block)
+    first = b"### Session 1 - today\n\n" + b"x" * 100
+    header = b"### Session 2 - today\n\n"
+    for split in range(len(log_progress.SESSION_HEADER) + 2):
+        # "\n### Session 2" starts `split` bytes before the last block
+        second = header + b"y" * (block + split - 1 - len(header))
+        data = b"\n" + first + b"\n" + second
+        assert len(data) - data.rindex(b"\n###") == block + split
+        (topic_dir / "progress.md").write_bytes(data)
+        assert _recent(topic_dir, 1) == second.decode()
+        assert _recent(topic_dir, 2) == (first + b"\n" + second).decode()
+        assert _recent(topic_dir, 3) == (first + b"\n" + second).decode()
+
+
+def test_missing_index_falls_back_to_scanning(make_topic, capsys):
+    topic_dir = make_topic()
+    _log(topic_dir, 4)
+    capsys.readouterr()
+    entries = _sessions(topic_dir)
+    (topic_dir / log_progress.SESSION_INDEX_FILE).unlink()
+
+    assert _recent(topic_dir, 2) == _joined(entries[-2:])
+    assert _range(topic_dir, 2, 3) == _joined(entries[1:3])
+    assert _range(topic_dir, 9) == ""
+
+
+def test_hand_edited_log_ignores_the_stale_index(make_topic, capsys):
+    topic_dir = make_topic()
+    _log(topic_dir, 3)
+    capsys.readouterr()
+    progress_path = topic_dir / "progress.md"
+    text = progress_path.read_text(encoding="utf-8").replace("Session body 1", "Session body one (edited)")
+    progress_path.write_text(text, encoding="utf-8")
+    entries = _sessions(topic_dir)
+
+    assert log_progress._read_session_index(topic_dir) == []
+    assert _recent(topic_dir, 2) == _joined(entries[-2:])
+    assert _range(topic_dir, 2) == entries[1]
+
+    # The next session restarts the index with itself; earlier ones are scanned
+    _log(topic_dir, 1)
+    capsys.readouterr()
+    entries = _sessions(topic_dir)
+    records = log_progress._read_session_index(topic_dir)
+    assert [session for session, _, _ in records] == [4]
+    assert _range(topic_dir, 4) == entries[3]
+    assert _range(topic_dir, 1, 4) == _joined(entries)
+    assert _recent(topic_dir, 3) == _joined(entries[-3:])
+
+
+def _log_quietly(base_dir: str, worker: int) -> None:
+    with contextlib.redirect_stdout(io.StringIO()):
+        for number in range(8):
+            log_progress.log_progress("algo-topic", f"Worker {worker} session {number}", base_dir=base_dir)
+
+
+@pytest.mark.parametrize("sqlite", [False, True], ids=["json", "sqlite"])
+def test_concurrent_sessions_are_appended_in_order(base_dir, make_topic, sqlite):
+    topic_dir = make_topic()
+    if sqlite:
+        learning_db.migrate(str(base_dir))
+    ctx = multiprocessing.get_context("fork")
+    workers = [ctx.Process(target=_log_quietly, args=(str(base_dir), n)) for n in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert all(worker.exitcode == 0 for worker in workers)
+
+    numbers = [int(n) for n in re.findall(r"^### Session (\d+) ", (topic_dir / "progress.md").read_text(), re.M)]
+    assert numbers == list(range(1, 33))
+    records = log_progress._read_session_index(topic_dir)
+    assert [session for session, _, _ in records] == numbers
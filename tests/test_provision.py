@@ -0,0 +1,70 @@
+"""Bulk, non-interactive project setup (learn-faster provision)."""
+
+import json
+
+from learn_faster.cli import provision
+
+
+def _projects(tmp_path, count: int) -> list:
+    paths = []
+    for number in range(count):
+        project = tmp_path / f"project-{number}"
+        project.mkdir()
+        paths.append(project)
+    return paths
+
+
+def test_process_pool_reports_a_failed_project_as_partial(tmp_path):
+    paths = _projects(tmp_path, 4)
+    # .claude is a file here, so this project fails inside its worker
+    (paths[2] / ".claude").write_text("not a directory")
+    (paths[3] / ".learning").mkdir()
+    (paths[3] / ".learning" / "config.json").write_text(json.dumps({"learning_mode": "exam"}))
+    missing = tmp_path / "missing"
+
+    report = provision.provision([str(path) for path in paths] + [str(paths[0]), str(missing)], jobs=3)
+
+    assert report["status"] == "partial"
+    projects = report["projects"]
+    assert [entry["path"] for entry in projects] == [str(path) for path in paths] + [str(missing)]
+    assert [entry["status"] for entry in projects] == ["success", "success", "error", "success", "error"]
+    assert projects[2]["error"].startswith(("FileExistsError", "NotADirectoryError"))
+    assert projects[4]["error"] == "Not a directory"
+    assert [entry["mode"] for entry in projects[:4]] == ["balanced", "balanced", "balanced", "exam"]
+    assert report["summary"]["total"] == 5 and report["summary"]["succeeded"] == 3
+    assert report["summary"]["failed"] == 2 and report["summary"]["jobs"] == 3
+
+    for entry, path in ((projects[0], paths[0]), (projects[3], paths[3])):
+        assert entry["templates"]["added"] > 0 and entry["kept"] == []
+        assert (path / ".learning" / "scripts" / "storage.py").exists()
+        assert (path / "CLAUDE.md").exists()
+    assert json.loads((paths[3] / ".learning" / "config.json").read_text())["learning_mode"] == "exam"
+    assert projects[3]["config"] == "updated"
+
+
+def test_second_run_only_reports_unchanged_files(tmp_path):
+    paths = [str(path) for path in _projects(tmp_path, 2)]
+    first = provision.provision(paths, jobs=2)
+    second = provision.provision(paths, jobs=2)
+
+    assert first["status"] == second["status"] == "success"
+    for before, after in zip(first["projects"], second["projects"]):
+        assert after["templates"]["unchanged"] == before["templates"]["added"]
+        assert after["templates"]["added"] == after["templates"]["updated"] == 0
+
+
+def test_all_projects_failing_is_an_error(tmp_path):
+    report = provision.provision([str(tmp_path / "a"), str(tmp_path / "b")])
+    assert report["status"] == "error"
+    assert report["summary"]["failed"] == 2
+
+
+def test_cli_exit_status_and_paths_from_a_file(tmp_path, capsys):
+    good, bad = _projects(tmp_path, 2)
+    (bad / ".claude").write_text("not a directory")
+    list_file = tmp_path / "projects.txt"
+    list_file.write_text(f"# projects\n{good}\n\n{bad}\n")
+
+    assert provision.main(["--from-file", str(list_file), "--jobs", "2"]) == 1
+    report = json.loads(capsys.readouterr().out)
+    assert [entry["status"] for entry in report["projects"]] == ["success", "error"]
@@ -0,0 +1,81 @@
+"""Bounded quiz history, rolling aggregates and least-reviewed quiz targets."""
+
+import json
+
+import pytest
+
+import concept_index
+import concept_quiz
+import learning_db
+import review_scheduler
+from conftest import read_output
+
+
+def _answers(topic_dir, concept: str, answers: list, capsys) -> dict:
+    for correct in answers:
+        assert concept_quiz.record_quiz_attempt(topic_dir.name, concept, correct, base_dir=str(topic_dir.parent))
+    return read_output(capsys)
+
+
+def test_ewma_and_streak_follow_the_answers():
+    data = concept_index.new_concept("Heaps")
+    for correct in (True, True, False, True, True):
+        concept_index.record_attempt(data, correct, "2024-03-01T10:00:00")
+
+    assert data["quiz_count"] == 5 and data["quiz_correct_count"] == 4
+    # 1.0, 1.0, then 0.7, 0.79, 0.853
+    assert data["quiz_ewma_accuracy"] == pytest.approx(0.853)
+    assert data["quiz_streak"] == 2
+
+
+def test_aggregates_of_documents_from_before_them():
+    data = {"concept": "Heaps", "quiz_count": 4, "quiz_correct_count": 1,
+            "quiz_history": [{"timestamp": "t", "correct": False}, {"timestamp": "t", "correct": True}]}
+    concept_index.record_attempt(data, True, "t")
+
+    # EWMA starts from the overall accuracy and the streak from the history
+    assert data["quiz_ewma_accuracy"] == pytest.approx(0.3 + 0.7 * 0.25)
+    assert data["quiz_streak"] == 2
+
+
+def test_history_keeps_the_last_twenty_and_archives_the_rest(make_topic, capsys):
+    topic_dir = make_topic()
+    review_scheduler.add_review_item(topic_dir.name, "Heaps")
+    answers = [index % 4 != 2 for index in range(25)]
+    output = _answers(topic_dir, "Heaps", answers, capsys)
+
+    data = json.loads((topic_dir / "concepts" / "heaps.json").read_text())
+    assert len(data["quiz_history"]) == concept_index.QUIZ_HISTORY_SIZE
+    assert [attempt["correct"] for attempt in data["quiz_history"]] == answers[5:]
+    archived = list(concept_index.archived_attempts(topic_dir))
+    assert [attempt["correct"] for attempt in archived] == answers[:5]
+    assert {attempt["concept_slug"] for attempt in archived} == {"heaps"}
+
+    assert data["quiz_count"] == 25 and data["quiz_correct_count"] == sum(answers)
+    assert output["quiz_count"] == 25
+    assert output["streak"] == data["quiz_streak"] == 2
+    assert output["recent_accuracy"] == round(data["quiz_ewma_accuracy"] * 100, 1)
+
+
+@pytest.mark.parametrize("sqlite", [False, True], ids=["json", "sqlite"])
+def test_least_reviewed_targets(base_dir, make_topic, capsys, sqlite):
+    topic_dir = make_topic()
+    (base_dir / "config.json").write_text(json.dumps({"quiz_targets": "least_reviewed"}))
+    review_scheduler.add_review_items(topic_dir.name, ["Arrays", "Heaps", "Graphs", "Tries"])
+    review_scheduler.mark_reviewed(topic_dir.name, "Arrays")
+    if sqlite:
+        learning_db.migrate(str(base_dir))
+    _answers(topic_dir, "Heaps", [True], capsys)
+    _answers(topic_dir, "Graphs", [False], capsys)
+
+    targets = concept_quiz.get_quiz_targets(topic_dir.name, limit=3)
+    # Fewest reviews, then lowest accuracy with never-quizzed first
+    assert [target["concept"] for target in targets] == ["Tries", "Graphs", "Heaps"]
+    assert all(0 < target["predicted_recall"] <= 1 for target in targets)
+
+
+def test_unknown_quiz_targets_setting(base_dir, make_topic):
+    make_topic()
+    (base_dir / "config.json").write_text(json.dumps({"quiz_targets": "random"}))
+    with pytest.raises(ValueError, match="Unknown quiz targets"):
+        concept_quiz.get_quiz_targets("algo-topic")
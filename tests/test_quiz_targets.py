@@ -0,0 +1,106 @@
+"""Quiz target selection: syllabus phases and the SQLite schema upgrade."""
+
+import sqlite3
+
+import pytest
+
+import concept_quiz
+import learning_db
+import recall
+import review_scheduler
+import syllabus
+
+
+SYLLABUS = """# Syllabus
+
+### Phase 1: Foundations
+- [ ] Settings and configuration
+- [ ] C++ basics
+
+### Phase 2: Structures
+- [ ] Set theory
+- [ ] Set operations
+
+## Success Criteria
+- [ ] Explain a Set
+"""
+
+
+def _tree(text: str) -> dict:
+    return syllabus.parse(text.encode("utf-8"))
+
+
+def test_phases_match_whole_words():
+    phases = recall.syllabus_phases(_tree(SYLLABUS), ["Set", "Settings", "C++", "Graph"])
+    assert phases == {
+        "Settings": "Phase 1: Foundations",
+        "C++": "Phase 1: Foundations",
+        "Set": "Phase 2: Structures"
+    }
+
+
+def test_phases_find_names_overlapping_a_longer_match():
+    phases = recall.syllabus_phases(_tree(SYLLABUS), ["Set theory", "Set", "theory"])
+    assert phases == {name: "Phase 2: Structures" for name in ("Set theory", "Set", "theory")}
+
+
+def test_phases_without_syllabus():
+    assert recall.syllabus_phases(None, ["Set"]) == {}
+    assert recall.syllabus_phases(_tree(SYLLABUS), []) == {}
+
+
+def test_quiz_targets_use_the_parsed_syllabus(make_topic, capsys):
+    topic_dir = make_topic()
+    (topic_dir / "syllabus.md").write_text(SYLLABUS)
+    review_scheduler.add_review_items("algo-topic", ["Set", "Settings"])
+    capsys.readouterr()
+
+    targets = concept_quiz.get_quiz_targets("algo-topic")
+    assert {target["concept"]: target["phase"] for target in targets} == {
+        "Set": "Phase 2: Structures", "Settings": "Phase 1: Foundations"
+    }
+    assert (topic_dir / syllabus.INDEX_FILE).exists()
+
+
+def test_upgrade_restores_the_quiz_priority_index(base_dir):
+    # Version 4 databases had the index dropped
+    conn = sqlite3.connect(base_dir / learning_db.DB_FILE)
+    conn.executescript(learning_db.SCHEMA)
+    conn.execute("DROP INDEX concepts_quiz_priority")
+    conn.execute("PRAGMA user_version = 4")
+    conn.close()
+
+    conn = learning_db.connect(str(base_dir))
+    indexes = {row["name"] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert "concepts_quiz_priority" in indexes
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == learning_db.SCHEMA_VERSION
+    conn.close()
+
+
+def test_least_reviewed_query_is_served_by_the_index(base_dir):
+    conn = learning_db.connect(str(base_dir))
+    plan = " ".join(row["detail"] for row in conn.execute(
+        f"EXPLAIN QUERY PLAN SELECT {learning_db.CANDIDATE_COLUMNS} FROM concepts c WHERE topic = ? "
+        f"ORDER BY review_count, {learning_db.QUIZ_ACCURACY}, learned_date LIMIT 3", ("algo-topic",)
+    ))
+    conn.close()
+    assert "concepts_quiz_priority" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.parametrize("sqlite", [False, True], ids=["json", "sqlite"])
+def test_freshly_failed_concept_outranks_a_freshly_passed_one(base_dir, make_topic, capsys, sqlite):
+    make_topic()
+    review_scheduler.add_review_items("algo-topic", ["Heaps", "Tries"])
+    # The failed concept has the more stable memory, so only the answer can rank it first
+    for _ in range(3):
+        review_scheduler.mark_reviewed("algo-topic", "Heaps")
+    if sqlite:
+        learning_db.migrate(str(base_dir))
+    concept_quiz.record_quiz_attempt("algo-topic", "Heaps", False)
+    concept_quiz.record_quiz_attempt("algo-topic", "Tries", True)
+    capsys.readouterr()
+
+    targets = concept_quiz.get_quiz_targets("algo-topic", limit=2)
+    assert [target["concept"] for target in targets] == ["Heaps", "Tries"]
+    assert targets[0]["predicted_recall"] < 0.6 < targets[1]["predicted_recall"]
@@ -0,0 +1,96 @@
+"""The review schedule's concept index (review_schedule.json "concept_index")."""
+
+import json
+
+import pytest
+
+import concept_names
+import learning_db
+import review_scheduler
+from conftest import read_output
+
+
+def _schedule(topic_dir) -> dict:
+    return json.loads((topic_dir / "review_schedule.json").read_text())
+
+
+def _expected_index(schedule: dict) -> dict:
+    return {concept_names.concept_key(item["concept"]): pos for pos, item in enumerate(schedule["reviews"])}
+
+
+def test_new_items_land_in_a_rebuilt_index(make_topic, capsys):
+    topic_dir = make_topic()
+    review_scheduler.add_review_items("algo-topic", ["Alpha", "Beta"])
+
+    # Reorder by hand, leaving the stored index stale so the next lookup rebuilds it
+    schedule = _schedule(topic_dir)
+    schedule["reviews"].reverse()
+    (topic_dir / "review_schedule.json").write_text(json.dumps(schedule))
+
+    review_scheduler.add_review_items("algo-topic", ["Alpha", "Gamma", "Delta"])
+    capsys.readouterr()
+    schedule = _schedule(topic_dir)
+    assert [item["concept"] for item in schedule["reviews"]] == ["Beta", "Alpha", "Gamma", "Delta"]
+    assert schedule["concept_index"] == _expected_index(schedule)
+
+
+def test_find_review_item_normalizes_names(make_topic, capsys):
+    topic_dir = make_topic()
+    review_scheduler.add_review_items("algo-topic", ["Binary  Search", "Heap"])
+    capsys.readouterr()
+    schedule = _schedule(topic_dir)
+    assert schedule["concept_index"] == _expected_index(schedule)
+    assert review_scheduler.find_review_item(schedule, "binary search")["concept"] == "Binary  Search"
+    assert review_scheduler.find_review_item(schedule, "Trie") is None
+
+
+def test_find_review_item_without_stored_index(make_topic, capsys):
+    topic_dir = make_topic()
+    review_scheduler.add_review_items("algo-topic", ["Heap"])
+    capsys.readouterr()
+    schedule = _schedule(topic_dir)
+    del schedule["concept_index"]
+    assert review_scheduler.find_review_item(schedule, "HEAP")["concept"] == "Heap"
+    assert schedule["concept_index"] == {"heap": 0}
+
+
+@pytest.mark.parametrize("sqlite", [False, True], ids=["json", "sqlite"])
+def test_re_adding_a_tracked_concept_keeps_its_progress(base_dir, make_topic, capsys, sqlite):
+    make_topic()
+    (base_dir / "config.json").write_text(json.dumps({"review_algorithm": "sm2"}))
+    if sqlite:
+        learning_db.migrate(str(base_dir))
+    review_scheduler.add_review_items("algo-topic", ["Heap"])
+    review_scheduler.mark_reviewed("algo-topic", "Heap", grade=3)
+    review_scheduler.mark_reviewed("algo-topic", "Heap", grade=3)
+    capsys.readouterr()
+    before = review_scheduler._load_review_items("algo-topic", str(base_dir))
+    assert before[0]["review_count"] == 2 and before[0]["repetitions"] == 2
+
+    review_scheduler.add_review_item("algo-topic", "heap")
+    output = read_output(capsys)
+    assert output["already_tracked"] is True
+    review_scheduler.add_review_items_batch("algo-topic", ["Heap", "Trie"])
+    output = read_output(capsys)
+    assert output["added_count"] == 1 and output["already_tracked"] == ["Heap"]
+
+    after = review_scheduler._load_review_items("algo-topic", str(base_dir))
+    assert after[0] == before[0]
+    assert [item["concept"] for item in after] == ["Heap", "Trie"]
+
+
+def test_batch_add_reports_added_and_tracked_separately(make_topic, capsys):
+    make_topic()
+    review_scheduler.add_review_items_batch("algo-topic", ["Heap", "Trie"])
+    capsys.readouterr()
+
+    review_scheduler.add_review_items_batch("algo-topic", ["heap", "Trie", "Graph"])
+    output = read_output(capsys)
+    assert (output["added_count"], output["already_tracked_count"]) == (1, 2)
+    assert output["already_tracked"] == ["Heap", "Trie"]
+    assert output["suggested_response"].startswith("✅ Added 1 concept(s)")
+    assert "2 already tracked" in output["suggested_response"]
+
+    review_scheduler.add_review_items_batch("algo-topic", ["Graph"])
+    output = read_output(capsys)
+    assert (output["added_count"], output["next_review_date"]) == (0, None)
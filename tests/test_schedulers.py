@@ -0,0 +1,172 @@
+"""Review scheduling algorithms (schedulers.py) and `replan`."""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+import review_scheduler
+import schedulers
+
+
+START = datetime(2025, 1, 1, 9)
+
+
+def _new_item() -> dict:
+    return {"concept": "Heap", "learned_date": START.isoformat(), "review_count": 0,
+            "next_review": (START + timedelta(days=1)).isoformat(), "last_reviewed": None}
+
+
+def _review_on_time(scheduler, grades: list, item: dict = None) -> tuple:
+    """Review an item on each due date; returns the intervals and the item."""
+    item = item or _new_item()
+    now = datetime.fromisoformat(item["next_review"])
+    intervals = []
+    for grade in grades:
+        interval = scheduler.review(item, grade, now)
+        intervals.append(interval)
+        now += timedelta(days=interval)
+    return intervals, item
+
+
+@pytest.mark.parametrize("value, grade", [
+    (None, 3), ("again", 1), ("Hard", 2), (" good ", 3), ("easy", 4), ("1", 1), (4, 4)
+])
+def test_parse_grade(value, grade):
+    assert schedulers.parse_grade(value) == grade
+
+
+@pytest.mark.parametrize("value", ["0", "5", "great", ""])
+def test_parse_grade_rejects_unknown(value):
+    with pytest.raises(ValueError):
+        schedulers.parse_grade(value)
+
+
+def test_ladder_ignores_grades():
+    ladder = schedulers.LadderScheduler()
+    assert _review_on_time(ladder, [1, 4, 2, 3, 3, 3, 3, 3])[0] == [3, 7, 14, 30, 60, 90, 90, 90]
+    assert ladder.first_interval() == 1
+
+
+@pytest.mark.parametrize("grade, intervals, eases", [
+    (1, [1, 1, 1, 1, 1], [1.96, 1.42, 1.3, 1.3, 1.3]),
+    (2, [1, 6, 13, 27, 52], [2.36, 2.22, 2.08, 1.94, 1.8]),
+    (3, [1, 6, 15, 38, 95], [2.5, 2.5, 2.5, 2.5, 2.5]),
+    (4, [1, 6, 16, 45, 130], [2.6, 2.7, 2.8, 2.9, 3.0]),
+])
+def test_sm2_interval_sequences(grade, intervals, eases):
+    sm2 = schedulers.SM2Scheduler()
+    item = _new_item()
+    seen_intervals, seen_eases = [], []
+    now = START + timedelta(days=1)
+    for _ in intervals:
+        interval = sm2.review(item, grade, now)
+        seen_intervals.append(interval)
+        seen_eases.append(item["ease"])
+        now += timedelta(days=interval)
+    assert seen_intervals == intervals
+    assert seen_eases == pytest.approx(eases)
+
+
+def test_sm2_lapse_restarts_repetitions_and_keeps_ease_floor():
+    sm2 = schedulers.SM2Scheduler({"minimum_ease": 1.5})
+    intervals, item = _review_on_time(sm2, [3, 3, 3, 1, 3, 3])
+    assert intervals == [1, 6, 15, 1, 1, 6]
+    assert item["repetitions"] == 2
+    assert item["ease"] == pytest.approx(1.96)
+
+    _, item = _review_on_time(sm2, [1] * 6)
+    assert item["ease"] == 1.5
+
+
+def test_sm2_interval_modifier():
+    sm2 = schedulers.SM2Scheduler({"interval_modifier": 2.0})
+    assert _review_on_time(sm2, [3, 3, 3])[0] == [2, 12, 30]
+
+
+@pytest.mark.parametrize("grade, intervals, stability, difficulty", [
+    (1, [1, 1, 1], 0.2436, 10.0),
+    (2, [1, 2, 3], 2.5883, 8.029),
+    (3, [4, 15, 49], 49.4616, 5.1618),
+    (4, [14, 141, 1169], 1168.5911, 2.2946),
+])
+def test_fsrs_interval_sequences(grade, intervals, stability, difficulty):
+    seen, item = _review_on_time(schedulers.FSRSScheduler(), [grade] * 3)
+    assert seen == intervals
+    assert (item["stability"], item["difficulty"]) == (stability, difficulty)
+
+
+def test_fsrs_first_review_uses_the_grade_weights():
+    fsrs = schedulers.FSRSScheduler()
+    weights = fsrs.params["weights"]
+    for grade in (1, 2, 3, 4):
+        _, item = _review_on_time(fsrs, [grade])
+        assert item["stability"] == round(weights[grade - 1], 4)
+        assert item["difficulty"] == round(weights[4] - (grade - 3) * weights[5], 4)
+
+
+def test_fsrs_lapse_lowers_stability_and_raises_difficulty():
+    intervals, item = _review_on_time(schedulers.FSRSScheduler(), [3, 3, 1, 3])
+    assert intervals == [4, 15, 3, 9]
+    assert (item["stability"], item["difficulty"]) == (9.2117, 6.8473)
+
+
+def test_fsrs_caps_intervals_and_recall_at_stability():
+    fsrs = schedulers.FSRSScheduler({"maximum_interval": 100})
+    assert _review_on_time(fsrs, [4, 4, 4])[0] == [14, 100, 100]
+    # Stability is the interval at which recall drops to 90%
+    assert fsrs.retrievability(10, 10) == pytest.approx(0.9)
+
+
+def test_fsrs_takes_over_items_of_another_algorithm():
+    _, item = _review_on_time(schedulers.LadderScheduler(), [3, 3])
+    assert "stability" not in item
+    fsrs = schedulers.FSRSScheduler()
+    interval = fsrs.review(item, 3, datetime.fromisoformat(item["next_review"]))
+    # The 7-day ladder interval is taken as the starting stability
+    assert item["stability"] > 7 and interval == round(item["stability"])
+
+
+def test_plan_recomputes_reviewed_items_only():
+    sm2 = schedulers.SM2Scheduler()
+    _, reviewed = _review_on_time(sm2, [3, 3, 3])
+    never_reviewed = _new_item()
+    _, other_algorithm = _review_on_time(schedulers.LadderScheduler(), [3])
+    items = [reviewed, never_reviewed, other_algorithm]
+    before = [item["next_review"] for item in items]
+
+    assert sm2.plan(items) == 0
+    faster = schedulers.SM2Scheduler({"interval_modifier": 0.5})
+    assert faster.plan(items) == 1
+    anchor = datetime.fromisoformat(reviewed["last_reviewed"])
+    assert reviewed["next_review"] == (anchor + timedelta(days=8)).isoformat()
+    assert [item["next_review"] for item in items[1:]] == before[1:]
+
+
+def test_get_scheduler():
+    assert isinstance(schedulers.get_scheduler(), schedulers.LadderScheduler)
+    scheduler = schedulers.get_scheduler({"review_algorithm": "fsrs", "scheduler_params": {"desired_retention": 0.8}})
+    assert isinstance(scheduler, schedulers.FSRSScheduler)
+    assert scheduler.params["desired_retention"] == 0.8
+    with pytest.raises(ValueError):
+        schedulers.get_scheduler({"review_algorithm": "leitner"})
+
+
+def test_replan_after_a_parameter_change(base_dir, make_topic, capsys):
+    topic_dir = make_topic()
+    config_path = base_dir / "config.json"
+    config_path.write_text(json.dumps({"review_algorithm": "sm2"}))
+    review_scheduler.add_review_items("algo-topic", ["Heap", "Trie"])
+    review_scheduler.mark_reviewed("algo-topic", "Heap")
+    review_scheduler.mark_reviewed("algo-topic", "Heap")
+    capsys.readouterr()
+
+    config_path.write_text(json.dumps({"review_algorithm": "sm2", "scheduler_params": {"interval_modifier": 2.0}}))
+    assert review_scheduler.replan("algo-topic", str(base_dir)) == {"items": 2, "changed": 1}
+    heap = review_scheduler._load_review_items("algo-topic", str(base_dir))[0]
+    anchor = datetime.fromisoformat(heap["last_reviewed"])
+    assert heap["next_review"] == (anchor + timedelta(days=12)).isoformat()
+    assert review_scheduler.replan(None, str(base_dir)) == {"items": 2, "changed": 0}
+    # The due index follows the new dates
+    entries = [json.loads(line) for line in (topic_dir / review_scheduler.DUE_INDEX_FILE).read_text().splitlines()]
+    assert [entry[1] for entry in entries] == ["Trie", "Heap"]
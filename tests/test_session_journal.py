@@ -0,0 +1,93 @@
+"""The append-only session journal: backfill, rotation into segments and replay."""
+
+import gzip
+import json
+
+import log_progress
+import session_journal
+
+
+PROGRESS = """# Learning Progress
+
+### Session 1 - 2024-03-01 10:00
+
+Arrays and loops
+
+**Concepts learned:**
+- Arrays
+- Loops
+
+### Session 2 - 2024-03-02 10:00
+
+Recursion
+"""
+
+
+def _sessions(topic_dir) -> list:
+    return [record["session"] for record in session_journal.replay(topic_dir)]
+
+
+def test_backfill_skips_sessions_already_journaled(make_topic):
+    topic_dir = make_topic()
+    (topic_dir / "progress.md").write_text(PROGRESS)
+    session_journal._write(topic_dir / session_journal.JOURNAL_FILE,
+                           session_journal.make_record(2, "Recursion"))
+
+    assert session_journal.backfill(topic_dir) == 1
+    assert sorted(_sessions(topic_dir)) == [1, 2]
+    first = next(record for record in session_journal.replay(topic_dir) if record["session"] == 1)
+    assert first["concepts"] == ["Arrays", "Loops"]
+    assert first["ts"] == "2024-03-01T10:00:00"
+
+    assert session_journal.backfill(topic_dir) == 0
+    assert sorted(_sessions(topic_dir)) == [1, 2]
+
+
+def test_first_append_imports_earlier_sessions(make_topic, capsys):
+    topic_dir = make_topic()
+    (topic_dir / "progress.md").write_text(PROGRESS)
+    metadata_path = topic_dir / "metadata.json"
+    metadata = json.loads(metadata_path.read_text())
+    metadata_path.write_text(json.dumps(dict(metadata, total_sessions=2)))
+
+    log_progress.log_progress(topic_dir.name, "Dynamic programming", ["Memoization"], base_dir=str(topic_dir.parent))
+    log_progress.log_progress(topic_dir.name, "Graphs", base_dir=str(topic_dir.parent))
+
+    assert _sessions(topic_dir) == [1, 2, 3, 4]
+    stats = session_journal.journal_stats(topic_dir)
+    assert stats["sessions"] == 4
+    assert stats["first_session"] == "2024-03-01T10:00:00"
+
+
+def test_journal_rolls_into_segments_and_replays_in_order(make_topic, monkeypatch):
+    topic_dir = make_topic()
+    monkeypatch.setattr(session_journal, "JOURNAL_ROLL_BYTES", 400)
+    for session in range(1, 13):
+        session_journal.append(topic_dir, session_journal.make_record(session, f"Session {session}", ["Concept"]))
+
+    segments = session_journal.segments(topic_dir)
+    assert len(segments) > 2
+    assert [path.name for path in segments] == [f"sessions-{n:06d}.ndjson.gz" for n in range(1, len(segments) + 1)]
+    compacted = []
+    for path in segments:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            compacted += [json.loads(line)["session"] for line in f]
+    assert compacted == list(range(1, len(compacted) + 1))
+    assert _sessions(topic_dir) == list(range(1, 13))
+
+
+def test_replay_skips_torn_lines_and_filters_by_time(make_topic):
+    topic_dir = make_topic()
+    journal_path = topic_dir / session_journal.JOURNAL_FILE
+    for session, day in ((1, "2024-03-01"), (2, "2024-03-05")):
+        session_journal.append(topic_dir, session_journal.make_record(
+            session, "text", timestamp=session_journal.datetime.fromisoformat(f"{day}T09:00")))
+    with open(journal_path, "a", encoding="utf-8") as f:
+        f.write('{"v": 1, "session": 3, "ts"')
+
+    assert _sessions(topic_dir) == [1, 2]
+    assert [record["session"] for record in session_journal.replay(topic_dir, "2024-03-02")] == [2]
+
+    assert session_journal.compact(topic_dir) == {"segment": "sessions-000001.ndjson.gz", "records": 2}
+    assert not journal_path.exists()
+    assert _sessions(topic_dir) == [1, 2]
@@ -0,0 +1,73 @@
+"""Atomic writes, advisory locking and the daemon's write cache."""
+
+import json
+import multiprocessing
+
+import pytest
+
+import storage
+
+
+def _increment(path: str, times: int) -> None:
+    for _ in range(times):
+        with storage.locked(path.rsplit("/", 1)[0]):
+            data = storage.load_json(path)
+            data["count"] += 1
+            storage.save_json(path, data)
+
+
+def test_save_json_replaces_atomically(tmp_path):
+    path = tmp_path / "state.json"
+    storage.save_json(path, {"a": 1})
+    storage.save_json(path, {"a": 2})
+    assert json.loads(path.read_text()) == {"a": 2}
+    assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
+
+
+def test_ndjson_round_trip(tmp_path):
+    path = tmp_path / "rows.ndjson"
+    storage.save_ndjson(path, [[1, "a"], [2, "b"]])
+    assert storage.load_ndjson(path) == [[1, "a"], [2, "b"]]
+    assert storage.load_ndjson(tmp_path / "missing.ndjson", []) == []
+
+
+@pytest.mark.skipif(storage.fcntl is None, reason="no advisory locks on this platform")
+def test_lock_serializes_read_modify_write_across_processes(tmp_path):
+    path = tmp_path / "counter.json"
+    storage.save_json(path, {"count": 0})
+    ctx = multiprocessing.get_context("fork")
+    workers = [ctx.Process(target=_increment, args=(str(path), 50)) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert json.loads(path.read_text())["count"] == 200
+
+
+def test_lock_is_reentrant(tmp_path):
+    with storage.locked(tmp_path):
+        with storage.locked(tmp_path):
+            storage.save_json(tmp_path / "a.json", {})
+    assert (tmp_path / "a.json").exists()
+
+
+def test_cached_writes_reach_disk_before_the_lock_is_released(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "_cache", {})
+    path = tmp_path / "state.json"
+    with storage.locked(tmp_path):
+        storage.save_json(path, {"n": 1})
+        storage.save_json(path, {"n": 2})
+        # Deferred while the lock is held, and read back from the cache
+        assert not path.exists()
+        assert storage.load_json(path) == {"n": 2}
+    assert json.loads(path.read_text()) == {"n": 2}
+    assert storage._pending == {}
+
+
+def test_failed_block_does_not_flush(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "_cache", {})
+    with pytest.raises(RuntimeError):
+        with storage.locked(tmp_path):
+            storage.save_json(tmp_path / "state.json", {"n": 1})
+            raise RuntimeError
+    assert not (tmp_path / "state.json").exists()
@@ -0,0 +1,195 @@
+"""The parsed syllabus tree, its index cache and in-place completion."""
+
+import os
+import sys
+import json
+import subprocess
+
+import pytest
+
+import syllabus
+from conftest import SCRIPTS_DIR
+
+
+SYLLABUS = """# Graphs
+
+## Learning Path
+
+### Phase 1: Foundations
+- [x] Vertices and edges
+- [ ] Adjacency lists
+  - [ ] Sparse graphs
+    * [X] Memory layout
+- [ ] 🔨 Project: Build a graph class
+
+```markdown
+- [ ] Not an item
+### Phase 9: Not a phase
+```
+
+### Phase 2: Traversal ###
++ [ ] Breadth-first search
+- [ ] **Project**: Maze solver
+
+## Success Criteria
+- [ ] Explain BFS
+- [x] Implement DFS
+
+## Notes
+- [ ] Read chapter 3
+"""
+
+
+def _write(topic_dir, text=SYLLABUS):
+    path = topic_dir / syllabus.SYLLABUS_FILE
+    path.write_bytes(text.encode("utf-8"))
+    return path
+
+
+def _bump_mtime(path):
+    # Make sure the change shows up even on file systems with coarse timestamps
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+
+@pytest.fixture
+def topic_dir(tmp_path):
+    directory = tmp_path / "graphs"
+    directory.mkdir()
+    _write(directory)
+    return directory
+
+
+def test_parse_phases_and_checklists():
+    tree = syllabus.parse(SYLLABUS.encode("utf-8"))
+    assert [(phase["title"], phase["done"], phase["total"]) for phase in tree["phases"]] == [
+        ("Phase 1: Foundations", 2, 5), ("Phase 2: Traversal", 0, 2)]
+    assert (tree["done"], tree["total"]) == (2, 7)
+
+    items = tree["phases"][0]["items"]
+    assert [item["id"] for item in items] == ["1.1", "1.2", "1.3", "1.4", "1.5"]
+    assert [item["text"] for item in items[2:4]] == ["Sparse graphs", "Memory layout"]
+    assert [item["done"] for item in items] == [True, False, False, True, False]
+    assert [item["kind"] for item in items] == ["concept"] * 4 + ["project"]
+    assert [(item["text"], item["kind"]) for item in tree["phases"][1]["items"]] == [
+        ("Breadth-first search", "concept"), ("**Project**: Maze solver", "project")]
+
+    assert [(group["title"], group["done"], group["total"]) for group in tree["checklists"]] == [
+        ("Success Criteria", 1, 2), ("Notes", 0, 1)]
+    assert [item["id"] for item in tree["checklists"][0]["items"]] == ["c1.1", "c1.2"]
+
+
+def test_parse_records_checkbox_offsets():
+    data = SYLLABUS.encode("utf-8")
+    tree = syllabus.parse(data)
+    lines = data.splitlines()
+    for group in tree["phases"] + tree["checklists"]:
+        for item in group["items"]:
+            assert data[item["offset"]:item["offset"] + 1] in (b" ", b"x", b"X")
+            assert data[item["offset"] - 1:item["offset"] + 2].lower() in (b"[ ]", b"[x]")
+            assert item["text"].encode("utf-8") in lines[item["line"] - 1]
+
+
+def test_index_is_reused_until_the_syllabus_changes(topic_dir, monkeypatch):
+    index = syllabus.load_tree(topic_dir)
+    saved = json.loads((topic_dir / syllabus.INDEX_FILE).read_text())
+    assert saved["v"] == syllabus.INDEX_VERSION and saved["total"] == index["total"] == 7
+
+    parse = syllabus.parse
+    parsed = []
+    monkeypatch.setattr(syllabus, "parse", lambda data: parsed.append(data) or parse(data))
+
+    assert syllabus.load_tree(topic_dir)["total"] == 7
+    # Touched but unchanged: the hash matches, so the tree is kept and the new stat recorded
+    path = topic_dir / syllabus.SYLLABUS_FILE
+    _bump_mtime(path)
+    assert syllabus.load_tree(topic_dir)["total"] == 7
+    assert json.loads((topic_dir / syllabus.INDEX_FILE).read_text())["mtime_ns"] == path.stat().st_mtime_ns
+    assert parsed == []
+
+    _write(topic_dir, SYLLABUS.replace("+ [ ] Breadth-first search", "+ [ ] Breadth-first search\n- [ ] Dijkstra"))
+    _bump_mtime(path)
+    assert syllabus.load_tree(topic_dir)["total"] == 8
+    assert len(parsed) == 1
+
+
+def test_no_syllabus(tmp_path):
+    assert syllabus.load_tree(tmp_path) is None
+    assert syllabus.set_done(tmp_path, "1.1") == {"status": "no_syllabus"}
+
+
+def test_complete_and_undo_edit_only_the_checkbox(topic_dir, monkeypatch):
+    path = topic_dir / syllabus.SYLLABUS_FILE
+    syllabus.load_tree(topic_dir)
+    monkeypatch.setattr(syllabus, "parse", lambda data: pytest.fail("syllabus parsed again"))
+
+    result = syllabus.set_done(topic_dir, "Sparse graphs")
+    assert result["status"] == "success" and result["item"]["id"] == "1.3"
+    assert result["phase"] == "Phase 1: Foundations"
+    assert path.read_text() == SYLLABUS.replace("  - [ ] Sparse graphs", "  - [x] Sparse graphs")
+    index = syllabus.load_tree(topic_dir)
+    assert (index["done"], index["phases"][0]["done"]) == (3, 3)
+
+    assert syllabus.set_done(topic_dir, "1.3")["status"] == "unchanged"
+    assert syllabus.set_done(topic_dir, "memory layout", done=False)["status"] == "success"
+    assert syllabus.set_done(topic_dir, "1.3", done=False)["status"] == "success"
+    assert path.read_text() == SYLLABUS.replace("    * [X] Memory layout", "    * [ ] Memory layout")
+    assert syllabus.load_tree(topic_dir)["done"] == 1
+
+
+def test_checklist_items_are_not_learning_path_progress(topic_dir):
+    result = syllabus.set_done(topic_dir, "c1.1")
+    assert result["status"] == "success" and result["phase"] == "Success Criteria"
+    assert "- [x] Explain BFS" in (topic_dir / syllabus.SYLLABUS_FILE).read_text()
+
+    index = syllabus.load_tree(topic_dir)
+    assert index["done"] == 2 and index["checklists"][0]["done"] == 2
+    report = syllabus.progress(index)
+    assert report["checklists"][0] == {"title": "Success Criteria", "done": 2, "total": 2}
+    assert (report["done"], report["total"], report["percent"]) == (2, 7, 28.6)
+
+
+def test_item_lookup(topic_dir):
+    assert syllabus.set_done(topic_dir, "Dijkstra") == {"status": "not_found", "candidates": []}
+    ambiguous = syllabus.set_done(topic_dir, "project")
+    assert ambiguous["status"] == "ambiguous"
+    assert ambiguous["candidates"] == ["🔨 Project: Build a graph class", "**Project**: Maze solver"]
+    assert syllabus.set_done(topic_dir, "maze")["item"]["id"] == "2.2"
+
+
+def test_edit_under_a_stale_index_parses_again(topic_dir):
+    syllabus.load_tree(topic_dir)
+    path = topic_dir / syllabus.SYLLABUS_FILE
+    stat = path.stat()
+    # Same size and mtime as the indexed file, but every offset has moved
+    edited = SYLLABUS.replace("# Graphs\n\n", "").replace("## Notes\n", "## Notes\n" + "\n" * len("# Graphs\n\n"))
+    _write(topic_dir, edited)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert syllabus.set_done(topic_dir, "Adjacency lists")["status"] == "success"
+    assert path.read_text() == edited.replace("- [ ] Adjacency lists", "- [x] Adjacency lists")
+
+
+def test_cli_complete_and_undo(topic_dir):
+    base_dir = topic_dir.parent / ".learning"
+    base_dir.mkdir()
+    topic_dir = topic_dir.rename(base_dir / "graphs")
+
+    def run(*args):
+        result = subprocess.run([sys.executable, str(SCRIPTS_DIR / "syllabus.py"), *args], cwd=base_dir.parent,
+                                capture_output=True, text=True, env={**os.environ, "LEARN_FASTER_OUTPUT": "compact"})
+        return result.returncode, json.loads(result.stdout.splitlines()[-1])
+
+    code, output = run("complete", "graphs", "Adjacency", "lists")
+    assert code == 0 and output["status"] == "success"
+    assert output["item"] == {"id": "1.2", "text": "Adjacency lists", "kind": "concept", "done": True,
+                              "phase": "Phase 1: Foundations"}
+    assert output["progress"] == {"done": 3, "total": 7}
+    assert output["next"][0]["text"] == "Sparse graphs"
+
+    code, output = run("complete", "graphs", "1.2", "--undo")
+    assert code == 0 and output["progress"] == {"done": 2, "total": 7}
+    assert (topic_dir / syllabus.SYLLABUS_FILE).read_text() == SYLLABUS
+
+    code, output = run("complete", "graphs", "project")
+    assert code == 1 and output["status"] == "error" and len(output["candidates"]) == 2
@@ -0,0 +1,123 @@
+"""Manifest-based template installation (learn-faster init)."""
+
+import os
+import json
+
+import pytest
+
+from learn_faster.cli import template_sync
+
+
+@pytest.fixture
+def templates_dir(tmp_path):
+    """A small template tree with two learning modes."""
+    root = tmp_path / "templates"
+    for mode in ("alpha", "beta"):
+        (root / "modes" / mode / "agents").mkdir(parents=True)
+        (root / "modes" / mode / "agents" / f"{mode}-coach.md").write_text(f"# {mode} coach\n")
+        (root / "modes" / mode / "commands").mkdir()
+        (root / "modes" / mode / "commands" / "review.md").write_text(f"# {mode} review\n")
+    (root / "scripts").mkdir()
+    (root / "scripts" / "storage.py").write_text("VERSION = 1\n")
+    (root / "instructions.md").write_text("# Instructions\n")
+    return root
+
+
+@pytest.fixture
+def project_dir(tmp_path):
+    project = tmp_path / "project"
+    project.mkdir()
+    return project
+
+
+def _sync(templates_dir, project_dir, mode="alpha", **kwargs) -> dict:
+    report = template_sync.sync_templates(templates_dir, project_dir, mode, version="1.0", **kwargs)
+    return {outcome: sorted(paths) for outcome, paths in report.items() if paths}
+
+
+def _temp_files(project_dir) -> list:
+    return list(project_dir.rglob("*.tmp"))
+
+
+def test_first_sync_adds_every_file(templates_dir, project_dir):
+    report = _sync(templates_dir, project_dir)
+    assert report == {"added": [".claude/agents/alpha-coach.md", ".claude/commands/review.md",
+                                ".learning/scripts/storage.py", "CLAUDE.md"]}
+    manifest = template_sync.load_manifest(project_dir)
+    assert manifest["mode"] == "alpha" and manifest["version"] == "1.0"
+    assert manifest["files"]["CLAUDE.md"]["source"] == "instructions.md"
+    assert (project_dir / ".learning" / "scripts" / "storage.py").read_text() == "VERSION = 1\n"
+    assert _temp_files(project_dir) == []
+
+    assert _sync(templates_dir, project_dir) == {"unchanged": report["added"]}
+
+
+def test_changed_templates_update_unedited_files_and_keep_edited_ones(templates_dir, project_dir):
+    _sync(templates_dir, project_dir)
+    (templates_dir / "scripts" / "storage.py").write_text("VERSION = 2\n")
+    (templates_dir / "modes" / "alpha" / "commands" / "review.md").write_text("# alpha review v2\n")
+    edited = project_dir / ".claude" / "commands" / "review.md"
+    edited.write_text("# my own review command\n")
+
+    report = _sync(templates_dir, project_dir)
+    assert report["updated"] == [".learning/scripts/storage.py"]
+    assert report["kept"] == [".claude/commands/review.md"]
+    assert (project_dir / ".learning" / "scripts" / "storage.py").read_text() == "VERSION = 2\n"
+    assert edited.read_text() == "# my own review command\n"
+
+    # Still recognised as edited on the next run; force overwrites it
+    assert _sync(templates_dir, project_dir)["kept"] == [".claude/commands/review.md"]
+    assert _sync(templates_dir, project_dir, force=True)["updated"] == [".claude/commands/review.md"]
+    assert edited.read_text() == "# alpha review v2\n"
+
+
+def test_mode_switch_removes_unedited_files_of_the_old_mode(templates_dir, project_dir):
+    _sync(templates_dir, project_dir)
+    (project_dir / ".claude" / "commands" / "review.md").write_text("# edited\n")
+
+    report = _sync(templates_dir, project_dir, mode="beta")
+    assert report["added"] == [".claude/agents/beta-coach.md"]
+    assert report["removed"] == [".claude/agents/alpha-coach.md"]
+    assert report["kept"] == [".claude/commands/review.md"]
+    assert not (project_dir / ".claude" / "agents" / "alpha-coach.md").exists()
+    assert template_sync.load_manifest(project_dir)["mode"] == "beta"
+
+
+def test_untracked_files_are_replaced_with_a_backup_except_claude_md(templates_dir, project_dir):
+    (project_dir / ".learning" / "scripts").mkdir(parents=True)
+    (project_dir / ".learning" / "scripts" / "storage.py").write_text("OLD = True\n")
+    (project_dir / "CLAUDE.md").write_text("# My project notes\n")
+
+    report = _sync(templates_dir, project_dir)
+    assert report["replaced"] == [".learning/scripts/storage.py"]
+    assert report["kept"] == ["CLAUDE.md"]
+    assert (project_dir / ".learning" / "scripts" / "storage.py.bak").read_text() == "OLD = True\n"
+    assert (project_dir / "CLAUDE.md").read_text() == "# My project notes\n"
+
+
+@pytest.mark.parametrize("method", ["symlink", "hardlink"])
+def test_linked_installs(templates_dir, project_dir, method):
+    _sync(templates_dir, project_dir, method=method)
+    dest = project_dir / ".learning" / "scripts" / "storage.py"
+    src = templates_dir / "scripts" / "storage.py"
+    if method == "symlink":
+        assert dest.is_symlink() and dest.resolve() == src.resolve()
+    else:
+        assert os.path.samefile(dest, src)
+    assert _temp_files(project_dir) == []
+    assert json.loads((project_dir / ".learning" / template_sync.MANIFEST_FILE).read_text())[
+        "files"][".learning/scripts/storage.py"]["method"] == method
+
+    # Switching back to copies gives the project its own files
+    assert ".learning/scripts/storage.py" in _sync(templates_dir, project_dir)["updated"]
+    assert not dest.is_symlink() and not os.path.samefile(dest, src)
+
+
+def test_failed_write_leaves_no_temporary_file(templates_dir, project_dir, monkeypatch):
+    def fail(src, dst):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(template_sync.os, "replace", fail)
+    with pytest.raises(OSError):
+        _sync(templates_dir, project_dir)
+    assert _temp_files(project_dir) == []